@@ -1,29 +1,34 @@
 """The surepetcare integration."""
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
 import logging
 from random import choice
-from typing import Any
+from typing import Any, Mapping
 from datetime import datetime
 from importlib.metadata import version
 from logging import Logger
-from math import ceil
-from typing import Any
+from functools import partial
+from time import monotonic
+from types import MappingProxyType
 from uuid import uuid1
 import aiohttp
 
 import async_timeout
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_TOKEN, CONF_USERNAME
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_TOKEN,
+    CONF_USERNAME,
+    EVENT_HOMEASSISTANT_STOP,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.storage import STORAGE_DIR
 
-from .entities import SurepyEntity
+from .entities import ChangeSet, SurepyEntity
 from .enums import EntityType, Location, LockState
 from .exeptions import SurePetcareAuthenticationError, SurePetcareError
 
@@ -32,20 +37,32 @@ import voluptuous as vol
 
 from rich.console import Console
 
-from .client import SureAPIClient, find_token, token_seems_valid
+from .cache import ValidatorCache
+from .auth import TokenStore
+from .client import SureAPIClient
 from .const import (
     API_TIMEOUT,
     ATTRIBUTES_RESOURCE as ATTR_RESOURCE,
     BASE_RESOURCE,
-    HOUSEHOLD_TIMELINE_RESOURCE,
+    HOUSEHOLD_CONCURRENCY,
+    HOUSEHOLD_TIMEOUT,
     MESTART_RESOURCE,
     NOTIFICATION_RESOURCE,
+    RATE_LIMIT,
+    RATE_LIMIT_BURST,
+    REFRESH_TIMEOUT,
+    REQUEST_CONCURRENCY,
+    TIMELINE_PAGE_SIZE,
+    TIMELINE_PAGE_WINDOW,
     TIMELINE_RESOURCE,
 )
 
 from .entities.devices import Feeder, Felaqua, Flap, Hub, SurepyDevice
 from .entities.pet import Pet
 from .enums import EntityType
+from .fanout import HouseholdFanOut
+from .scheduler import PRIORITY_REPORTS, PRIORITY_TIMELINE
+from .timeline import TimelineFollower, fetch_timeline
 
 
 
@@ -64,12 +81,18 @@ from .const import (
     SERVICE_SET_LOCK_STATE,
     SPC,
     SURE_API_TIMEOUT,
+    TIER_REPORTS,
+    TIER_STATE,
+    TIER_TIMELINE,
 )
+from .coordinator import SureTierCoordinator, async_create_coordinators
+from .snapshot import SureSnapshotStore
+from .token_store import SureTokenStore
 
 _LOGGER = logging.getLogger(__name__)
+logger: Logger = _LOGGER
 
 PLATFORMS = ["binary_sensor", "device_tracker", "sensor"]
-SCAN_INTERVAL = timedelta(minutes=3)
 
 __version__ = version(__name__)
 
@@ -90,6 +113,9 @@ CONFIG_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
+# tiers sharing the entities, restored from & saved to the warm-start snapshot
+SNAPSHOT_TIERS = (TIER_STATE, TIER_REPORTS, TIER_TIMELINE)
+
 CATS = [
     "/ᐠ｡▿｡ᐟ\\*ᵖᵘʳʳ",
     "/ᐠ_ꞈ_ᐟ\\ɴʏᴀ~",
@@ -112,6 +138,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             auth_token=entry.data[CONF_TOKEN] if CONF_TOKEN in entry.data else None,
             api_timeout=SURE_API_TIMEOUT,
             session=async_get_clientsession(hass),
+            # conditional requests right after a restart, read before the first request
+            validator_cache=ValidatorCache(
+                hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry.entry_id}.validators")
+            ),
+            # refreshed tokens are written back, a restart does not need to log in again
+            token_store=SureTokenStore(hass, entry),
         )
     except SurePetcareAuthenticationError:
         _LOGGER.error(
@@ -125,34 +157,43 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
         return False
 
+    async def async_close(_: Any) -> None:
+        """Flush the validator cache on shutdown."""
+        await surepy.close()
+
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_close))
+
     spc = SurePetcareAPI(hass, entry, surepy)
 
-    async def async_update_data():
+    setup_started = monotonic()
 
-        try:
-            # asyncio.TimeoutError and aiohttp.ClientError already handled
+    if refreshed_at := await spc.snapshot.async_restore():
+        # warm start: set up the platforms from the last snapshot and refresh in the background
+        for tier in SNAPSHOT_TIERS:
+            spc.coordinators[tier].async_warm_start(surepy.entities, refreshed_at)
+    else:
+        # pets & devices are needed to set up the platforms, the feeder bowls and
+        # water levels come with the reports & timelines
+        await spc.coordinator.async_config_entry_first_refresh()
+        await asyncio.gather(
+            spc.coordinators[TIER_REPORTS].async_refresh(),
+            spc.coordinators[TIER_TIMELINE].async_refresh(),
+        )
 
-            async with async_timeout.timeout(20):
-                return await client.get_entities(refresh=True)
+    hass.data[DOMAIN][SPC] = spc
 
-        except SurePetcareAuthenticationError as err:
-            raise ConfigEntryAuthFailed from err
-        except SurePetcareError as err:
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
+    result = await spc.async_setup()
 
-    spc.coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name="sureha_sensors",
-        update_method=async_update_data,
-        update_interval=timedelta(seconds=150),
+    _LOGGER.info(
+        "🐾 \x1b[38;2;0;255;0m·\x1b[0m %s start, set up in %.2fs",
+        f"warm (data of {refreshed_at.isoformat()})" if refreshed_at else "cold",
+        monotonic() - setup_started,
     )
 
-    await spc.coordinator.async_config_entry_first_refresh()
+    if refreshed_at:
+        hass.async_create_task(spc.async_refresh())
 
-    hass.data[DOMAIN][SPC] = spc
-
-    return await spc.async_setup()
+    return result
 
 
 class SurePetcareAPI:
@@ -163,23 +204,30 @@ class SurePetcareAPI:
     ) -> None:
         """Initialize the Sure Petcare object."""
 
-        self.coordinator: DataUpdateCoordinator
-
         self.hass = hass
         self.config_entry = config_entry
         self.surepy = surepy
 
+        # one coordinator per polling tier, entities subscribe to the tier they render
+        self.coordinators: dict[str, SureTierCoordinator] = async_create_coordinators(
+            hass, surepy, config_entry.options
+        )
+        self.coordinator: SureTierCoordinator = self.coordinators[TIER_STATE]
+
+        # entities & cached api responses persisted for a warm start
+        self.snapshot = SureSnapshotStore(hass, config_entry.entry_id, surepy)
+
         self.states: dict[int, Any] = {}
 
     async def set_pet_location(self, pet_id: int, location: Location) -> None:
         """Update the lock state of a flap."""
 
-        await self.client.sac.set_pet_location(pet_id, location)
+        await self.surepy.sac.set_pet_location(pet_id, location)
 
     async def add_to_feeder(self, device_id: int, tag_id: int) -> None:
         """Add pet to feeder."""
 
-        await self.client.sac._add_tag_to_device(device_id, tag_id)
+        await self.surepy.sac._add_tag_to_device(device_id, tag_id)
     
     async def trial_add_tag_to_device(self, device_id: int, tag_id: int) -> None:
         """TRIAL Add the specified tag ID to the specified device ID"""
@@ -187,12 +235,12 @@ class SurePetcareAPI:
         
         resource = "https://app.api.surehub.io/api/device/" + str(device_id) + "/tag/"  + str(tag_id)
         data = {}
-        await self.client.sac.call(method="PUT", resource=resource, data=data)
+        await self.surepy.sac.call(method="PUT", resource=resource, data=data)
         
     async def remove_from_feeder(self, device_id: int, tag_id: int) -> None:
         """Remove pet from to feeder."""
         
-        await self.client.sac._remove_tag_from_device(device_id, tag_id)
+        await self.surepy.sac._remove_tag_from_device(device_id, tag_id)
 
     async def set_lock_state(self, flap_id: int, state: str) -> None:
         """Update the lock state of a flap."""
@@ -200,15 +248,31 @@ class SurePetcareAPI:
         # https://github.com/PyCQA/pylint/issues/2062
         # pylint: disable=no-member
         lock_states = {
-            LockState.UNLOCKED.name.lower(): self.client.sac.unlock,
-            LockState.LOCKED_IN.name.lower(): self.client.sac.lock_in,
-            LockState.LOCKED_OUT.name.lower(): self.client.sac.lock_out,
-            LockState.LOCKED_ALL.name.lower(): self.client.sac.lock,
+            LockState.UNLOCKED.name.lower(): self.surepy.sac.unlock,
+            LockState.LOCKED_IN.name.lower(): self.surepy.sac.lock_in,
+            LockState.LOCKED_OUT.name.lower(): self.surepy.sac.lock_out,
+            LockState.LOCKED_ALL.name.lower(): self.surepy.sac.lock,
         }
 
         # elegant functions dict to choose the right function | idea by @janiversen
         await lock_states[state.lower()](flap_id)
 
+    async def async_refresh(self) -> None:
+        """Refresh the pets & devices, then their reports & water levels."""
+
+        await self.coordinator.async_refresh()
+        await asyncio.gather(
+            self.coordinators[TIER_REPORTS].async_refresh(),
+            self.coordinators[TIER_TIMELINE].async_refresh(),
+        )
+
+    @callback
+    def _async_save_snapshot(self, coordinator: SureTierCoordinator) -> None:
+        """Schedule saving the snapshot if a (fresh) refresh changed the entities."""
+
+        if coordinator.changes and coordinator.stale_since is None:
+            self.snapshot.async_schedule_save(coordinator.last_success_at)
+
     async def async_setup(self) -> bool:
         """Set up the Sure Petcare integration."""
 
@@ -239,6 +303,17 @@ class SurePetcareAPI:
             )
         )
 
+        # entities are woken up by the coordinators only if their sure entity changed,
+        # this also keeps every tier polling, including those no entity subscribed to
+        for coordinator in self.coordinators.values():
+            coordinator.async_add_listener(coordinator.async_dispatch_changes)
+
+        # persist the entities for the next (warm) start whenever a refresh changed them
+        for tier in SNAPSHOT_TIERS:
+            self.coordinators[tier].async_add_listener(
+                partial(self._async_save_snapshot, self.coordinators[tier])
+            )
+
         surepy_entities: list[SurepyEntity] = self.coordinator.data.values()
 
         pet_ids = [
@@ -278,6 +353,7 @@ class SurePetcareAPI:
                 ):
 
                     await self.set_pet_location(pet_id, Location[where.upper()])
+                    self.coordinator.async_note_activity()
                     await self.coordinator.async_request_refresh()
 
             except ValueError as error:
@@ -348,6 +424,7 @@ class SurePetcareAPI:
             lock_state = call.data.get(ATTR_LOCK_STATE)
 
             await self.set_lock_state(flap_id, lock_state)
+            self.coordinator.async_note_activity()
             await self.coordinator.async_request_refresh()
 
         flap_ids = [
@@ -420,6 +497,37 @@ def natural_time(duration: int) -> str:
     return natural
 
 
+def _household_ids(
+    entities: Mapping[int, SurepyEntity], entity_type: EntityType | None = None
+) -> set[int]:
+    """IDs of the households with entities (of the given type) in a snapshot."""
+    return {
+        entity.household_id
+        for entity in entities.values()
+        if entity_type is None or entity.type == entity_type
+    }
+
+
+def _create_entity(data: dict[str, Any]) -> SurepyEntity | None:
+    """Entity for an api payload, None for unsupported types."""
+
+    # key used by sure petcare in api response
+    entity_type = EntityType(int(data.get("product_id", 0)))
+
+    if entity_type in [EntityType.CAT_FLAP, EntityType.PET_FLAP]:
+        return Flap(data=data)
+    if entity_type in [EntityType.FEEDER, EntityType.FEEDER_LITE]:
+        return Feeder(data=data)
+    if entity_type == EntityType.FELAQUA:
+        return Felaqua(data=data)
+    if entity_type == EntityType.HUB:
+        return Hub(data=data)
+    if entity_type == EntityType.PET:
+        return Pet(data=data)
+
+    return None
+
+
 class Surepy:
     """Communication with the Sure Petcare API."""
 
@@ -428,8 +536,15 @@ class Surepy:
         email: str | None = None,
         password: str | None = None,
         auth_token: str | None = None,
-        api_timeout: int = API_TIMEOUT,
+        api_timeout: float = API_TIMEOUT,
         session: aiohttp.ClientSession | None = None,
+        validator_cache: ValidatorCache | None = None,
+        token_store: TokenStore | None = None,
+        rate_limit: float = RATE_LIMIT,
+        rate_limit_burst: int = RATE_LIMIT_BURST,
+        request_concurrency: int = REQUEST_CONCURRENCY,
+        household_concurrency: int = HOUSEHOLD_CONCURRENCY,
+        household_timeout: float = HOUSEHOLD_TIMEOUT,
     ) -> None:
         """Initialize the connection to the Sure Petcare API."""
 
@@ -445,16 +560,15 @@ class Surepy:
             api_timeout=api_timeout,
             session=self._session,
             surepy_version=__version__,
+            validator_cache=validator_cache,
+            token_store=token_store,
+            rate_limit=rate_limit,
+            rate_limit_burst=rate_limit_burst,
+            request_concurrency=request_concurrency,
         )
 
-        # api token management
-        self._auth_token: str | None = None
-        if auth_token and token_seems_valid(auth_token):
-            self._auth_token = auth_token
-        else:  # if token := find_token():
-            self._auth_token = find_token()
-
-        self.entities: dict[int, SurepyEntity] = {}
+        # read-only snapshot of the pets & devices, replaced (never changed) by refreshes
+        self.entities: Mapping[int, SurepyEntity] = MappingProxyType({})
         self._pets: dict[int, Any] = {}
         self._flaps: dict[int, Any] = {}
         self._feeders: dict[int, Any] = {}
@@ -464,6 +578,19 @@ class Surepy:
         self._species_breeds: dict[int, dict[int, Any]] = {}
         self._conditions: dict[int, Any] = {}
 
+        # bounded fan-out of the per-household report/timeline fetches
+        self._households = HouseholdFanOut(household_concurrency, household_timeout)
+
+        # incremental followers of the household timelines
+        self._timelines: dict[int, TimelineFollower] = {}
+
+        # entities added, updated & removed by the latest refresh
+        self.last_changes: ChangeSet = ChangeSet()
+
+        # resources whose (cached) body has been applied to the entities since they
+        # were (re)built, only these may be skipped on a 304
+        self._applied: set[str] = set()
+
         # storage for received api data
         self._resource: dict[str, Any] = {}
         # storage for etags
@@ -471,10 +598,20 @@ class Surepy:
 
         logger.debug("initialization completed | vars(): %s", vars())
 
+    async def __aenter__(self) -> Surepy:
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the connections owned by the api client."""
+        await self.sac.close()
+
     @property
     def auth_token(self) -> str | None:
         """Authentication token for device"""
-        return self._auth_token
+        return self.sac.tokens.token
 
     async def pets_details(self) -> list[dict[str, Any]] | None:
         """Fetch pet information."""
@@ -499,119 +636,183 @@ class Surepy:
         """
         return await self.get_actions(household_id=household_id)
 
-    async def get_actions(self, household_id: int) -> dict[int, dict[str, Any]] | None:
-        resource = f"{BASE_RESOURCE}/report/household/{household_id}"
-
-        latest_actions: dict[int, dict[str, Any]] = {}
-
+    async def get_actions(
+        self, household_id: int, force: bool = True, changes: ChangeSet | None = None
+    ) -> dict[int, dict[str, Any]] | None:
         pet_device_pairs: dict[str, Any] = (
-            await self.sac.call(method="GET", resource=resource) or {}
+            await self.sac.call(
+                method="GET",
+                resource=self._report_resource(household_id),
+                priority=PRIORITY_REPORTS,
+            )
+            or {}
         )
 
         if "data" not in pet_device_pairs:
-            return latest_actions
+            return {}
+
+        resource = self._report_resource(household_id)
+
+        if getattr(pet_device_pairs, "not_modified", False) and not force:
+            if resource in self._applied:
+                # report unchanged and already applied to the current entities
+                return {}
+
+        entities = dict(self.entities)
+        latest_actions = self._apply_actions(pet_device_pairs["data"], entities, changes)
+        self._swap(entities)
+        self._applied.add(resource)
+
+        return latest_actions
 
-        data: list[dict[str, Any]] = pet_device_pairs["data"]
+    @staticmethod
+    def _report_resource(household_id: int) -> str:
+        return f"{BASE_RESOURCE}/report/household/{household_id}"
+
+    def _apply_actions(
+        self,
+        data: list[dict[str, Any]],
+        entities: dict[int, SurepyEntity],
+        changes: ChangeSet | None = None,
+    ) -> dict[int, dict[str, Any]]:
+        """Attach the latest movement, feeding & drinking datapoints to the devices.
+
+        Devices with changed datapoints are replaced in ``entities`` (the snapshot
+        being assembled) and their IDs are added to ``changes``.
+        """
+
+        latest_actions: dict[int, dict[str, Any]] = {}
 
         for pair in data:
 
             pet_id = int(pair["pet_id"])
             device_id = int(pair["device_id"])
-            device: SurepyDevice = self.entities[device_id]  # type: ignore
+
+            if device_id not in entities:
+                # device is not (yet) known, e.g. report polled before the device state
+                continue
+
+            device: SurepyEntity = entities[device_id]
 
             latest_actions[pet_id] = {}
-            latest_actions[pet_id] = self.entities[device_id]._data
+            latest_actions[pet_id] = device.raw_data()
 
             # movement
             if (
                 device.type in [EntityType.CAT_FLAP, EntityType.PET_FLAP]
                 and pair["movement"]["datapoints"]
             ):
-                latest_datapoint = pair["movement"]["datapoints"].pop()
+                latest_datapoint = pair["movement"]["datapoints"][-1]
                 # latest_actions[pet_id]["move"] = latest_datapoint
-                latest_actions[pet_id] = self.entities[device_id]._data["move"] = latest_datapoint
+                entities[device_id] = device.attach("move", latest_datapoint)
+                if changes is not None and entities[device_id] is not device:
+                    changes.updated.add(device_id)
+                latest_actions[pet_id] = latest_datapoint
 
             # feeding
             elif (
                 device.type in [EntityType.FEEDER, EntityType.FEEDER_LITE]
                 and pair["feeding"]["datapoints"]
             ):
-                latest_datapoint = pair["feeding"]["datapoints"].pop()
+                latest_datapoint = pair["feeding"]["datapoints"][-1]
                 # latest_actions[pet_id]["lunch"] = latest_datapoint
-                latest_actions[pet_id] = self.entities[device_id]._data["lunch"] = latest_datapoint
+                entities[device_id] = device.attach("lunch", latest_datapoint)
+                if changes is not None and entities[device_id] is not device:
+                    changes.updated.add(device_id)
+                latest_actions[pet_id] = latest_datapoint
 
             # drinking
             elif device.type == EntityType.FELAQUA and pair["drinking"]["datapoints"]:
-                latest_datapoint = pair["drinking"]["datapoints"].pop()
+                latest_datapoint = pair["drinking"]["datapoints"][-1]
                 # latest_actions[pet_id]["drink"] = latest_datapoint
-                latest_actions[pet_id] = self.entities[device_id]._data["drink"] = latest_datapoint
+                entities[device_id] = device.attach("drink", latest_datapoint)
+                if changes is not None and entities[device_id] is not device:
+                    changes.updated.add(device_id)
+                latest_actions[pet_id] = latest_datapoint
 
         return latest_actions
 
-    async def get_latest_anonymous_drinks(self, household_id: int) -> dict[str, Any] | None:
+    def timeline(self, household_id: int) -> TimelineFollower:
+        """Incremental follower of the household timeline."""
 
-        latest_drink: dict[str, float | str | datetime] = {}
+        if household_id not in self._timelines:
+            self._timelines[household_id] = TimelineFollower(
+                self.sac, household_id, budget=self._households.timeout
+            )
 
-        household_timeline = await self.get_household_timeline(household_id, entries=50)
+        return self._timelines[household_id]
 
-        felaqua_related_entries: list[dict[str, Any]] = list(
-            filter(
-                lambda x: x["type"] in [29, 30, 34],  # type: ignore
-                household_timeline,  # type: ignore
-            )
-        )
+    async def get_latest_anonymous_drinks(
+        self, household_id: int, changes: ChangeSet | None = None
+    ) -> dict[str, Any] | None:
+        await self.timeline(household_id).sync()
+
+        entities = dict(self.entities)
+        latest_drink = self._apply_latest_drink(household_id, entities, changes)
+        self._swap(entities)
+
+        return latest_drink
+
+    def _apply_latest_drink(
+        self,
+        household_id: int,
+        entities: dict[int, SurepyEntity],
+        changes: ChangeSet | None = None,
+    ) -> dict[str, Any]:
+        """Attach the latest water level from the household timeline to its Felaqua.
+
+        The Felaqua is replaced in ``entities`` (the snapshot being assembled) if
+        the water level changed and its ID is added to ``changes``.
+        """
+
+        latest_drink: dict[str, float | str | datetime] = {}
+
+        household_timeline = self.timeline(household_id)
 
-        if felaqua_related_entries:
+        if latest_entry := household_timeline.latest(types=[29, 30, 34]):
             try:
-                device_id = felaqua_related_entries[0]["weights"][0]["device_id"]
-                latest_entry_frame = felaqua_related_entries[0]["weights"][0]["frames"][0]
+                device_id = latest_entry["weights"][0]["device_id"]
+                latest_entry_frame = latest_entry["weights"][0]["frames"][0]
                 remaining = latest_entry_frame["current_weight"]
                 change = latest_entry_frame["change"]
                 updated_at = latest_entry_frame["updated_at"]
                 latest_drink = {"remaining": remaining, "change": change, "date": updated_at}
 
-                self.entities[device_id]._data["latest_drink"] = latest_drink
+                felaqua = entities[device_id]
+                entities[device_id] = felaqua.attach("latest_drink", latest_drink)
+                if changes is not None and entities[device_id] is not felaqua:
+                    changes.updated.add(device_id)
 
             except (KeyError, TypeError, IndexError):
                 logger.warning(
                     "no water remaining/change events found in household timeline "
                     "(checked last %s entries)",
-                    len(household_timeline) or 0,
+                    len(household_timeline.events),
                 )
 
         return latest_drink
 
     async def get_household_timeline(
-        self, household_id: int | None = None, entries: int = 25
+        self,
+        household_id: int | None = None,
+        entries: int = 25,
+        page_size: int = TIMELINE_PAGE_SIZE,
+        window: int = TIMELINE_PAGE_WINDOW,
     ) -> list[dict[str, Any]]:
-        """Fetch Felaqua water level information."""
-
-        # pagination as the api gives us at most 25 results per page
-        max_entries_per_page = 25
-        pages_to_fetch = ceil(entries / max_entries_per_page)
-
-        current_page = 1
-        household_timeline = []
-
-        while current_page <= pages_to_fetch:
-
-            resource = HOUSEHOLD_TIMELINE_RESOURCE.format(
-                BASE_RESOURCE=BASE_RESOURCE,
-                household_id=household_id,
-                page=current_page,
-                page_size=max_entries_per_page,
-            )
-
-            if timeline := await self.sac.call(method="GET", resource=resource):
-                household_timeline += timeline.get("data", [])
+        """Fetch Felaqua water level information.
 
-            current_page += 1
-
-        return household_timeline
+        Pages are requested ``window`` at a time, see ``timeline.fetch_timeline``.
+        """
+        return await fetch_timeline(self.sac, household_id, entries, page_size, window)
 
     async def get_timeline(self) -> dict[str, Any]:
         """Retrieve the flap data/state."""
-        return await self.sac.call(method="GET", resource=TIMELINE_RESOURCE) or {}
+        return (
+            await self.sac.call(
+                method="GET", resource=TIMELINE_RESOURCE, priority=PRIORITY_TIMELINE
+            )
+            or {}
+        )
 
     async def get_notification(self) -> dict[str, Any] | None:
         """Retrieve the flap data/state."""
@@ -625,10 +826,13 @@ class Surepy:
             await self.sac.call(
                 method="GET",
                 resource=f"{BASE_RESOURCE}/report/household/{household_id}/pet/{pet_id}",
+                priority=PRIORITY_REPORTS,
             )
             if pet_id
             else await self.sac.call(
-                method="GET", resource=f"{BASE_RESOURCE}/report/household/{household_id}"
+                method="GET",
+                resource=f"{BASE_RESOURCE}/report/household/{household_id}",
+                priority=PRIORITY_REPORTS,
             )
         ) or {}
 
@@ -671,7 +875,7 @@ class Surepy:
             for breed in attributes.get("breed", {}):
                 self._breeds[breed["id"]] = breed["name"]
 
-                if breed["species_id"] not in self._breeds:
+                if breed["species_id"] not in self._species_breeds:
                     self._species_breeds[breed["species_id"]] = {}
 
                 self._species_breeds[breed["species_id"]][breed["id"]] = breed["name"]
@@ -681,68 +885,243 @@ class Surepy:
 
         return attributes
 
-    async def get_entities(self, refresh: bool = False) -> dict[int, SurepyEntity]:
-        """Get all Entities (Pets/Devices)"""
+    @property
+    def household_ids(self) -> set[int]:
+        """IDs of all households with known entities."""
+        return _household_ids(self.entities)
+
+    @property
+    def felaqua_household_ids(self) -> set[int]:
+        """IDs of all households with a Felaqua."""
+        return _household_ids(self.entities, EntityType.FELAQUA)
+
+    def _swap(self, entities: dict[int, SurepyEntity]) -> Mapping[int, SurepyEntity]:
+        """Publish a completely assembled snapshot of the entities.
+
+        Snapshots are assembled on a copy without awaiting anything in between,
+        the swap is a single assignment. Readers never see a half-updated state
+        and a cancelled or failed refresh leaves the previous snapshot in place.
+        """
+
+        self.entities = MappingProxyType(entities)
+        return self.entities
+
+    def export_snapshot(self) -> dict[str, Any]:
+        """Current entities, e.g. to persist them for a warm start.
+
+        The cached api responses are persisted by the validator cache of the client.
+        """
+        return {"entities": [entity.raw_data() for entity in self.entities.values()]}
 
-        household_ids: set[int] = set()
-        felaqua_household_ids: set[int] = set()
-        surepy_entities: dict[int, SurepyEntity] = {}
+    def restore_snapshot(self, snapshot: Mapping[str, Any]) -> Mapping[int, SurepyEntity]:
+        """Restore entities exported by ``export_snapshot``.
+
+        With a validator cache the next refreshes are conditional requests and
+        usually just confirm the restored entities. The cached responses may be
+        newer than the snapshot though, so the first response of each resource
+        is applied even if it is a 304.
+        """
+
+        entities: dict[int, SurepyEntity] = {}
+
+        for data in snapshot.get("entities", []):
+            try:
+                if entity := _create_entity(data):
+                    entities[entity.id] = entity
+            except (KeyError, TypeError, ValueError) as error:
+                logger.warning("skipping unreadable entity from snapshot: %s", repr(error))
+
+        self._applied.clear()
+
+        return self._swap(entities)
+
+    async def refresh_state(self, refresh: bool = True) -> Mapping[int, SurepyEntity]:
+        """Refresh the pets and devices (position, lock state, status, ...)."""
 
         raw_data: dict[str, list[dict[str, Any]]] = {}
 
-        # get data like species, breed, conditions
-        # await self.get_attributes()
+        # reconcile the entities unless nothing changed since the last refresh
+        changed: bool = True
 
         if MESTART_RESOURCE not in self.sac.resources or refresh:
-            if response := await self.sac.call(method="GET", resource=MESTART_RESOURCE):
+            if response := await self.sac.call(
+                method="GET", resource=MESTART_RESOURCE, budget=REFRESH_TIMEOUT
+            ):
                 raw_data = response.get("data", {})
+                changed = not (response.not_modified and self._is_applied(MESTART_RESOURCE))
         else:
             raw_data = self.sac.resources[MESTART_RESOURCE].get("data", {})
+            changed = not self._is_applied(MESTART_RESOURCE)
 
         if not raw_data:
             logger.error("could not fetch data ¯\\_(ツ)_/¯")
-            return surepy_entities
+            return {}
+
+        if not changed:
+            self.last_changes = ChangeSet()
+            return self.entities
+
+        # everything below is synchronous: the new snapshot is assembled & swapped in one go
+        entities = dict(self.entities)
+        changes = self.reconcile(raw_data, entities)
+
+        # re-attach the last known reports & water levels to updated entities,
+        # they are refreshed on their own (slower) cadence
+        if changes.added or changes.updated:
+            for household_id in _household_ids(entities):
+                if report := self.sac.resources.get(self._report_resource(household_id)):
+                    self._apply_actions(report.get("data", []), entities)
+            for household_id in _household_ids(entities, EntityType.FELAQUA):
+                self._apply_latest_drink(household_id, entities)
+
+        self.last_changes = changes
+        self._applied.add(MESTART_RESOURCE)
+
+        return self._swap(entities)
+
+    def _is_applied(self, resource: str) -> bool:
+        """If the current entities reflect the cached body of ``resource``."""
+        return bool(self.entities) and resource in self._applied
+
+    def reconcile(
+        self, raw_data: dict[str, list[dict[str, Any]]], entities: dict[int, SurepyEntity]
+    ) -> ChangeSet:
+        """Reconcile the snapshot being assembled with a me/start payload.
+
+        Known entities are kept as they are if their payload is unchanged and
+        replaced by their successor otherwise, entities are only created or
+        removed if the set of pets and devices changed.
+        """
 
-        all_entities = raw_data.get("devices", []) + raw_data.get("pets", [])
+        changes = ChangeSet()
+        seen_ids: set[int] = set()
 
-        for entity in all_entities:
+        for entity in raw_data.get("devices", []) + raw_data.get("pets", []):
 
             # key used by sure petcare in api response
             entity_type = EntityType(int(entity.get("product_id", 0)))
             entity_id = entity["id"]
 
-            if entity_type in [EntityType.CAT_FLAP, EntityType.PET_FLAP]:
-                surepy_entities[entity_id] = Flap(data=entity)
-            elif entity_type in [EntityType.FEEDER, EntityType.FEEDER_LITE]:
-                surepy_entities[entity_id] = Feeder(data=entity)
-            elif entity_type == EntityType.FELAQUA:
-                surepy_entities[entity_id] = Felaqua(data=entity)
-                felaqua_household_ids.add(int(surepy_entities[entity_id].household_id))
-            elif entity_type == EntityType.HUB:
-                surepy_entities[entity_id] = Hub(data=entity)
-            elif entity_type == EntityType.PET:
-                surepy_entities[entity_id] = Pet(data=entity)
-
-            else:
+            if (surepy_entity := entities.get(entity_id)) and surepy_entity.type == entity_type:
+                seen_ids.add(entity_id)
+                entities[entity_id] = surepy_entity.evolve(entity)
+                if entities[entity_id] is not surepy_entity:
+                    changes.updated.add(entity_id)
+                continue
+
+            if not (new_entity := _create_entity(entity)):
                 logger.warning(
                     "unknown type: %s (%s): %s", entity.get("name", "-"), entity_type, entity
                 )
+                continue
 
-            household_ids.add(surepy_entities[entity_id].household_id)
+            entities[entity_id] = new_entity
 
-            self.entities[entity_id] = surepy_entities[entity_id]
+            seen_ids.add(entity_id)
+            changes.added.add(entity_id)
 
-        # fetch additional data about movement, feeding & drinking
+        for entity_id in set(entities) - seen_ids:
+            del entities[entity_id]
+            changes.removed.add(entity_id)
+
+        return changes
+
+    async def refresh_reports(
+        self, changes: ChangeSet | None = None
+    ) -> Mapping[int, SurepyEntity]:
+        """Refresh the movement, feeding & drinking reports of all households."""
+
+        if not self.entities:
+            await self.refresh_state()
+
+        changes = changes if changes is not None else ChangeSet()
+
+        household_ids = list(self.household_ids)
+
+        reports = await asyncio.gather(
+            *[
+                self._households.fetch(household_id, self._fetch_report(household_id))
+                for household_id in household_ids
+            ]
+        )
+
+        # all reports received (or skipped), apply them to a new snapshot in one go
+        entities = dict(self.entities)
+        for report in reports:
+            if report:
+                self._apply_actions(report, entities, changes)
+
+        self.last_changes = changes
+
+        self._swap(entities)
+        self._applied.update(
+            self._report_resource(household_id)
+            for household_id, report in zip(household_ids, reports)
+            if report is not None
+        )
+
+        return self.entities
+
+    async def _fetch_report(self, household_id: int) -> list[dict[str, Any]] | None:
+        """Data of a household report, None if it is unchanged since it was last applied."""
+
+        resource = self._report_resource(household_id)
+
+        response = await self.sac.call(
+            method="GET",
+            resource=resource,
+            priority=PRIORITY_REPORTS,
+            budget=self._households.timeout,
+        )
+
+        if not response or (
+            getattr(response, "not_modified", False) and self._is_applied(resource)
+        ):
+            return None
+
+        return response.get("data")  # type: ignore[no-any-return]
+
+    async def refresh_timelines(
+        self, changes: ChangeSet | None = None
+    ) -> Mapping[int, SurepyEntity]:
+        """Refresh the household timelines of all households with a Felaqua."""
+
+        if not self.entities:
+            await self.refresh_state()
+
+        changes = changes if changes is not None else ChangeSet()
+
+        household_ids = self.felaqua_household_ids
+
+        await asyncio.gather(
+            *[
+                self._households.fetch(household_id, self.timeline(household_id).sync())
+                for household_id in household_ids
+            ]
+        )
+
+        # all timelines synced (or skipped), apply them to a new snapshot in one go
+        entities = dict(self.entities)
         for household_id in household_ids:
-            await self.get_actions(household_id=household_id)
-        for household_id in felaqua_household_ids:
-            await self.get_latest_anonymous_drinks(household_id=household_id)
-
-        # stupid idea, fix this
-        _ = [
-            feeder.add_bowls()  # type: ignore
-            for feeder in surepy_entities.values()
-            if feeder.type == EntityType.FEEDER
-        ]
+            self._apply_latest_drink(household_id, entities, changes)
+
+        self.last_changes = changes
+
+        return self._swap(entities)
+
+    async def get_entities(self, refresh: bool = False) -> Mapping[int, SurepyEntity]:
+        """Get all Entities (Pets/Devices)"""
+
+        # get data like species, breed, conditions
+        # await self.get_attributes()
+
+        if not await self.refresh_state(refresh=refresh):
+            return {}
+
+        changes = self.last_changes
+
+        # fetch additional data about movement, feeding & drinking
+        await asyncio.gather(self.refresh_reports(changes), self.refresh_timelines(changes))
+        self.last_changes = changes
 
         return self.entities
@@ -0,0 +1,249 @@
+"""
+surepy.auth
+====================================
+Lifecycle of the Sure Petcare api token.
+
+|license-info|
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+import json
+import logging
+
+from collections import deque
+from os import environ
+from pathlib import Path
+from time import monotonic, time
+from typing import Awaitable, Callable
+
+from .const import TOKEN_REFRESH_HISTORY, TOKEN_RENEW_MARGIN
+
+
+TOKEN_ENV = "SUREPY_TOKEN"  # nosec
+TOKEN_FILE = Path("~/.surepy.token").expanduser()
+
+# get a logger
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def token_seems_valid(token: str) -> bool:
+    """check validity of an api token based on its characters and length
+
+    Args:
+        token (str): sure petcare api token
+
+    Returns:
+        bool: True if ``token`` seems valid
+    """
+    return (
+        (token is not None) and token.isascii() and token.isprintable() and (320 < len(token))
+    )
+
+
+def find_token() -> str | None:
+    """Token from the environment or the surepy token file, reads the file (blocking)."""
+
+    token: str | None = None
+
+    # check env token
+    if (env_token := environ.get(TOKEN_ENV, None)) and token_seems_valid(token=env_token):
+        token = env_token
+
+    # check file token
+    elif (
+        TOKEN_FILE.exists()
+        and (file_token := TOKEN_FILE.read_text(encoding="utf-8"))
+        and token_seems_valid(token=file_token)
+    ):
+        token = file_token
+
+    return token
+
+
+def token_expiry(token: str | None) -> float | None:
+    """Expiry (unix time) from the ``exp`` claim of a JWT, the signature is not verified.
+
+    Args:
+        token (str): sure petcare api token
+
+    Returns:
+        float: expiry of ``token`` or None if it is not a JWT with an ``exp`` claim
+    """
+
+    try:
+        payload = (token or "").split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError, binascii.Error):
+        return None
+
+
+class TokenStore:
+    """Keeps the api token across restarts, no file I/O may be done on the event loop.
+
+    The base class keeps nothing.
+    """
+
+    async def async_load(self) -> str | None:
+        """Return the stored token, if any."""
+        return None
+
+    async def async_save(self, token: str) -> None:
+        """Store a refreshed token."""
+
+
+class FileTokenStore(TokenStore):
+    """The token from the ``SUREPY_TOKEN`` environment variable or the surepy token file.
+
+    The file is read in an executor and, as it belongs to surepy, never written.
+    """
+
+    async def async_load(self) -> str | None:
+        return await asyncio.get_running_loop().run_in_executor(None, find_token)
+
+
+class TokenManager:
+    """Holds the api token and refreshes it single-flight.
+
+    All requests that find the token missing or rejected share one login, and
+    a token about to expire is renewed in the background while it is still
+    used. ``login`` returns the new token (or None) and raises on failures.
+    Without a token the ``store`` is asked first, refreshed tokens are saved
+    to it.
+    """
+
+    def __init__(
+        self,
+        login: Callable[[], Awaitable[str | None]],
+        token: str | None = None,
+        store: TokenStore | None = None,
+        renew_margin: float = TOKEN_RENEW_MARGIN,
+    ) -> None:
+        self._login = login
+        self._renew_margin = renew_margin
+
+        self._store = store or TokenStore()
+        self._store_lock = asyncio.Lock()
+        self._store_loaded: bool = False
+
+        self._token: str | None = None
+        self._expires_at: float | None = None
+        self.token = token
+
+        # the login in flight, shared by everyone waiting for a token
+        self._refresh: asyncio.Future[str | None] | None = None
+
+        # metrics
+        self.refresh_count: int = 0
+        self.refresh_latencies: deque[float] = deque(maxlen=TOKEN_REFRESH_HISTORY)
+
+    @property
+    def token(self) -> str | None:
+        """The current api token."""
+        return self._token
+
+    @token.setter
+    def token(self, token: str | None) -> None:
+        self._token = token
+        self._expires_at = token_expiry(token)
+
+    @property
+    def expires_at(self) -> float | None:
+        """Expiry (unix time) of the current token, None if unknown."""
+        return self._expires_at
+
+    @property
+    def last_refresh_latency(self) -> float | None:
+        """Duration (seconds) of the latest login."""
+        return self.refresh_latencies[-1] if self.refresh_latencies else None
+
+    async def async_get_token(self) -> str | None:
+        """Return a usable token, logging in if there is none or it has expired.
+
+        A token within the renew margin of its expiry is returned as is while
+        its successor is fetched in the background.
+        """
+
+        if not self._token and not self._store_loaded:
+            await self._async_load()
+
+        if not self._token or (self._expires_at is not None and self._expires_at <= time()):
+            return await self.async_refresh(rejected=self._token)
+
+        if self._expires_at is not None and self._expires_at - self._renew_margin <= time():
+            self._start_refresh()
+
+        return self._token
+
+    async def async_refresh(self, rejected: str | None = None) -> str | None:
+        """Replace the ``rejected`` token, requests that were rejected together share one login.
+
+        If the token has already been replaced since ``rejected`` was used, the
+        replacement is returned without logging in again.
+        """
+
+        if self._refresh is None and self._token and self._token != rejected:
+            return self._token
+
+        return await asyncio.shield(self._start_refresh())
+
+    async def _async_load(self) -> None:
+        """Take over the stored token once."""
+
+        async with self._store_lock:
+            if self._store_loaded:
+                return
+
+            self._store_loaded = True
+
+            if not self._token and (token := await self._store.async_load()):
+                if token_seems_valid(token):
+                    self.token = token
+
+    def _start_refresh(self) -> asyncio.Future[str | None]:
+        """Start a login unless one is already in flight."""
+
+        if self._refresh is None:
+            self._refresh = asyncio.ensure_future(self._async_login())
+            self._refresh.add_done_callback(self._refresh_done)
+
+        return self._refresh
+
+    def _refresh_done(self, refresh: asyncio.Future[str | None]) -> None:
+        if self._refresh is refresh:
+            self._refresh = None
+
+        # a failed background renewal is retried on the next request
+        if not refresh.cancelled() and (error := refresh.exception()):
+            logger.warning("🐾 \x1b[38;2;255;26;102m·\x1b[0m token refresh failed: %r", error)
+
+    async def _async_login(self) -> str | None:
+        start = monotonic()
+
+        try:
+            token = await self._login()
+        finally:
+            self.refresh_latencies.append(monotonic() - start)
+            self.refresh_count += 1
+
+        self.token = token
+
+        if token:
+            try:
+                await self._store.async_save(token)
+            except Exception as error:  # pylint: disable=broad-except
+                logger.warning(
+                    "🐾 \x1b[38;2;255;26;102m·\x1b[0m unable to store the token: %r", error
+                )
+
+        logger.debug(
+            "🐾 \x1b[38;2;0;255;0m·\x1b[0m token refreshed in %.0fms | expires at: %s",
+            self.refresh_latencies[-1] * 1000,
+            self._expires_at,
+        )
+
+        return token
@@ -0,0 +1,158 @@
+"""
+benchmarks.bench_attributes
+====================================
+Serialized size and serialization time of the state attributes written for a
+synthetic household, with the full raw api payload spread into the attributes
+versus the compact per-type projection.
+
+    python benchmarks/bench_attributes.py [--pets 20] [--devices 6] [--rounds 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+
+# the integration without running its Home Assistant ``__init__``
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))
+
+from loader import load_integration  # noqa: E402
+
+load_integration()
+
+from sureha.const import DEVICE_ATTRIBUTES, PET_ATTRIBUTES  # noqa: E402
+from sureha.entities import SurepyEntity  # noqa: E402
+from sureha.entities.devices import Flap  # noqa: E402
+from sureha.entities.pet import Pet  # noqa: E402
+
+
+def pet_payload(pet_id: int) -> dict[str, Any]:
+    return {
+        "id": pet_id,
+        "name": f"Pet {pet_id}",
+        "gender": 0,
+        "date_of_birth": "2018-04-01T00:00:00+00:00",
+        "weight": "4.20",
+        "comments": "",
+        "household_id": 1,
+        "breed_id": 382,
+        "food_type_id": 2,
+        "photo_id": pet_id,
+        "species_id": 1,
+        "tag_id": pet_id,
+        "version": "MA==",
+        "created_at": "2020-01-01T12:00:00+00:00",
+        "updated_at": "2021-01-01T12:00:00+00:00",
+        "conditions": [{"id": 1, "version": "MA==", "created_at": "2020-01-01T12:00:00+00:00"}],
+        "photo": {
+            "id": pet_id,
+            "location": f"https://surehub.s3.amazonaws.com/user-photos/{pet_id:032x}.jpg",
+            "uploading_user_id": 1,
+            "version": "MA==",
+            "created_at": "2020-01-01T12:00:00+00:00",
+            "updated_at": "2020-01-01T12:00:00+00:00",
+        },
+        "position": {
+            "tag_id": pet_id,
+            "device_id": 100,
+            "where": 1,
+            "since": "2021-06-01T08:00:00+00:00",
+        },
+        "status": {
+            "activity": {
+                "tag_id": pet_id,
+                "device_id": 100,
+                "where": 1,
+                "since": "2021-06-01T08:00:00+00:00",
+            },
+            "feeding": {
+                "id": pet_id,
+                "tag_id": pet_id,
+                "device_id": 101,
+                "change": [-3.4, -1.2],
+                "at": "2021-06-01T07:00:00+00:00",
+            },
+        },
+    }
+
+
+def flap_payload(device_id: int) -> dict[str, Any]:
+    return {
+        "id": device_id,
+        "parent_device_id": 99,
+        "product_id": 6,
+        "household_id": 1,
+        "name": f"Flap {device_id}",
+        "serial_number": f"H010-{device_id:07d}",
+        "mac_address": f"{device_id:016X}",
+        "index": 0,
+        "version": "MA==",
+        "created_at": "2020-01-01T12:00:00+00:00",
+        "updated_at": "2021-01-01T12:00:00+00:00",
+        "pairing_at": "2020-01-01T12:00:00+00:00",
+        "control": {"curfew": [], "locking": 0, "fast_polling": False},
+        "tags": [
+            {"id": tag, "index": tag, "profile": 2, "version": "MA==",
+             "created_at": "2020-01-01T12:00:00+00:00", "updated_at": "2020-01-01T12:00:00+00:00"}
+            for tag in range(8)
+        ],
+        "status": {
+            "locking": {"mode": 0},
+            "version": {"device": {"hardware": 5, "firmware": 1.177}},
+            "battery": 5.71,
+            "learn_mode": False,
+            "online": True,
+            "signal": {"device_rssi": -56.25, "hub_rssi": -60.5},
+        },
+    }
+
+
+def full_attributes(entity: SurepyEntity) -> dict[str, Any]:
+    return {**entity.raw_data()}
+
+
+def projected_attributes(entity: SurepyEntity) -> dict[str, Any]:
+    return entity.projected_data(PET_ATTRIBUTES if isinstance(entity, Pet) else DEVICE_ATTRIBUTES)
+
+
+def measure(entities: list[SurepyEntity], project: Any, rounds: int) -> tuple[int, float]:
+    """Bytes written per refresh and mean time to build & serialize the attributes."""
+
+    size = 0
+    start = perf_counter()
+
+    for _ in range(rounds):
+        size = sum(len(json.dumps(project(entity), default=str)) for entity in entities)
+
+    return size, (perf_counter() - start) / rounds
+
+
+def main(pets: int, devices: int, rounds: int) -> None:
+    entities: list[SurepyEntity] = [Pet(pet_payload(100 + pet)) for pet in range(pets)]
+    entities += [Flap(flap_payload(200 + device)) for device in range(devices)]
+
+    print(f"entities: {pets} pets, {devices} flaps | rounds: {rounds}")
+
+    full_size, full_time = measure(entities, full_attributes, rounds)
+    slim_size, slim_time = measure(entities, projected_attributes, rounds)
+
+    print(f"full raw   : {full_size:8d} bytes/refresh {full_time * 1e6:10.1f}µs/refresh")
+    print(f"projection : {slim_size:8d} bytes/refresh {slim_time * 1e6:10.1f}µs/refresh")
+    saved_size, saved_time = 1 - slim_size / full_size, 1 - slim_time / full_time
+    print(f"saved      : {saved_size:8.1%} size   {saved_time:8.1%} time")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pets", type=int, default=20)
+    parser.add_argument("--devices", type=int, default=6)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    main(args.pets, args.devices, args.rounds)
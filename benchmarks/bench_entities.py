@@ -0,0 +1,160 @@
+"""
+benchmarks.bench_entities
+====================================
+Property reads and per-entity memory of the parse-once, slotted entity model
+for a synthetic household, compared with the previous model that kept only the
+raw payload and re-derived every value on each property access.
+
+    python benchmarks/bench_entities.py [--pets 200] [--rounds 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tracemalloc
+
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable
+from urllib.parse import urlparse
+
+
+# the integration & other benchmarks, without running its Home Assistant ``__init__``
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from loader import load_integration  # noqa: E402
+
+load_integration()
+
+from bench_attributes import pet_payload  # noqa: E402
+from sureha.entities import PetLocation, StateFeeding, content_hash  # noqa: E402
+from sureha.entities.pet import Pet  # noqa: E402
+from sureha.entities.states import PetState  # noqa: E402
+from sureha.enums import EntityType, FoodType, Location  # noqa: E402
+
+
+class LegacyPet:
+    """The previous pet model: raw payload only, everything derived on access."""
+
+    def __init__(self, data: dict[str, Any]):
+        self._id = int(data["id"])
+        self._data = data
+        self._type = EntityType.PET
+        self._name = str(name) if (name := data.get("name")) else "Unnamed"
+        self._content_hash = content_hash(data)
+        self.pet_id = int(data["id"])
+        self.state = PetState(data["status"]) if "status" in data else "Unknown"
+
+    @property
+    def household_id(self) -> int:
+        return int(self._data["household_id"])
+
+    @property
+    def food_type(self) -> str | None:
+        return str(FoodType(type_id)) if (type_id := self._data.get("food_type_id")) else None
+
+    @property
+    def photo_url(self) -> str | None:
+        return urlparse(
+            self._data.get("photo", {}).get("location")
+            or "https://surehub.io/assets/images/no-pet-pic-dark.svg"
+        ).geturl()
+
+    @property
+    def location(self) -> PetLocation:
+        position = self._data.get("position", {})
+        return PetLocation(
+            where=Location(position.get("where", Location.UNKNOWN.value)),
+            since=position.get("since", None),
+        )
+
+    @property
+    def at_home(self) -> bool:
+        return bool(self.location.where == Location.INSIDE)
+
+    @property
+    def feeding(self) -> StateFeeding | None:
+        if activity := self._data.get("status", {}).get("feeding", {}):
+            return StateFeeding(
+                change=activity.get("change", [0.0, 0.0]),
+                at=datetime.fromisoformat(activity.get("at", None)),
+            )
+        return None
+
+    @property
+    def last_lunch(self) -> datetime | None:
+        return self.feeding.at if self.feeding else None
+
+
+def read_all(pet: Any) -> None:
+    """The reads the platforms do for a pet on a state write."""
+    # pylint: disable=pointless-statement
+    pet.household_id
+    pet.food_type
+    pet.photo_url
+    pet.location.since
+    pet.location.where
+    pet.at_home
+    pet.feeding
+    pet.last_lunch
+
+
+def measure_reads(pets: list[Any], rounds: int) -> float:
+    """Mean time to read all properties of all pets once."""
+
+    start = perf_counter()
+
+    for _ in range(rounds):
+        for pet in pets:
+            read_all(pet)
+
+    return (perf_counter() - start) / rounds
+
+
+def measure_memory(model: Callable[[dict[str, Any]], Any], payloads: list[dict[str, Any]]) -> float:
+    """Mean bytes allocated per entity on top of its (shared) api payload."""
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    entities = [model(payload) for payload in payloads]
+
+    allocated = sum(
+        stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(before, "filename")
+    )
+    tracemalloc.stop()
+
+    del entities
+    return allocated / len(payloads)
+
+
+def main(pets: int, rounds: int) -> None:
+    payloads = [pet_payload(100 + pet) for pet in range(pets)]
+
+    print(f"household: {pets} pets | rounds: {rounds}")
+
+    for label, model in (("raw, derived", LegacyPet), ("parsed, slots", Pet)):
+        start = perf_counter()
+        entities = [model(payload) for payload in payloads]
+        ingest = perf_counter() - start
+
+        reads = measure_reads(entities, rounds)
+        memory = measure_memory(model, payloads)
+
+        print(
+            f"{label:<14} ingest: {ingest * 1e3:7.2f}ms "
+            f"reads: {reads * 1e6:9.1f}µs/tick ({reads / pets * 1e9:7.0f}ns/pet) "
+            f"memory: {memory:8.0f} bytes/pet"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pets", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    main(args.pets, args.rounds)
@@ -0,0 +1,98 @@
+"""
+benchmarks.bench_preflight
+====================================
+Latency of a full ``get_entities`` cycle (me/start, one report per household
+and two timeline pages per Felaqua household) against a local stand-in for the
+Sure Petcare api, with the different OPTIONS preflight policies.
+
+    python benchmarks/bench_preflight.py [--latency-ms 25] [--households 3] [--cycles 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+
+from pathlib import Path
+from statistics import mean
+from time import perf_counter
+
+from aiohttp import web
+
+
+# the integration without running its Home Assistant ``__init__``
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))
+
+from loader import load_integration  # noqa: E402
+
+load_integration()
+
+from sureha.client import SureAPIClient  # noqa: E402
+from sureha.const import PREFLIGHT_ALWAYS, PREFLIGHT_OFF, PREFLIGHT_ONCE  # noqa: E402
+from sureha.ratelimit import TokenBucket  # noqa: E402
+
+
+def stand_in_api(latency: float) -> web.Application:
+    """Minimal api answering every route after ``latency`` seconds."""
+
+    async def handler(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        if request.method == "OPTIONS":
+            return web.Response(status=204)
+        return web.json_response({"data": {"path": request.path}})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    return app
+
+
+async def refresh_cycle(client: SureAPIClient, base: str, households: int) -> None:
+    """Same request sequence as ``Surepy.get_entities(refresh=True)``."""
+    await client.call(method="GET", resource=f"{base}/me/start")
+    for household_id in range(households):
+        await client.call(method="GET", resource=f"{base}/report/household/{household_id}")
+    for household_id in range(households):
+        for page in (1, 2):
+            await client.call(
+                method="GET", resource=f"{base}/timeline/household/{household_id}?page={page}"
+            )
+
+
+async def main(latency_ms: float, households: int, cycles: int) -> None:
+    runner = web.AppRunner(stand_in_api(latency_ms / 1000))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    base = f"http://127.0.0.1:{port}/api"
+
+    print(f"stand-in latency: {latency_ms}ms | households: {households} | cycles: {cycles}")
+
+    for policy in (PREFLIGHT_ALWAYS, PREFLIGHT_ONCE, PREFLIGHT_OFF):
+        durations: list[float] = []
+
+        # a private bucket high enough not to delay any request, only the preflights are measured
+        rate_limiter = TokenBucket(rate=1_000_000, burst=1_000_000)
+
+        async with SureAPIClient(
+            auth_token="x" * 400, preflight=policy, rate_limiter=rate_limiter
+        ) as client:
+            for _ in range(cycles):
+                start = perf_counter()
+                await refresh_cycle(client, base, households)
+                durations.append(perf_counter() - start)
+
+        print(f"preflight={policy:<7} mean cycle: {mean(durations) * 1000:8.1f}ms")
+
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--latency-ms", type=float, default=25.0)
+    parser.add_argument("--households", type=int, default=3)
+    parser.add_argument("--cycles", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.latency_ms, args.households, args.cycles))
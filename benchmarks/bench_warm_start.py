@@ -0,0 +1,179 @@
+"""
+benchmarks.bench_warm_start
+====================================
+Time until the entities exist at startup: a cold start (me/start, one report
+per household and the timeline of each Felaqua household against a local
+stand-in for the Sure Petcare api) versus a warm start reading the persisted
+snapshot, and the time until a warm start has fresh data (snapshot plus the
+first refresh, a conditional request answered with a 304 thanks to the
+persisted validator cache).
+
+Only the work that differs between the two paths is timed. The coordinators'
+``async_warm_start``, their first dispatch and the platform setup need Home
+Assistant, run on both paths and are not included, so the warm start figure
+is a lower bound of the real startup time, not the startup time itself.
+
+    python benchmarks/bench_warm_start.py [--latency-ms 250] [--households 2] [--pets 6]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from aiohttp import web
+
+
+# the integration & other benchmarks, without running its Home Assistant ``__init__``
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from loader import load_integration  # noqa: E402
+
+load_integration()
+
+from bench_attributes import flap_payload, pet_payload  # noqa: E402
+from sureha.cache import ValidatorCache  # noqa: E402
+from sureha.client import SureAPIClient  # noqa: E402
+from sureha.entities import SurepyEntity  # noqa: E402
+from sureha.entities.devices import Flap  # noqa: E402
+from sureha.entities.pet import Pet  # noqa: E402
+from sureha.ratelimit import TokenBucket  # noqa: E402
+
+
+def me_start(households: int, pets: int) -> dict[str, Any]:
+    """me/start payload with ``pets`` pets and two flaps per household."""
+    payload: dict[str, Any] = {"devices": [], "pets": []}
+    for household_id in range(households):
+        offset = 1000 * household_id
+        for pet in range(pets):
+            payload["pets"].append({**pet_payload(offset + pet), "household_id": household_id})
+        for flap in range(2):
+            payload["devices"].append(
+                {**flap_payload(offset + 900 + flap), "household_id": household_id}
+            )
+    return payload
+
+
+def stand_in_api(latency: float, payload: dict[str, Any]) -> web.Application:
+    """Minimal api answering me/start, reports & timelines after ``latency`` seconds."""
+
+    async def handler(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        etag = f'"{hash(request.path)}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304)
+        body = {"data": payload} if request.path.endswith("/me/start") else {"data": []}
+        return web.json_response(body, headers={"ETag": etag})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    return app
+
+
+def build_entities(data: list[dict[str, Any]]) -> dict[int, SurepyEntity]:
+    return {
+        int(entity["id"]): (Pet(entity) if "product_id" not in entity else Flap(entity))
+        for entity in data
+    }
+
+
+async def cold_start(client: SureAPIClient, base: str, households: int) -> dict[int, SurepyEntity]:
+    """Same round trips as the first refresh of ``async_setup_entry`` without a snapshot."""
+
+    response = await client.call(method="GET", resource=f"{base}/me/start") or {}
+    data = response["data"]
+    entities = build_entities(data["devices"] + data["pets"])
+
+    await asyncio.gather(
+        *[
+            client.call(method="GET", resource=f"{base}/report/household/{household_id}")
+            for household_id in range(households)
+        ],
+        *[
+            client.call(method="GET", resource=f"{base}/timeline/household/{household_id}?page=1")
+            for household_id in range(households)
+        ],
+    )
+
+    return entities
+
+
+def warm_start(path: Path) -> dict[int, SurepyEntity]:
+    """Same work as ``SureSnapshotStore.async_restore`` & ``Surepy.restore_snapshot``."""
+
+    snapshot = json.loads(path.read_text())
+    return build_entities(snapshot["entities"])
+
+
+async def main(latency_ms: float, households: int, pets: int) -> None:
+    payload = me_start(households, pets)
+
+    runner = web.AppRunner(stand_in_api(latency_ms / 1000, payload))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    base = f"http://127.0.0.1:{port}/api"
+
+    print(f"stand-in latency: {latency_ms}ms | households: {households} | pets/household: {pets}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "sureha.snapshot"
+        cache = ValidatorCache(Path(directory) / "sureha.validators")
+        # a private bucket high enough not to delay any request
+        rate_limiter = TokenBucket(rate=1_000_000, burst=1_000_000)
+
+        async with SureAPIClient(
+            auth_token="x" * 400, validator_cache=cache, rate_limiter=rate_limiter
+        ) as client:
+            start = perf_counter()
+            entities = await cold_start(client, base, households)
+            cold = perf_counter() - start
+
+            path.write_text(json.dumps({"entities": [e.raw_data() for e in entities.values()]}))
+
+        # "restart"
+        async with SureAPIClient(
+            auth_token="x" * 400, validator_cache=cache, rate_limiter=rate_limiter
+        ) as client:
+            start = perf_counter()
+            restored = warm_start(path)
+            warm = perf_counter() - start
+
+            start = perf_counter()
+            response = await client.call(method="GET", resource=f"{base}/me/start")
+            first = perf_counter() - start
+
+        cache_size = cache.path.stat().st_size
+
+    assert restored.keys() == entities.keys()
+
+    print(f"cold start : {cold * 1000:8.1f}ms until the entities are built from the api")
+    print(f"warm start : {warm * 1000:8.1f}ms until the entities are restored from the snapshot")
+    print(
+        f"fresh data : {(warm + first) * 1000:8.1f}ms after a warm start (first poll "
+        f"{first * 1000:.1f}ms, not modified: {getattr(response, 'not_modified', False)}, "
+        f"validator cache: {cache_size} bytes)"
+    )
+    print("(coordinator warm start, first dispatch & platform setup are not included)")
+    print(f"entities   : {len(restored)}")
+
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--latency-ms", type=float, default=250.0)
+    parser.add_argument("--households", type=int, default=2)
+    parser.add_argument("--pets", type=int, default=6)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.latency_ms, args.households, args.pets))
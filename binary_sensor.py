@@ -4,13 +4,12 @@ from __future__ import annotations
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
-    DEVICE_CLASS_CONNECTIVITY,
-    DEVICE_CLASS_PRESENCE,
+    BinarySensorDeviceClass,
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from .entities import SurepyEntity
 from .entities.devices import Hub as SureHub, SurepyDevice
 from .entities.pet import Pet as SurePet
@@ -18,7 +17,8 @@ from .enums import EntityType, Location
 
 # pylint: disable=relative-beyond-top-level
 from . import SurePetcareAPI
-from .const import DOMAIN, SPC, SURE_MANUFACTURER
+from .const import ATTR_POLL_INTERVAL, DOMAIN, SPC, SURE_MANUFACTURER
+from .entity import SureCoordinatorEntity, signal_poll_interval
 
 PARALLEL_UPDATES = 2
 
@@ -62,20 +62,25 @@ async def async_setup_entry(
     async_add_entities(entities, True)
 
 
-class SurePetcareBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class SurePetcareBinarySensor(SureCoordinatorEntity, BinarySensorEntity):
     """A binary sensor implementation for Sure Petcare Entities."""
 
     _attr_should_poll = False
 
+    # raw api data changing with (almost) every poll, not worth recording
+    _unrecorded_attributes = frozenset(
+        {"status", "position", "updated_at", "move", "lunch", "drink", "latest_drink"}
+    )
+
     def __init__(
         self,
         coordinator,
         _id: int,
         spc: SurePetcareAPI,
-        device_class: str,
+        device_class: BinarySensorDeviceClass | None,
     ):
         """Initialize a Sure Petcare binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, _id)
 
         self._id: int = _id
         self._spc: SurePetcareAPI = spc
@@ -102,7 +107,7 @@ class SurePetcareBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._attr_unique_id = f"{self._surepy_entity.household_id}-{self._id}"
 
         if self._state:
-            self._attr_extra_state_attributes = {**self._surepy_entity.raw_data()}
+            self._attr_extra_state_attributes = self._projected_attributes(self._surepy_entity)
 
     @property
     def device_info(self):
@@ -149,29 +154,58 @@ class SurePetcareBinarySensor(CoordinatorEntity, BinarySensorEntity):
 class Hub(SurePetcareBinarySensor):
     """Sure Petcare Pet."""
 
+    # diagnostic changing with the activity of the pets
+    _unrecorded_attributes = SurePetcareBinarySensor._unrecorded_attributes | frozenset(
+        {ATTR_POLL_INTERVAL}
+    )
+
     def __init__(self, coordinator, _id: int, spc: SurePetcareAPI) -> None:
         """Initialize a Sure Petcare Hub."""
-        super().__init__(coordinator, _id, spc, DEVICE_CLASS_CONNECTIVITY)
+        super().__init__(coordinator, _id, spc, BinarySensorDeviceClass.CONNECTIVITY)
 
         if self._attr_device_info:
             self._attr_device_info["identifiers"] = {(DOMAIN, str(self._id))}
 
         self._attr_available = self.is_on
 
+    async def async_added_to_hass(self) -> None:
+        """Also write the state when the effective poll interval changed."""
+
+        await super().async_added_to_hass()
+
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                signal_poll_interval(self._spc.coordinator.tier),
+                self._handle_coordinator_update,
+            )
+        )
+
     @property
-    def is_on(self) -> bool:
-        """Return True if the hub is on."""
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the additional attrs."""
 
         hub: SureHub
-        online: bool = False
+        attrs: dict[str, Any] = {}
 
         if hub := self._coordinator.data[self._id]:
-
-            self._attr_extra_state_attributes = {
+            attrs = {
                 "led_mode": int(hub.raw_data()["status"]["led_mode"]),
                 "pairing_mode": bool(hub.raw_data()["status"]["pairing_mode"]),
+                # diagnostic: current effective (adaptive) poll interval in seconds
+                ATTR_POLL_INTERVAL: self._spc.coordinator.update_interval.total_seconds(),
             }
 
+        return attrs
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if the hub is on."""
+
+        hub: SureHub
+        online: bool = False
+
+        if hub := self._coordinator.data[self._id]:
             online = hub.online
 
         return online
@@ -180,10 +214,15 @@ class Hub(SurePetcareBinarySensor):
 class Pet(SurePetcareBinarySensor):
     """Sure Petcare Pet."""
 
+    # the state already records when the pet came or went
+    _unrecorded_attributes = SurePetcareBinarySensor._unrecorded_attributes | frozenset(
+        {"since"}
+    )
+
     def __init__(self, coordinator, _id: int, spc: SurePetcareAPI) -> None:
         """Initialize a Sure Petcare Pet."""
 
-        super().__init__(coordinator, _id, spc, DEVICE_CLASS_PRESENCE)
+        super().__init__(coordinator, _id, spc, BinarySensorDeviceClass.PRESENCE)
 
         # explicit typing
         self._surepy_entity: SurePet
@@ -200,11 +239,14 @@ class Pet(SurePetcareBinarySensor):
 
         if pet := self._coordinator.data[self._id]:
 
-            attrs = {
-                "since": pet.location.since,
-                "where": pet.location.where,
-                **pet.raw_data(),
-            }
+            attrs = pet.memoized(
+                ("location_attributes", self._full_raw_attributes),
+                lambda: {
+                    "since": pet.location.since,
+                    "where": pet.location.where,
+                    **self._projected_attributes(pet),
+                },
+            )
 
         return attrs
 
@@ -224,10 +266,15 @@ class Pet(SurePetcareBinarySensor):
 class DeviceConnectivity(SurePetcareBinarySensor):
     """Sure Petcare Connectivity Sensor."""
 
+    # signal strengths change with every poll and are available as their own sensors
+    _unrecorded_attributes = SurePetcareBinarySensor._unrecorded_attributes | frozenset(
+        {"device_rssi", "hub_rssi"}
+    )
+
     def __init__(self, coordinator, _id: int, spc: SurePetcareAPI) -> None:
         """Initialize a Sure Petcare device connectivity sensor."""
 
-        super().__init__(coordinator, _id, spc, DEVICE_CLASS_CONNECTIVITY)
+        super().__init__(coordinator, _id, spc, BinarySensorDeviceClass.CONNECTIVITY)
 
         self._attr_name = f"{self._name} Connectivity"
         self._attr_unique_id = (
@@ -244,10 +291,13 @@ class DeviceConnectivity(SurePetcareBinarySensor):
         if (device := self._coordinator.data[self._id]) and (
             state := device.raw_data().get("status")
         ):
-            attrs = {
-                "device_rssi": f'{state["signal"]["device_rssi"]:.2f}',
-                "hub_rssi": f'{state["signal"]["hub_rssi"]:.2f}',
-            }
+            attrs = device.memoized(
+                "connectivity_attributes",
+                lambda: {
+                    "device_rssi": f'{state["signal"]["device_rssi"]:.2f}',
+                    "hub_rssi": f'{state["signal"]["hub_rssi"]:.2f}',
+                },
+            )
 
         return attrs
 
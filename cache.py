@@ -0,0 +1,114 @@
+"""
+surepy.cache
+====================================
+On-disk cache of api responses and their http validators.
+
+|license-info|
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+
+from pathlib import Path
+from typing import Any
+
+from .const import VALIDATOR_CACHE_MAX_BYTES
+
+
+# get a logger
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ValidatorCache:
+    """Persists cached response bodies with their ETag/Last-Modified validators.
+
+    Restored, the first requests after a restart can be conditional and are
+    usually answered with a 304. The file is bounded to ``max_bytes``, the most
+    recently stored responses are kept. Both methods block and are meant to be
+    run in an executor.
+    """
+
+    def __init__(self, path: Path | str, max_bytes: int = VALIDATOR_CACHE_MAX_BYTES) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+
+    def load(self) -> dict[str, dict[str, Any]]:
+        """Read the cache, empty if there is none or it is unreadable."""
+
+        validators: dict[str, dict[str, Any]] = {
+            "resources": {},
+            "etags": {},
+            "last_modified": {},
+        }
+
+        try:
+            entries: list[dict[str, Any]] = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return validators
+        except (OSError, ValueError) as error:
+            logger.warning("🐾 \x1b[38;2;255;26;102m·\x1b[0m ignoring validator cache: %s", error)
+            return validators
+
+        # stored newest first, restore oldest first to keep the recency order
+        for entry in reversed(entries):
+            try:
+                resource = entry["resource"]
+                validators["resources"][resource] = entry["body"]
+                if etag := entry.get("etag"):
+                    validators["etags"][resource] = etag
+                if last_modified := entry.get("last_modified"):
+                    validators["last_modified"][resource] = last_modified
+            except (KeyError, TypeError):
+                continue
+
+        logger.debug(
+            "🐾 \x1b[38;2;0;255;0m·\x1b[0m restored %d cached responses from %s",
+            len(validators["resources"]),
+            self.path,
+        )
+
+        return validators
+
+    def save(self, validators: dict[str, dict[str, Any]]) -> int:
+        """Write the most recent responses within the size bound, returns the bytes written."""
+
+        etags = validators.get("etags", {})
+        last_modified = validators.get("last_modified", {})
+
+        encoded: list[str] = []
+        size = 2
+
+        # newest first until the bound is reached, responses without validators are useless
+        for resource, body in reversed(list(validators.get("resources", {}).items())):
+
+            if resource not in etags and resource not in last_modified:
+                continue
+
+            entry = json.dumps(
+                {
+                    "resource": resource,
+                    "body": body,
+                    "etag": etags.get(resource),
+                    "last_modified": last_modified.get(resource),
+                },
+                default=str,
+            )
+
+            if size + len(entry) + 1 > self.max_bytes:
+                continue
+
+            encoded.append(entry)
+            size += len(entry) + 1
+
+        content = f"[{','.join(encoded)}]"
+
+        # write atomically, a crash must not leave a truncated cache behind
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix(f"{self.path.suffix}.tmp")
+        temporary.write_text(content, encoding="utf-8")
+        os.replace(temporary, self.path)
+
+        return len(content)
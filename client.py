@@ -16,9 +16,9 @@ from datetime import datetime, time
 from http import HTTPStatus
 from http.client import HTTPException
 from logging import Logger
-from os import environ
-from pathlib import Path
-from typing import Any
+from time import monotonic
+from typing import Any, Mapping
+from urllib.parse import urlparse
 from uuid import uuid1
 
 import aiohttp
@@ -36,59 +36,69 @@ from .const import (
     CONTENT_TYPE,
     CONTENT_TYPE_JSON,
     CONTENT_TYPE_TEXT_PLAIN,
+    CONNECTOR_DNS_CACHE_TTL,
+    CONNECTOR_KEEPALIVE_TIMEOUT,
+    CONNECTOR_LIMIT_PER_HOST,
     CONTROL_RESOURCE,
     DEVICE_TAG_RESOURCE,
     ETAG,
     HOST,
     HTTP_HEADER_X_REQUESTED_WITH,
+    IF_MODIFIED_SINCE,
+    IF_NONE_MATCH,
+    LAST_MODIFIED,
     ORIGIN,
     PET_RESOURCE,
     POSITION_RESOURCE,
+    PREFLIGHT_ALWAYS,
+    PREFLIGHT_OFF,
+    PREFLIGHT_ONCE,
+    PREFLIGHT_TTL,
+    RATE_LIMIT,
+    RATE_LIMIT_BURST,
     REFERER,
+    REQUEST_CONCURRENCY,
     SUREPY_USER_AGENT,
     USER_AGENT,
+    VALIDATOR_CACHE_WRITE_DELAY,
 )
 from .enums import Location, LockState
-from .exeptions import SurePetcareAuthenticationError, SurePetcareConnectionError, SurePetcareError
-
+from .auth import (  # noqa: F401 (re-exported)
+    TOKEN_ENV,
+    TOKEN_FILE,
+    FileTokenStore,
+    TokenManager,
+    TokenStore,
+    find_token,
+    token_seems_valid,
+)
+from .cache import ValidatorCache
+from .exeptions import (
+    SurePetcareAuthenticationError,
+    SurePetcareCircuitOpenError,
+    SurePetcareConnectionError,
+    SurePetcareError,
+    SurePetcareServerError,
+)
+from .ratelimit import TokenBucket, shared_bucket
+from .resilience import IDEMPOTENT_METHODS, CircuitBreaker, RetryPolicy, endpoint
+from .scheduler import PRIORITY_CONTROL, RequestScheduler, default_priority
 
-TOKEN_ENV = "SUREPY_TOKEN"  # nosec
-TOKEN_FILE = Path("~/.surepy.token").expanduser()
 
 # get a logger
 logger: Logger = logging.getLogger(__name__)
 
 
-def token_seems_valid(token: str) -> bool:
-    """check validity of an api token based on its characters and length
+class APIResponse(dict):  # type: ignore[type-arg]
+    """Decoded api response body.
 
-    Args:
-        token (str): sure petcare api token
-
-    Returns:
-        bool: True if ``token`` seems valid
+    ``not_modified`` is set if the body was served from the validator cache
+    because the api answered a conditional request with ``304 Not Modified``.
     """
-    return (
-        (token is not None) and token.isascii() and token.isprintable() and (320 < len(token))
-    )
-
 
-def find_token() -> str | None:
-    token: str | None = None
-
-    # check env token
-    if (env_token := environ.get(TOKEN_ENV, None)) and token_seems_valid(token=env_token):
-        token = env_token
-
-    # check file token
-    elif (
-        TOKEN_FILE.exists()
-        and (file_token := TOKEN_FILE.read_text(encoding="utf-8"))
-        and token_seems_valid(token=file_token)
-    ):
-        token = file_token
-
-    return token
+    def __init__(self, body: dict[str, Any], not_modified: bool = False) -> None:
+        super().__init__(body)
+        self.not_modified: bool = not_modified
 
 
 class SureAPIClient:
@@ -100,13 +110,28 @@ class SureAPIClient:
         password: str | None = None,
         # loop: Optional[asyncio.AbstractEventLoop] = None,
         auth_token: str | None = None,
-        api_timeout: int = API_TIMEOUT,
+        api_timeout: float = API_TIMEOUT,
         session: aiohttp.ClientSession | None = None,
         surepy_version: str | None = None,
+        preflight: str = PREFLIGHT_OFF,
+        preflight_ttl: int = PREFLIGHT_TTL,
+        validator_cache: ValidatorCache | None = None,
+        token_store: TokenStore | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limit: float = RATE_LIMIT,
+        rate_limit_burst: int = RATE_LIMIT_BURST,
+        request_concurrency: int = REQUEST_CONCURRENCY,
+        rate_limiter: TokenBucket | None = None,
     ) -> None:
         """Initialize the connection to the Sure Petcare API."""
 
+        # an injected session (e.g. the one shared by home assistant) is never closed by us,
+        # without one we lazily create and own a long-lived session with its own pool
         self._session = session
+        self._owns_session: bool = session is None
+
+        if preflight not in [PREFLIGHT_OFF, PREFLIGHT_ONCE, PREFLIGHT_ALWAYS]:
+            raise ValueError(f"unknown preflight policy: {preflight}")
 
         # sure petcare credentials
         self.email = email
@@ -115,28 +140,91 @@ class SureAPIClient:
         self._device_id: str = str(uuid1())
 
         # connection settings
-        self._api_timeout: int = api_timeout
+        self._api_timeout: float = api_timeout
 
         self._surepy_version: str | None = surepy_version
 
-        # api token management
-        self._auth_token: str | None = None
+        # OPTIONS preflight policy and the last preflight per host
+        self._preflight: str = preflight
+        self._preflight_ttl: int = preflight_ttl
+        self._preflights: dict[str, float] = {}
+
+        # api token management, logins are single-flight & tokens renewed before they expire.
+        # without a token the store is asked (off the event loop) before the first request
+        self.tokens = TokenManager(self._login, store=token_store or FileTokenStore())
         if auth_token and token_seems_valid(auth_token):
-            self._auth_token = auth_token
-        elif token := find_token():
-            self._auth_token = token
-        else:
-            # no valid credentials/token
-            SurePetcareAuthenticationError("sorry 🐾 no valid credentials/token found ¯\\_(ツ)_/¯")
+            self.tokens.token = auth_token
 
         # storage for received api data
         self.resources: dict[str, Any] = {}
-        # storage for etags
+        # storage for the http validators of the received api data
         self._etags: dict[str, str] = {}
+        self._last_modified: dict[str, str] = {}
+
+        # optional on-disk copy of the above, restored before the first request
+        # and written (debounced) in an executor
+        self._validator_cache = validator_cache
+        self._validator_cache_restored: bool = validator_cache is None
+        self._validator_cache_lock = asyncio.Lock()
+        self._validator_cache_write: asyncio.TimerHandle | None = None
+
+        # identical GETs currently in flight and how many requests were saved by sharing them
+        self._inflight: dict[tuple[str, str], asyncio.Future[dict[str, Any] | None]] = {}
+        self.coalesced_requests: int = 0
+
+        # retries of idempotent requests and a circuit breaker per endpoint
+        self._retry_policy = retry_policy or RetryPolicy()
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self.retries: int = 0
+
+        # token buckets, shared with the other clients of the account on the same host
+        # unless the client is given a private one (e.g. benchmarks & tests)
+        self._rate_limit: float = rate_limit
+        self._rate_limit_burst: int = rate_limit_burst
+        self._rate_limiter = rate_limiter
+        self._buckets: dict[str, TokenBucket] = {}
+
+        # bounded requests in flight, control writes before state polls, reports & timelines
+        self.scheduler = RequestScheduler(request_concurrency)
 
         logger.debug("initialization completed | vars(): %s", vars())
 
-    def _generate_headers(self) -> dict[str, str]:
+    async def __aenter__(self) -> SureAPIClient:
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the injected session or the lazily created client-owned one."""
+
+        if self._session is None or (self._owns_session and self._session.closed):
+            connector = aiohttp.TCPConnector(
+                limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+                keepalive_timeout=CONNECTOR_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=CONNECTOR_DNS_CACHE_TTL,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
+
+        return self._session
+
+    async def close(self) -> None:
+        """Close the client-owned session, an injected session is left untouched.
+
+        A pending write of the validator cache is done right away.
+        """
+
+        if self._validator_cache_write:
+            self._validator_cache_write.cancel()
+            self._validator_cache_write = None
+            await self._write_validator_cache()
+
+        if self._owns_session and self._session:
+            await self._session.close()
+            self._session = None
+
+    def _generate_headers(self, token: str | None = None) -> dict[str, str]:
         """Build a HTTP header accepted by the API"""
         user_agent = (
             SUREPY_USER_AGENT.format(version=self._surepy_version) if self._surepy_version else None
@@ -153,37 +241,46 @@ class SureAPIClient:
             ACCEPT_ENCODING: "gzip, deflate",
             ACCEPT_LANGUAGE: "en-US,en-GB;q=0.9",
             HTTP_HEADER_X_REQUESTED_WITH: "com.sureflap.surepetcare",
-            AUTHORIZATION: f"Bearer {self._auth_token}",
+            AUTHORIZATION: f"Bearer {token}",
             "X-Device-Id": self._device_id,
         }
 
     async def get_token(self) -> str | None:
         """Get or refresh the authentication token."""
+        return await self.tokens.async_refresh(rejected=self.tokens.token)
+
+    async def _login(self) -> str | None:
+        """Log in with the credentials, only called by the token manager."""
         authentication_data: dict[str, str | None] = dict(
             email_address=self.email, password=self.password, device_id=self._device_id
         )
 
         token: str | None = None
 
-        session = self._session if self._session else aiohttp.ClientSession()
+        session = self._get_session()
+
+        # every request waits for the login, it goes first
+        await self._bucket(AUTH_RESOURCE).acquire(PRIORITY_CONTROL)
 
         try:
             raw_response: aiohttp.ClientResponse = await session.post(
-                url=AUTH_RESOURCE, json=authentication_data, headers=self._generate_headers()
+                url=AUTH_RESOURCE,
+                json=authentication_data,
+                headers=self._generate_headers(self.tokens.token),
             )
 
             if raw_response.status == HTTPStatus.OK:
                 response: dict[str, Any] = await raw_response.json()
 
                 if "data" in response and "token" in response["data"]:
-                    token = self._auth_token = response["data"]["token"]
+                    token = response["data"]["token"]
 
             elif raw_response.status == HTTPStatus.NOT_MODIFIED:
                 # Etag header matched, no new data available
                 pass
 
             elif raw_response.status == HTTPStatus.UNAUTHORIZED:
-                self._auth_token = None
+                self.tokens.token = None
                 raise SurePetcareAuthenticationError()
 
             else:
@@ -198,9 +295,6 @@ class SureAPIClient:
         except (aiohttp.ClientError, AttributeError) as error:
             logger.debug("Failed to fetch %s: %s", AUTH_RESOURCE, error)
             raise SurePetcareError() from error
-        finally:
-            if not self._session:
-                await session.close()
 
     async def call(
         self,
@@ -209,103 +303,387 @@ class SureAPIClient:
         data: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
         second_try: bool = False,
+        priority: int | None = None,
+        budget: float | None = None,
         **_: Any,
     ) -> dict[str, Any] | None:
-        """Retrieve the flap data/state."""
+        """Retrieve the flap data/state.
 
-        # logger.debug("")
-        # logger.debug("🐾 %s call to: %s", method, resource)
-        # if data:
-        #     logger.debug("🐾   with data: %s", data)
+        ``priority`` is the scheduling class of the request, writes default to
+        control and reads to state polls. ``budget`` is the time (seconds) the
+        caller has for the request including its retries, without one every
+        attempt gets the api timeout. Coalesced GETs share the budget of the
+        first caller.
+        """
 
         if json and not data:
             data = json
 
-        if not self._auth_token:
-            self._auth_token = await self.get_token()
+        if priority is None:
+            priority = default_priority(method)
 
-        if method not in ["GET", "PUT", "POST", "DELETE"]:
-            raise HTTPException(f"unknown http method: {method}")
+        if not self._validator_cache_restored:
+            await self._restore_validator_cache()
 
-        response_data = None
+        # writes are never coalesced
+        if method != "GET" or data:
+            return await self._send(method, resource, data, second_try, priority, budget)
 
-        session = self._session if self._session else aiohttp.ClientSession()
+        # identical GETs that are already in flight share one request
+        key = (method, resource)
 
-        try:
-            with async_timeout.timeout(self._api_timeout):
-                headers = self._generate_headers()
+        if (inflight := self._inflight.get(key)) is not None:
+            self.coalesced_requests += 1
+            logger.debug("🐾 \x1b[38;2;0;255;0m·\x1b[0m %s %s | coalesced", method, resource)
+            return await asyncio.shield(inflight)
+
+        inflight = asyncio.ensure_future(
+            self._send(method, resource, data, second_try, priority, budget)
+        )
+        self._inflight[key] = inflight
 
-                # use etag if available
-                if resource in self._etags:
-                    headers[ETAG] = str(self._etags.get(resource))
-                    # logger.debug("🐾 \x1b[38;2;255;26;102m·\x1b[0m etag: %s", headers[ETAG])
+        def forget(task: asyncio.Future[dict[str, Any] | None]) -> None:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+            # mark exceptions as retrieved if all waiters were cancelled
+            if not task.cancelled():
+                task.exception()
 
-                await session.options(resource, headers=headers)
-                response: aiohttp.ClientResponse = await session.request(
-                    method, resource, headers=headers, json=data
+        inflight.add_done_callback(forget)
+
+        return await asyncio.shield(inflight)
+
+    def _breaker(self, resource: str) -> CircuitBreaker:
+        """The circuit breaker of the endpoint of ``resource``."""
+        return self.breakers.setdefault(endpoint(resource), CircuitBreaker())
+
+    async def _send(
+        self,
+        method: str,
+        resource: str,
+        data: dict[str, Any] | None = None,
+        second_try: bool = False,
+        priority: int = PRIORITY_CONTROL,
+        budget: float | None = None,
+    ) -> dict[str, Any] | None:
+        """Send a request through the circuit breaker of its endpoint.
+
+        Idempotent requests failing with a timeout, a connection error, a 429 or
+        a 5xx are retried with exponential backoff and full jitter, as long as
+        the ``budget`` leaves time for another attempt. While the breaker is
+        open requests fail right away instead of waiting for their timeout.
+        """
+
+        deadline = monotonic() + budget if budget is not None else None
+
+        key = endpoint(resource)
+        breaker = self._breaker(resource)
+        attempts = self._retry_policy.attempts if method in IDEMPOTENT_METHODS else 1
+
+        for retry in range(attempts):
+
+            if not breaker.allow():
+                logger.debug("🐾 \x1b[38;2;255;26;102m·\x1b[0m %s %s | circuit open", method, key)
+                raise SurePetcareCircuitOpenError(key)
+
+            try:
+                response = await self._request(
+                    method, resource, data, second_try, priority, deadline
                 )
 
-                if response.status == HTTPStatus.OK or response.status == HTTPStatus.CREATED:
-                    self.resources[resource] = response_data = await response.json()
+            except SurePetcareConnectionError as error:
+                if isinstance(error, SurePetcareServerError) and (
+                    error.status == HTTPStatus.TOO_MANY_REQUESTS
+                ):
+                    # throttled, but the api is up
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
 
-                    if ETAG in response.headers:
-                        self._etags[resource] = response.headers[ETAG].strip('"')
+                if retry + 1 >= attempts:
+                    raise
 
-                elif response.status == HTTPStatus.NOT_MODIFIED:
-                    # Etag header matched, no new data available
-                    logger.debug(
-                        "🐾 \x1b[38;2;0;255;0m·\x1b[0m %d: etag matched - no new data available",
-                        response.status,
+                delay = self._retry_policy.backoff(retry)
+
+                if deadline is not None and monotonic() + delay >= deadline:
+                    # the caller's budget leaves no time for another attempt
+                    raise
+
+                breaker.retries += 1
+                self.retries += 1
+                logger.debug(
+                    "🐾 \x1b[38;2;255;26;102m·\x1b[0m %s %s | %r, retry %d/%d in %.1fs",
+                    method,
+                    key,
+                    error,
+                    retry + 1,
+                    attempts - 1,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+            except SurePetcareError:
+                # the api answered
+                breaker.record_success()
+                raise
+
+            else:
+                breaker.record_success()
+                return response
+
+        return None
+
+    def _bucket(self, resource: str) -> TokenBucket:
+        """Rate limit of the host of ``resource``."""
+
+        host = urlparse(resource).netloc
+
+        if (bucket := self._buckets.get(host)) is None:
+            bucket = self._buckets[host] = self._rate_limiter or shared_bucket(
+                host, self.email, self._rate_limit, self._rate_limit_burst
+            )
+
+        return bucket
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Circuit breakers, retries, rate limits & token refreshes."""
+        return {
+            "rate_limits": {host: bucket.as_dict() for host, bucket in self._buckets.items()},
+            "breakers": {key: breaker.as_dict() for key, breaker in self.breakers.items()},
+            "retries": self.retries,
+            "coalesced_requests": self.coalesced_requests,
+            "scheduler": self.scheduler.as_dict(),
+            "token": {
+                "expires_at": self.tokens.expires_at,
+                "refreshes": self.tokens.refresh_count,
+                "last_refresh_latency": self.tokens.last_refresh_latency,
+            },
+        }
+
+    async def _request(
+        self,
+        method: str,
+        resource: str,
+        data: dict[str, Any] | None = None,
+        second_try: bool = False,
+        priority: int = PRIORITY_CONTROL,
+        deadline: float | None = None,
+    ) -> dict[str, Any] | None:
+        """Send a single request to the api, within what is left until the ``deadline``."""
+
+        # logger.debug("")
+        # logger.debug("🐾 %s call to: %s", method, resource)
+        # if data:
+        #     logger.debug("🐾   with data: %s", data)
+
+        # a token close to its expiry is renewed in the background
+        token = await self.tokens.async_get_token()
+
+        if method not in ["GET", "PUT", "POST", "DELETE"]:
+            raise HTTPException(f"unknown http method: {method}")
+
+        response_data = None
+        rejected: bool = False
+
+        session = self._get_session()
+
+        # a slot of the priority class, then the rate limit, both before the timeout starts
+        # (the wait still counts against the caller's budget).
+        # control writes have a reserved slot and pass background requests waiting for a token
+        async with self.scheduler.slot(priority):
+            await self._bucket(resource).acquire(priority)
+
+            try:
+                async with async_timeout.timeout(self._attempt_timeout(deadline)):
+                    headers = self._generate_headers(token)
+
+                    # make the request conditional if we have a cached body to fall back to
+                    if method == "GET" and resource in self.resources:
+                        if etag := self._etags.get(resource):
+                            headers[IF_NONE_MATCH] = etag
+                        if last_modified := self._last_modified.get(resource):
+                            headers[IF_MODIFIED_SINCE] = last_modified
+
+                    await self._send_preflight(session, resource, headers)
+                    response: aiohttp.ClientResponse = await session.request(
+                        method, resource, headers=headers, json=data
                     )
 
-                elif response.status == HTTPStatus.UNAUTHORIZED:
-                    logger.error(
-                        "🐾 \x1b[38;2;255;26;102m·\x1b[0m %s %s: %d | %s",
+                    if response.status == HTTPStatus.OK or response.status == HTTPStatus.CREATED:
+                        response_data = APIResponse(await response.json())
+
+                        if method == "GET":
+                            self._store_validators(resource, response_data, response.headers)
+
+                    elif response.status == HTTPStatus.NOT_MODIFIED and resource in self.resources:
+                        # validators matched, serve the cached body
+                        logger.debug(
+                            "🐾 \x1b[38;2;0;255;0m·\x1b[0m %d: etag matched - no new data available",
+                            response.status,
+                        )
+                        response_data = APIResponse(self.resources[resource], not_modified=True)
+
+                    elif response.status == HTTPStatus.UNAUTHORIZED:
+                        logger.error(
+                            "🐾 \x1b[38;2;255;26;102m·\x1b[0m %s %s: %d | %s",
+                            method,
+                            resource.replace("https://", ""),
+                            response.status,
+                            response,
+                        )
+                        if second_try:
+                            raise SurePetcareAuthenticationError()
+
+                        rejected = True
+
+                    else:
+                        logger.info(
+                            "🐾 \x1b[38;2;255;0;255m·\x1b[0m %s %s: %d | %s",
+                            method,
+                            resource.replace("https://", ""),
+                            response.status,
+                            response,
+                        )
+
+                        if (
+                            response.status == HTTPStatus.TOO_MANY_REQUESTS
+                            or response.status >= HTTPStatus.INTERNAL_SERVER_ERROR
+                        ):
+                            raise SurePetcareServerError(response.status)
+
+                    if response_data:
+                        responselen = len(response_data.get("data", 0))
+                    else:
+                        responselen = 0
+                    logger.debug(
+                        "🐾 \x1b[38;2;0;255;0m·\x1b[0m %s %s | %d",
                         method,
                         resource.replace("https://", ""),
-                        response.status,
-                        response,
+                        responselen,
                     )
-                    self._auth_token = None
-                    if not second_try:
-                        token_refreshed = await self.get_token()
-                        if token_refreshed:
-                            await self.call(method="GET", resource=resource, second_try=True)
 
-                    raise SurePetcareAuthenticationError()
+                    if method == "DELETE" and response.status == HTTPStatus.NO_CONTENT:
+                        # TODO: this does not return any data, is there a better way?
+                        return "DELETE 204 No Content"
 
-                else:
-                    logger.info(
-                        "🐾 \x1b[38;2;255;0;255m·\x1b[0m %s %s: %d | %s",
-                        method,
-                        resource.replace("https://", ""),
-                        response.status,
-                        response,
-                    )
+            except (asyncio.TimeoutError, aiohttp.ClientError) as error:
+                logger.error("Can not load data from %s", resource)
+                raise SurePetcareConnectionError() from error
 
-                if response_data:
-                    responselen = len(response_data.get("data", 0))
-                else:
-                    responselen = 0
-                logger.debug(
-                    "🐾 \x1b[38;2;0;255;0m·\x1b[0m %s %s | %d",
-                    method,
-                    resource.replace("https://", ""),
-                    responselen,
-                )
+        if rejected:
+            # replay the request once with a fresh token, concurrent rejections share the login
+            await self.tokens.async_refresh(rejected=token)
+            return await self._request(method, resource, data, True, priority, deadline)
 
-                if method == "DELETE" and response.status == HTTPStatus.NO_CONTENT:
-                    # TODO: this does not return any data, is there a better way?
-                    return "DELETE 204 No Content"
+        return response_data
 
-                return response_data
+    def _attempt_timeout(self, deadline: float | None) -> float:
+        """Timeout of an attempt, the api timeout unless less is left until the ``deadline``."""
 
-        except (asyncio.TimeoutError, aiohttp.ClientError) as error:
-            logger.error("Can not load data from %s", resource)
-            raise SurePetcareConnectionError() from error
-        finally:
-            if not self._session:
-                await session.close()
+        if deadline is None:
+            return self._api_timeout
+
+        return max(0.0, min(self._api_timeout, deadline - monotonic()))
+
+    async def _send_preflight(
+        self, session: aiohttp.ClientSession, resource: str, headers: dict[str, str]
+    ) -> None:
+        """Send an OPTIONS preflight if the preflight policy asks for one."""
+
+        if self._preflight == PREFLIGHT_OFF:
+            return
+
+        host = urlparse(resource).netloc
+        now = monotonic()
+
+        if (
+            self._preflight == PREFLIGHT_ONCE
+            and (last_preflight := self._preflights.get(host)) is not None
+            and now - last_preflight < self._preflight_ttl
+        ):
+            return
+
+        await session.options(resource, headers=headers)
+        self._preflights[host] = now
+
+    def _store_validators(
+        self, resource: str, body: dict[str, Any], headers: Mapping[str, str]
+    ) -> None:
+        """Cache a response body together with its http validators."""
+
+        self.resources[resource] = body
+
+        if etag := headers.get(ETAG):
+            self._etags[resource] = etag
+        else:
+            self._etags.pop(resource, None)
+
+        if last_modified := headers.get(LAST_MODIFIED):
+            self._last_modified[resource] = last_modified
+        else:
+            self._last_modified.pop(resource, None)
+
+        # keep the cache ordered by recency, the size bound of the on-disk cache drops the oldest
+        self.resources[resource] = self.resources.pop(resource)
+
+        self._schedule_validator_cache_write()
+
+    async def _restore_validator_cache(self) -> None:
+        """Restore the on-disk validator cache once, the file is read in an executor."""
+
+        async with self._validator_cache_lock:
+            if self._validator_cache_restored or not self._validator_cache:
+                return
+
+            validators = await asyncio.get_running_loop().run_in_executor(
+                None, self._validator_cache.load
+            )
+            self.restore_validators(validators)
+            self._validator_cache_restored = True
+
+    def _schedule_validator_cache_write(self) -> None:
+        """Write the validator cache soon, a write already scheduled is not postponed."""
+
+        if not self._validator_cache or self._validator_cache_write:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._validator_cache_write = loop.call_later(
+            VALIDATOR_CACHE_WRITE_DELAY,
+            lambda: loop.create_task(self._write_validator_cache()),
+        )
+
+    async def _write_validator_cache(self) -> None:
+        """Write the validator cache in an executor."""
+
+        self._validator_cache_write = None
+
+        if not self._validator_cache:
+            return
+
+        try:
+            size = await asyncio.get_running_loop().run_in_executor(
+                None, self._validator_cache.save, self.export_validators()
+            )
+            logger.debug("🐾 \x1b[38;2;0;255;0m·\x1b[0m validator cache written: %d bytes", size)
+        except OSError as error:
+            logger.warning(
+                "🐾 \x1b[38;2;255;26;102m·\x1b[0m could not write validator cache: %s", error
+            )
+
+    def export_validators(self) -> dict[str, dict[str, Any]]:
+        """Cached response bodies and their http validators, e.g. to persist them."""
+        return {
+            "resources": dict(self.resources),
+            "etags": dict(self._etags),
+            "last_modified": dict(self._last_modified),
+        }
+
+    def restore_validators(self, validators: Mapping[str, Mapping[str, Any]]) -> None:
+        """Restore cached response bodies and validators, already cached ones take precedence."""
+        self.resources = {**validators.get("resources", {}), **self.resources}
+        self._etags = {**validators.get("etags", {}), **self._etags}
+        self._last_modified = {**validators.get("last_modified", {}), **self._last_modified}
 
     async def get_pets(self) -> list[dict[str, Any]] | None:
         """Retrieve the pet data/state."""
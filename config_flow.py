@@ -14,12 +14,19 @@ import voluptuous as vol
 
 # pylint: disable=relative-beyond-top-level
 from .const import (
+    ATTR_FULL_RAW_ATTRIBUTES,
+    ATTR_POLL_INTERVAL_MAX,
+    ATTR_POLL_INTERVAL_MIN,
+    ATTR_STALE_WINDOW,
     ATTR_VOLTAGE_FULL,
     ATTR_VOLTAGE_LOW,
     DOMAIN,
     SURE_API_TIMEOUT,
     SURE_BATT_VOLTAGE_FULL,
     SURE_BATT_VOLTAGE_LOW,
+    SURE_POLL_INTERVAL_MAX,
+    SURE_POLL_INTERVAL_MIN,
+    SURE_STALE_WINDOW,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -130,6 +137,26 @@ class SureHAOptionsFlowHandler(config_entries.OptionsFlow):
                     ATTR_VOLTAGE_FULL, SURE_BATT_VOLTAGE_FULL
                 ),
             ): float,
+            vol.Optional(
+                ATTR_POLL_INTERVAL_MIN,
+                default=self.config_entry.options.get(
+                    ATTR_POLL_INTERVAL_MIN, SURE_POLL_INTERVAL_MIN
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=10)),
+            vol.Optional(
+                ATTR_POLL_INTERVAL_MAX,
+                default=self.config_entry.options.get(
+                    ATTR_POLL_INTERVAL_MAX, SURE_POLL_INTERVAL_MAX
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=10)),
+            vol.Optional(
+                ATTR_STALE_WINDOW,
+                default=self.config_entry.options.get(ATTR_STALE_WINDOW, SURE_STALE_WINDOW),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Optional(
+                ATTR_FULL_RAW_ATTRIBUTES,
+                default=self.config_entry.options.get(ATTR_FULL_RAW_ATTRIBUTES, False),
+            ): bool,
         }
 
         return self.async_show_form(step_id="init", data_schema=vol.Schema(options))
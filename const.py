@@ -9,9 +9,67 @@ TOPIC_UPDATE = f"{DOMAIN}_data_update"
 # sure petcare api
 SURE_API_TIMEOUT = 60
 
+# polling tiers, each data class is refreshed on its own cadence (seconds)
+TIER_STATE = "state"
+TIER_REPORTS = "reports"
+TIER_TIMELINE = "timeline"
+SCAN_INTERVALS = {
+    TIER_STATE: 60,
+    TIER_REPORTS: 5 * 60,
+    TIER_TIMELINE: 10 * 60,
+}
+REFRESH_TIMEOUT = 20
+
+# adaptive polling, bounds of the state tier and how the interval reacts
+ATTR_POLL_INTERVAL_MIN = "poll_interval_min"
+ATTR_POLL_INTERVAL_MAX = "poll_interval_max"
+SURE_POLL_INTERVAL_MIN = 30
+SURE_POLL_INTERVAL_MAX = 15 * 60
+# diagnostic attribute of the hub: current effective poll interval of the state tier (seconds)
+ATTR_POLL_INTERVAL = "poll_interval"
+# slower tiers never poll faster than their base cadence and at most this much slower
+TIER_INTERVAL_MAX_FACTOR = 8
+# unchanged polls in a row before the interval is stretched beyond the base cadence
+IDLE_POLLS_THRESHOLD = 3
+IDLE_INTERVAL_FACTOR = 1.5
+
+# stale-while-revalidate, seconds the last good data is served while the api fails (0: off)
+ATTR_STALE_WINDOW = "stale_window"
+SURE_STALE_WINDOW = 15 * 60
+# attribute of stale states: time of the data being served
+ATTR_LAST_REFRESH = "last_successful_refresh"
+
+# concurrent per-household fetches during a refresh and the time budget of each
+HOUSEHOLD_CONCURRENCY = 4
+HOUSEHOLD_TIMEOUT = 15
+
+# household timeline pagination, the api gives us at most 25 results per page
+TIMELINE_PAGE_SIZE = 25
+TIMELINE_PAGE_WINDOW = 3
+
+# incremental timeline sync, entries fetched on the first sync and events kept per household
+TIMELINE_BACKFILL_ENTRIES = 50
+TIMELINE_BUFFER_SIZE = 100
+
+# warm start, snapshot of the entities persisted in the hass storage
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60
+# older snapshots are not served on a warm start, the first refresh is awaited instead
+SNAPSHOT_MAX_AGE = 6 * 60 * 60
+
+# on-disk cache of the api responses & their validators, size bound and write delay
+VALIDATOR_CACHE_MAX_BYTES = 2 * 1024 * 1024
+VALIDATOR_CACHE_WRITE_DELAY = 30
+
 # device info
 SURE_MANUFACTURER = "Sure Petcare"
 
+# attributes taken over from the api payload, a compact projection per entity type
+# unless the whole raw payload is requested
+ATTR_FULL_RAW_ATTRIBUTES = "full_raw_attributes"
+PET_ATTRIBUTES = ("id", "household_id", "tag_id", "species_id", "breed_id", "food_type_id")
+DEVICE_ATTRIBUTES = ("id", "household_id", "product_id", "parent_device_id", "serial_number")
+
 # batteries
 ATTR_VOLTAGE_FULL = "voltage_full"
 ATTR_VOLTAGE_LOW = "voltage_low"
@@ -49,7 +107,9 @@ BASE_RESOURCE: str = "https://app.api.surehub.io/api"
 AUTH_RESOURCE: str = f"{BASE_RESOURCE}/auth/login"
 MESTART_RESOURCE: str = f"{BASE_RESOURCE}/me/start"
 TIMELINE_RESOURCE: str = f"{BASE_RESOURCE}/timeline"
-HOUSEHOLD_TIMELINE_RESOURCE: str = "{BASE_RESOURCE}/timeline/household/{household_id}?page={page}"
+HOUSEHOLD_TIMELINE_RESOURCE: str = (
+    "{BASE_RESOURCE}/timeline/household/{household_id}?page={page}&page_size={page_size}"
+)
 NOTIFICATION_RESOURCE: str = f"{BASE_RESOURCE}/notification"
 PET_RESOURCE: str = f"{BASE_RESOURCE}/pet?with%5B%5D=photo&with%5B%5D=breed&with%5B%5D=conditions&with%5B%5D=tag&with%5B%5D=food_type&with%5B%5D=species&with%5B%5D=position&with%5B%5D=status"
 DEVICE_RESOURCE: str = f"{BASE_RESOURCE}/device?with%5B%5D=children&with%5B%5D=tags&with%5B%5D=control&with%5B%5D=status"
@@ -61,6 +121,38 @@ DEVICE_TAG_RESOURCE: str = "{BASE_RESOURCE}/device/{device_id}/tag/{tag_id}"
 
 API_TIMEOUT = 45
 
+# OPTIONS preflight policies
+PREFLIGHT_OFF = "off"
+PREFLIGHT_ONCE = "once"
+PREFLIGHT_ALWAYS = "always"
+PREFLIGHT_TTL = 3600
+
+# renew the api token this long (seconds) before it expires, keep the latest refresh latencies
+TOKEN_RENEW_MARGIN = 900
+TOKEN_REFRESH_HISTORY = 20
+
+# retries of idempotent requests, exponential backoff (seconds) with full jitter
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_CAP = 15.0
+
+# per-endpoint circuit breaker, opened after consecutive failures for the reset timeout (seconds)
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_TIMEOUT = 60
+
+# requests per second and burst of the token bucket shared by the clients of an account/host
+RATE_LIMIT = 2.0
+RATE_LIMIT_BURST = 10
+
+# requests in flight at once, one of them reserved for control writes (lock, location, tags)
+REQUEST_CONCURRENCY = 4
+REQUEST_CONTROL_RESERVED = 1
+
+# connection pool of the client-owned session
+CONNECTOR_LIMIT_PER_HOST = 4
+CONNECTOR_KEEPALIVE_TIMEOUT = 60
+CONNECTOR_DNS_CACHE_TTL = 300
+
 # HTTP constants
 ACCEPT = "Accept"
 ACCEPT_ENCODING = "Accept-Encoding"
@@ -73,6 +165,9 @@ CONTENT_TYPE_TEXT_PLAIN = "text/plain"
 ETAG = "Etag"
 HOST = "Host"
 HTTP_HEADER_X_REQUESTED_WITH = "X-Requested-With"
+IF_MODIFIED_SINCE = "If-Modified-Since"
+IF_NONE_MATCH = "If-None-Match"
+LAST_MODIFIED = "Last-Modified"
 ORIGIN = "Origin"
 REFERER = "Referer"
 USER_AGENT = "User-Agent"
@@ -0,0 +1,348 @@
+"""Tiered polling of the Sure Petcare API."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from functools import partial
+import logging
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Mapping
+
+import async_timeout
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_POLL_INTERVAL_MAX,
+    ATTR_POLL_INTERVAL_MIN,
+    ATTR_STALE_WINDOW,
+    IDLE_INTERVAL_FACTOR,
+    IDLE_POLLS_THRESHOLD,
+    REFRESH_TIMEOUT,
+    SCAN_INTERVALS,
+    SURE_POLL_INTERVAL_MAX,
+    SURE_POLL_INTERVAL_MIN,
+    SURE_STALE_WINDOW,
+    TIER_INTERVAL_MAX_FACTOR,
+    TIER_REPORTS,
+    TIER_STATE,
+    TIER_TIMELINE,
+)
+from .entities import ChangeSet
+from .entity import signal_entity_update, signal_poll_interval
+from .exeptions import (
+    SurePetcareAuthenticationError,
+    SurePetcareConnectionError,
+    SurePetcareError,
+)
+
+if TYPE_CHECKING:
+    from . import Surepy
+    from .entities import SurepyEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AdaptiveInterval:
+    """Poll interval that speeds up on activity and backs off when idle or failing.
+
+    - activity (pets moving, feeding, lock changes): poll at the minimum interval
+    - unchanged data: relax back to the base cadence, after a run of unchanged
+      polls stretch the interval further towards the maximum
+    - connection errors, throttling & server errors: exponential backoff
+    """
+
+    def __init__(self, base: float, minimum: float, maximum: float) -> None:
+        self.base = base
+        self.minimum = minimum
+        self.maximum = maximum
+
+        self.interval: float = self._clamp(base)
+        self.unchanged_polls: int = 0
+        self.failures: int = 0
+
+    def _clamp(self, interval: float) -> float:
+        return max(self.minimum, min(interval, self.maximum))
+
+    def activity(self) -> float:
+        """Something happened, poll as fast as allowed."""
+        self.unchanged_polls = self.failures = 0
+        self.interval = self._clamp(self.minimum)
+        return self.interval
+
+    def unchanged(self) -> float:
+        """Nothing changed since the last poll."""
+        self.failures = 0
+        self.unchanged_polls += 1
+
+        ceiling = self.base if self.unchanged_polls < IDLE_POLLS_THRESHOLD else self.maximum
+        self.interval = self._clamp(min(self.interval * IDLE_INTERVAL_FACTOR, ceiling))
+        return self.interval
+
+    def failure(self) -> float:
+        """The api is unreachable, throttling or failing."""
+        self.failures += 1
+        self.interval = self._clamp(self.base * 2 ** self.failures)
+        return self.interval
+
+
+def _activity_signature(entities: Mapping[int, SurepyEntity] | None) -> int:
+    """Cheap signature of everything considered activity.
+
+    Covers pet positions & status, flap lock states and the latest
+    movement, feeding and drinking attached from reports & timelines.
+    """
+
+    if not isinstance(entities, Mapping):
+        return hash(repr(entities))
+
+    return hash(
+        tuple(
+            (entity_id, entity.memoized("activity_signature", partial(_entity_activity, entity)))
+            for entity_id, entity in sorted(entities.items())
+        )
+    )
+
+
+def _entity_activity(entity: SurepyEntity) -> int:
+    """Activity signature of a single entity, memoized for its data generation."""
+
+    data = entity.raw_data()
+
+    return hash(
+        (
+            repr(data.get("position")),
+            repr(data.get("status", {}).get("locking")),
+            repr(data.get("status", {}).get("activity")),
+            repr(data.get("move")),
+            repr(data.get("lunch")),
+            repr(data.get("drink")),
+            repr(data.get("latest_drink")),
+        )
+    )
+
+
+class SureTierCoordinator(DataUpdateCoordinator):
+    """Coordinator refreshing a single data class (tier) on its own cadence.
+
+    If a refresh fails, the last good data is served for ``stale_window``
+    seconds after the last successful refresh (stale-while-revalidate) while
+    refreshes keep being retried. Only then the entities become unavailable.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        surepy: Surepy,
+        tier: str,
+        update_method: Callable[[], Awaitable[Any]],
+        adaptive: AdaptiveInterval,
+        stale_window: float = SURE_STALE_WINDOW,
+    ) -> None:
+        """Initialize the coordinator of a polling tier."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"sureha_{tier}",
+            update_interval=timedelta(seconds=adaptive.interval),
+        )
+
+        self.tier = tier
+        self.adaptive = adaptive
+        self._surepy = surepy
+        self._tier_update_method = update_method
+        self._activity_signature: int | None = None
+
+        # sure entities changed by the latest refresh & if the last dispatch was for a success
+        self.changes: ChangeSet = ChangeSet()
+        self._dispatched_success: bool = True
+
+        # state writes skipped by the entities of this tier as nothing rendered changed
+        self.skipped_writes: int = 0
+
+        # stale-while-revalidate: last successful refresh & since when stale data is served
+        self.stale_window = timedelta(seconds=stale_window)
+        self.last_success_at: datetime | None = None
+        self.stale_since: datetime | None = None
+        self._dispatched_stale: bool = False
+
+    @callback
+    def async_warm_start(self, data: Any, refreshed_at: datetime) -> None:
+        """Serve restored data until the first refresh, as stale data of its time."""
+
+        self.data = data
+        self.last_update_success = True
+        self.last_success_at = refreshed_at
+        self.stale_since = dt_util.utcnow()
+        # the entities start out stale, the first successful refresh wakes all of them
+        self._dispatched_stale = True
+
+    def _apply_interval(self, interval: float) -> None:
+        if (update_interval := timedelta(seconds=interval)) != self.update_interval:
+            _LOGGER.debug("%s: poll interval is now %ss", self.name, interval)
+            self.update_interval = update_interval
+            async_dispatcher_send(self.hass, signal_poll_interval(self.tier))
+
+    def async_note_activity(self) -> None:
+        """Speed up polling, e.g. after a user-triggered lock change."""
+        self._apply_interval(self.adaptive.activity())
+
+    async def _async_update_data(self) -> Any:
+        """Fetch the data of this tier, serve the last good data if that fails."""
+
+        try:
+            data = await self._async_fetch_data()
+
+        except UpdateFailed as err:
+            return self._serve_stale(err)
+
+        if self.stale_since is not None:
+            _LOGGER.info("%s: refreshed again, no longer serving stale data", self.name)
+
+        self.last_success_at = dt_util.utcnow()
+        self.stale_since = None
+
+        return data
+
+    def _serve_stale(self, err: UpdateFailed) -> Any:
+        """Keep the last good data within the stale window, fail otherwise."""
+
+        now = dt_util.utcnow()
+
+        if (
+            self.data is None
+            or self.last_success_at is None
+            or now - self.last_success_at >= self.stale_window
+        ):
+            self.stale_since = None
+            raise err
+
+        if self.stale_since is None:
+            self.stale_since = now
+            _LOGGER.warning(
+                "%s: serving data of %s while the api fails: %s",
+                self.name,
+                self.last_success_at.isoformat(),
+                err,
+            )
+
+        # revalidate at least once more before the window expires
+        remaining = (self.last_success_at + self.stale_window - now).total_seconds()
+        self._apply_interval(
+            max(self.adaptive.minimum, min(self.update_interval.total_seconds(), remaining))
+        )
+
+        self.changes = ChangeSet()
+
+        return self.data
+
+    async def _async_fetch_data(self) -> Any:
+        """Fetch the data of this tier."""
+
+        self.changes = ChangeSet()
+
+        try:
+            # asyncio.TimeoutError and aiohttp.ClientError already handled
+
+            async with async_timeout.timeout(REFRESH_TIMEOUT):
+                data = await self._tier_update_method()
+
+        except SurePetcareAuthenticationError as err:
+            raise ConfigEntryAuthFailed from err
+        except SurePetcareError as err:
+            if isinstance(err, SurePetcareConnectionError):
+                self._apply_interval(self.adaptive.failure())
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
+        except asyncio.TimeoutError as err:
+            self._apply_interval(self.adaptive.failure())
+            raise UpdateFailed(f"Timeout communicating with API: {err}") from err
+
+        if self.tier == TIER_STATE and not data:
+            self._apply_interval(self.adaptive.failure())
+            raise UpdateFailed("Error communicating with API: no pets or devices received")
+
+        self.changes = self._surepy.last_changes
+
+        signature = _activity_signature(data)
+
+        if self._activity_signature is not None and signature != self._activity_signature:
+            self._apply_interval(self.adaptive.activity())
+        else:
+            self._apply_interval(self.adaptive.unchanged())
+
+        self._activity_signature = signature
+
+        return data
+
+    @callback
+    def async_dispatch_changes(self) -> None:
+        """Wake up only the entities bound to a changed Sure entity.
+
+        All entities are woken up if the availability or staleness changed, i.e.
+        on a failed refresh or the first successful one after a failure.
+        """
+
+        stale = self.stale_since is not None
+
+        if (
+            self.last_update_success
+            and self._dispatched_success
+            and stale == self._dispatched_stale
+        ):
+            surepy_ids = self.changes.changed
+        else:
+            surepy_ids = set(self._surepy.entities) | self.changes.changed
+
+        self._dispatched_success = self.last_update_success
+        self._dispatched_stale = stale
+
+        for surepy_id in surepy_ids:
+            async_dispatcher_send(self.hass, signal_entity_update(self.tier, surepy_id))
+
+
+def async_create_coordinators(
+    hass: HomeAssistant, surepy: Surepy, options: Mapping[str, Any]
+) -> dict[str, SureTierCoordinator]:
+    """Create one coordinator per polling tier.
+
+    - state: pet positions, flap lock states & device status (me/start)
+    - reports: latest movement, feeding & drinking of each household
+    - timeline: water levels from the household timelines
+    """
+
+    update_methods: dict[str, Callable[[], Awaitable[Any]]] = {
+        TIER_STATE: surepy.refresh_state,
+        TIER_REPORTS: surepy.refresh_reports,
+        TIER_TIMELINE: surepy.refresh_timelines,
+    }
+
+    coordinators: dict[str, SureTierCoordinator] = {}
+
+    stale_window = float(options.get(ATTR_STALE_WINDOW, SURE_STALE_WINDOW))
+
+    for tier, update_method in update_methods.items():
+
+        base = SCAN_INTERVALS[tier]
+
+        if tier == TIER_STATE:
+            # the state tier is the one that follows the pets, its bounds are configurable
+            minimum = float(options.get(ATTR_POLL_INTERVAL_MIN, SURE_POLL_INTERVAL_MIN))
+            maximum = float(options.get(ATTR_POLL_INTERVAL_MAX, SURE_POLL_INTERVAL_MAX))
+            adaptive = AdaptiveInterval(base, minimum, max(minimum, maximum))
+        else:
+            adaptive = AdaptiveInterval(base, base, base * TIER_INTERVAL_MAX_FACTOR)
+
+        coordinators[tier] = SureTierCoordinator(
+            hass,
+            surepy,
+            tier,
+            update_method,
+            adaptive,
+            # slower tiers are served stale for at least two of their polls
+            max(stale_window, 2 * base) if stale_window else 0,
+        )
+
+    return coordinators
@@ -3,7 +3,6 @@ import logging
 from typing import Any
 
 from homeassistant.components.device_tracker.config_entry import ScannerEntity
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .entities import EntityType
 from .entities.pet import Pet as SurePet
 from .enums import Location
@@ -11,6 +10,7 @@ from .enums import Location
 # pylint: disable=relative-beyond-top-level
 from . import DOMAIN, SurePetcareAPI
 from .const import SPC
+from .entity import SureCoordinatorEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,15 +32,19 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     )
 
 
-class SureDeviceTracker(CoordinatorEntity, ScannerEntity):
+class SureDeviceTracker(SureCoordinatorEntity, ScannerEntity):
     """Pet device tracker."""
 
     _attr_force_update = False
     _attr_icon = "mdi:cat"
 
+    # the state already records when the pet came or went, the rest is raw api data
+    # changing with (almost) every poll
+    _unrecorded_attributes = frozenset({"since", "status", "position", "updated_at"})
+
     def __init__(self, coordinator, _id: int, spc: SurePetcareAPI):
         """Initialize the tracker."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, _id)
 
         self._spc: SurePetcareAPI = spc
         self._coordinator = coordinator
@@ -77,11 +81,14 @@ class SureDeviceTracker(CoordinatorEntity, ScannerEntity):
 
         if pet := self._coordinator.data[self._id]:
 
-            attrs = {
-                "since": pet.location.since,
-                "where": pet.location.where,
-                **pet.raw_data(),
-            }
+            attrs = pet.memoized(
+                ("location_attributes", self._full_raw_attributes),
+                lambda: {
+                    "since": pet.location.since,
+                    "where": pet.location.where,
+                    **self._projected_attributes(pet),
+                },
+            )
 
         return attrs
 
@@ -0,0 +1,32 @@
+"""Diagnostics support for SureHA."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import SurePetcareAPI
+from .const import DOMAIN, SPC
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return the state of the api client & the polling tiers (no credentials/token)."""
+
+    spc: SurePetcareAPI = hass.data[DOMAIN][SPC]
+
+    return {
+        "client": spc.surepy.sac.diagnostics(),
+        "tiers": {
+            tier: {
+                "update_interval": coordinator.adaptive.interval,
+                "last_update_success": coordinator.last_update_success,
+                "last_success_at": coordinator.last_success_at,
+                "stale_since": coordinator.stale_since,
+                "skipped_writes": coordinator.skipped_writes,
+            }
+            for tier, coordinator in spc.coordinators.items()
+        },
+    }
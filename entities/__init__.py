@@ -1,15 +1,81 @@
 from __future__ import annotations
 
+import json
+
 from abc import ABC
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import wraps
 from pprint import pformat
-from typing import Any
+from typing import Any, Callable, Hashable, Iterable, TypeVar
 
 from ..enums import EntityType, Location
 
 
+_T = TypeVar("_T")
+
+
+def content_hash(data: dict[str, Any]) -> int:
+    """Cheap hash of an api payload to detect changes without keeping a copy."""
+    return hash(json.dumps(data, sort_keys=True, default=str))
+
+
+@dataclass
+class ChangeSet:
+    """IDs of the entities added, updated & removed by a refresh."""
+
+    added: set[int] = field(default_factory=set)
+    updated: set[int] = field(default_factory=set)
+    removed: set[int] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+    @property
+    def changed(self) -> set[int]:
+        """IDs of all added, updated & removed entities."""
+        return self.added | self.updated | self.removed
+
+
+def memoized(method: Callable[..., _T]) -> Callable[..., _T]:
+    """Memoize a method of a SurepyEntity for the generation of its data."""
+
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self: SurepyEntity, *args: Any, **kwargs: Any) -> _T:
+        key = (name, args, tuple(kwargs.items())) if kwargs else (name, args)
+
+        try:
+            return self._memo[key]  # type: ignore[no-any-return]
+        except KeyError:
+            value = self._memo[key] = method(self, *args, **kwargs)
+            return value
+
+    return wrapper
+
+
 class SurepyEntity(ABC):
+    """Sure Petcare entity decoded once from its api payload.
+
+    Derived values are computed in ``_parse`` when the payload is ingested, so
+    property reads are plain attribute lookups. Entities are not changed after
+    that, a changed payload results in a new entity one data generation later.
+    Everything else derived from the payload (formatted attributes,
+    signatures, ...) can be memoized for the generation of an entity.
+    """
+
+    __slots__ = (
+        "_id",
+        "_data",
+        "_type",
+        "_name",
+        "_content_hash",
+        "_household_id",
+        "_generation",
+        "_memo",
+    )
+
     def __init__(self, data: dict[str, Any]):
 
         # sure petcare id
@@ -19,7 +85,72 @@ class SurepyEntity(ABC):
         self._data = data
         self._type = EntityType(int(data.get("product_id", 0)))
 
+        # hash of the api payload the entity was built from
+        self._content_hash: int = content_hash(data)
+
+        # generation of the data & values memoized for it
+        self._generation: int = 0
+        self._memo: dict[Hashable, Any] = {}
+
+        self._parse()
+
+    def _parse(self) -> None:
+        """Decode the values derived from the api payload."""
+
         self._name: str = self._data.get("name", "Unknown")
+        self._household_id: int | None = (
+            int(household_id) if (household_id := self._data.get("household_id")) else None
+        )
+
+    def evolve(self, data: dict[str, Any]) -> SurepyEntity:
+        """Entity for a new api payload, the entity itself if the payload is unchanged.
+
+        Entities are never changed once built: readers of a snapshot can keep
+        using them while the next one is assembled.
+        """
+
+        if content_hash(data) == self._content_hash:
+            return self
+
+        return self._successor(data)
+
+    def attach(self, key: str, value: Any) -> SurepyEntity:
+        """Entity with data from another source (reports, timelines) attached to the payload.
+
+        The entity itself is returned if the attached value is unchanged.
+        """
+
+        if self._data.get(key) == value:
+            return self
+
+        successor = self._successor({**self._data, key: value})
+
+        # changes are still detected on the api payload, without attached data
+        successor._content_hash = self._content_hash
+
+        return successor
+
+    def _successor(self, data: dict[str, Any]) -> SurepyEntity:
+        """New entity of the same type for changed data, one generation later."""
+
+        successor = type(self)(data)
+        successor._generation = self._generation + 1
+
+        return successor
+
+    @property
+    def generation(self) -> int:
+        """Generation of the data, counting the changes since the first ingest."""
+        return self._generation
+
+    def memoized(self, key: Hashable, factory: Callable[[], _T]) -> _T:
+        """Value derived from the data of this generation, computed on first use."""
+
+        try:
+            return self._memo[key]  # type: ignore[no-any-return]
+        except KeyError:
+            value = self._memo[key] = factory()
+            return value
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -50,26 +181,37 @@ class SurepyEntity(ABC):
     @property
     def household_id(self) -> int:
         """ID of the household the entity belongs to."""
-        return int(self._data["household_id"])
+        if self._household_id is None:
+            raise KeyError("household_id")
+        return self._household_id
 
     def raw_data(self) -> dict[str, Any]:
         return self._data
 
+    def projected_data(self, fields: Iterable[str]) -> dict[str, Any]:
+        """Subset of the raw data containing only the given top-level fields."""
+        return {key: self._data[key] for key in fields if key in self._data}
+
 
 @dataclass
 class StateFeeding:
+    __slots__ = ("change", "at")
+
     change: list[float]
     at: datetime | None
 
 
 @dataclass
 class StateDrinking:
+    __slots__ = ("change", "at")
+
     change: list[float]
     at: datetime | None
 
 
 @dataclass
 class PetLocationData:
+    __slots__ = ("where", "since")
 
     where: Location
     since: datetime | None
@@ -80,9 +222,9 @@ class PetLocationData:
 
 @dataclass
 class PetActivity(PetLocationData):
-    pass
+    __slots__ = ()
 
 
 @dataclass
 class PetLocation(PetLocationData):
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
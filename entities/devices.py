@@ -15,7 +15,7 @@ from typing import Any
 from urllib.parse import urlparse
 
 from ..const import SURE_BATT_VOLTAGE_FULL, SURE_BATT_VOLTAGE_LOW
-from ..entities import SurepyEntity
+from ..entities import SurepyEntity, memoized
 from ..enums import BowlPosition, FoodType, LockState
 
 
@@ -26,9 +26,19 @@ logger: logging.Logger = logging.getLogger(__name__)
 class Hub(SurepyEntity):
     """Sure Petcare Hub."""
 
+    __slots__ = ("_online", "_serial")
+
+    def _parse(self) -> None:
+        super()._parse()
+
+        self._online: bool = bool(self._data.get("status", {}).get("online"))
+        self._serial: str | None = (
+            str(serial) if (serial := self._data.get("serial_number")) else None
+        )
+
     @property
     def online(self) -> bool:
-        return bool(self._data.get("status", {}).get("online"))
+        return self._online
 
     @property
     def parent_id(self) -> int | None:
@@ -37,7 +47,7 @@ class Hub(SurepyEntity):
     @property
     def serial(self) -> str | None:
         """ID of the household the pet belongs to."""
-        return str(serial) if (serial := self._data.get("serial_number")) else None
+        return self._serial
 
     @property
     def icon(self) -> str | None:
@@ -48,6 +58,22 @@ class Hub(SurepyEntity):
 class SurepyDevice(SurepyEntity, ABC):
     """Abstract Surepy base device"""
 
+    __slots__ = ("_serial", "_battery_voltage", "_battery_level")
+
+    def _parse(self) -> None:
+        super()._parse()
+
+        self._serial: str | None = (
+            str(serial) if (serial := self._data.get("serial_number")) else None
+        )
+
+        try:
+            self._battery_voltage: float | None = float(self._data["status"]["battery"])
+        except (KeyError, TypeError, ValueError):
+            self._battery_voltage = None
+
+        self._battery_level: int | None = self.calculate_battery_level()
+
     @property
     def parent_id(self) -> int | None:
         return self._data.get("parent_device_id", None)
@@ -55,13 +81,14 @@ class SurepyDevice(SurepyEntity, ABC):
     @property
     def serial(self) -> str | None:
         """ID of the household the pet belongs to."""
-        return str(serial) if (serial := self._data.get("serial_number")) else None
+        return self._serial
 
     @property
     def battery_level(self) -> int | None:
         """Return battery level in percent."""
-        return self.calculate_battery_level()
+        return self._battery_level
 
+    @memoized
     def calculate_battery_level(
         self,
         voltage_full: float = SURE_BATT_VOLTAGE_FULL,
@@ -70,16 +97,19 @@ class SurepyDevice(SurepyEntity, ABC):
     ) -> int | None:
         """Return battery voltage."""
 
+        if (battery_voltage := self._battery_voltage) is None:
+            logger.debug("error while calculating battery level: no battery voltage")
+            return None
+
         try:
             voltage_diff = voltage_full - voltage_low
-            battery_voltage = float(self._data["status"]["battery"])
             voltage_per_battery = battery_voltage / num_batteries
             voltage_per_battery_diff = voltage_per_battery - voltage_low
 
             # return batterie level between 0 and 100
             return max(min(int(voltage_per_battery_diff / voltage_diff * 100), 100), 0)
 
-        except (KeyError, TypeError, ValueError) as error:
+        except ZeroDivisionError as error:
             logger.debug("error while calculating battery level: %s", error)
             return None
 
@@ -87,43 +117,82 @@ class SurepyDevice(SurepyEntity, ABC):
 class FeederBowl:
     """Sure Petcare Felaqua."""
 
+    __slots__ = (
+        "_data",
+        "_name",
+        "_weight",
+        "_change",
+        "_target",
+        "_index",
+        "_food_type_id",
+        "_food_type",
+        "_position",
+    )
+
     def __init__(self, data: dict[str, int | float | str], feeder: Feeder):
-        """Initialize a Sure Petcare sensor."""
+        """Decode the bowl from the latest feeding."""
 
+        self._name = f"{feeder.name} Bowl {data['index']}"
         self._data: dict[str, int | float | str] = data
-        self._name = f"{feeder.name} Bowl {self._data['index']}"
+
+        self._weight: float | None = (
+            float(weight) if (weight := data.get("weight")) is not None else None
+        )
+        self._change: float | None = (
+            float(change) if (change := data.get("change")) is not None else None
+        )
+        self._target: int | None = int(data["target"]) if "target" in data else None
+        self._index: int | None = int(data["index"]) if "index" in data else None
+        self._food_type_id: int | None = (
+            int(data["food_type_id"]) if "food_type_id" in data else None
+        )
+
+        # decoded eagerly, so unknown values must not break the ingest
+        try:
+            self._food_type: str | None = (
+                FoodType(self._food_type_id).name.capitalize() if self._food_type_id else None
+            )
+        except ValueError:
+            self._food_type = None
+
+        try:
+            self._position: str | None = (
+                BowlPosition(self._index).name.capitalize() if self._index else None
+            )
+        except ValueError:
+            self._position = None
 
     @property
     def name(self) -> str:
         return self._name
 
     @property
-    def weight(self) -> float:
-        return float(self._data["weight"])
+    def weight(self) -> float | None:
+        return self._weight
 
     @property
-    def change(self) -> float:
-        return float(self._data["change"])
+    def change(self) -> float | None:
+        return self._change
 
     @property
     def target(self) -> int | None:
-        return int(self._data["target"]) if "target" in self._data else None
+        return self._target
 
     @property
     def index(self) -> int | None:
-        return int(self._data["index"]) if "index" in self._data else None
+        return self._index
 
     @property
     def food_type_id(self) -> int | None:
-        return int(self._data["food_type_id"]) if "food_type_id" in self._data else None
+        return self._food_type_id
 
     @property
     def food_type(self) -> str | None:
-        return FoodType(self.food_type_id).name.capitalize() if self.food_type_id else None
+        return self._food_type
 
     @property
     def position(self) -> str | None:
-        return BowlPosition(self.index).name.capitalize() if self.index else None
+        return self._position
 
     def raw_data(self) -> dict[str, int | float | str]:
         return self._data
@@ -131,7 +200,9 @@ class FeederBowl:
 class Tag:
     """Tags assigned to a device."""
 
-    def __init__(self, data: dict[str, int | float | str], feeder: Feeder):
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict[str, int | float | str]):
         """Initialize a Sure Petcare sensor."""
 
         self._data: dict[str, int | float | str] = data
@@ -161,30 +232,61 @@ class Tag:
 class Feeder(SurepyDevice):
     """Sure Petcare Cat- or Pet-Flap."""
 
-    def __init__(self, data: dict[str, Any]):
-        """Initialize a Sure Petcare sensor."""
-        super().__init__(data)
+    __slots__ = ("bowls", "tags", "_total_weight", "_predecessor")
 
-        self.bowls: dict[int, FeederBowl] = {}
+    def __init__(self, data: dict[str, Any], predecessor: Feeder | None = None):
+        """Initialize a Sure Petcare sensor.
 
-        self.add_bowls()
+        Bowls & tags with unchanged data are shared with the ``predecessor``,
+        like the entities they are never changed once built.
+        """
 
+        self.bowls: dict[int, FeederBowl] = {}
         self.tags: dict[int, Tag] = {}
+        self._predecessor = predecessor
 
+        super().__init__(data)
+
+        self._predecessor = None
+
+    def _parse(self) -> None:
+        super()._parse()
+
+        self.add_bowls()
         self.add_tags()
 
+    def _successor(self, data: dict[str, Any]) -> Feeder:
+        successor = type(self)(data, predecessor=self)
+        successor._generation = self._generation + 1
+
+        return successor
+
     @property
     def bowl_count(self) -> int:
         return len(self.bowls)
 
     @property
     def total_weight(self) -> float:
-        return sum([bowl.weight or 0.0 for bowl in self.bowls.values() if bowl.weight > 0.0])
+        return self._total_weight
 
     def add_bowls(self) -> None:
+        """Bowls of the latest feeding, those unchanged since the predecessor are reused."""
+        previous = self._predecessor.bowls if self._predecessor else {}
+
         if lunch := self._data.get("lunch"):
             for bowl in lunch.get("weights", []):
-                self.bowls[bowl["index"]] = FeederBowl(data=bowl, feeder=self)
+                if (
+                    (existing_bowl := previous.get(bowl["index"]))
+                    and existing_bowl.raw_data() == bowl
+                    and existing_bowl.name == f"{self.name} Bowl {bowl['index']}"
+                ):
+                    self.bowls[bowl["index"]] = existing_bowl
+                else:
+                    self.bowls[bowl["index"]] = FeederBowl(data=bowl, feeder=self)
+
+        self._total_weight: float = sum(
+            bowl.weight for bowl in self.bowls.values() if bowl.weight and bowl.weight > 0.0
+        )
 
     @property
     def icon(self) -> str | None:
@@ -192,34 +294,43 @@ class Feeder(SurepyDevice):
         return urlparse("https://surehub.io/assets/images/feeder-left-menu.png").geturl()
 
     def add_tags(self) -> None:
-        if tags := self._data.get("tags"):
-            for tag in tags:
-                self.tags[tag["index"]] = Tag(data=tag, feeder=self)
+        """Assigned tags, those unchanged since the predecessor are reused."""
+        previous = self._predecessor.tags if self._predecessor else {}
+
+        for tag in self._data.get("tags") or []:
+            if (existing_tag := previous.get(tag["index"])) and existing_tag.raw_data() == tag:
+                self.tags[tag["index"]] = existing_tag
+            else:
+                self.tags[tag["index"]] = Tag(data=tag)
 
 class Felaqua(SurepyDevice):
     """Sure Petcare Cat- or Pet-Flap."""
 
-    @property
-    def water_remaining(self) -> float | None:
-        remaining = None
+    __slots__ = ("_water_remaining", "_water_change")
+
+    def _parse(self) -> None:
+        super()._parse()
+
+        self._water_remaining: float | None = None
+        self._water_change: float | None = None
 
         try:
-            remaining = float(self._data["latest_drink"]["remaining"])
+            self._water_remaining = float(self._data["latest_drink"]["remaining"])
         except (KeyError, TypeError):
             pass
 
-        return remaining
-
-    @property
-    def water_change(self) -> float | None:
-        change = None
-
         try:
-            change = float(self._data["latest_drink"]["change"])
+            self._water_change = float(self._data["latest_drink"]["change"])
         except (KeyError, TypeError):
             pass
 
-        return change
+    @property
+    def water_remaining(self) -> float | None:
+        return self._water_remaining
+
+    @property
+    def water_change(self) -> float | None:
+        return self._water_change
 
     @property
     def icon(self) -> str | None:
@@ -230,25 +341,36 @@ class Felaqua(SurepyDevice):
 class Flap(SurepyDevice):
     """Sure Petcare Cat- or Pet-Flap."""
 
-    @property
-    def state(self) -> LockState:
-        return LockState(self._data["status"]["locking"]["mode"])
+    __slots__ = ("_state", "_icon")
 
-    @property
-    def unlocked(self) -> bool:
-        return self.state in [LockState.UNLOCKED, LockState.CURFEW_UNLOCKED]
+    def _parse(self) -> None:
+        super()._parse()
 
-    @property
-    def icon(self) -> str | None:
-        """Icon of the Pet/Cap Flap."""
+        try:
+            self._state: LockState | None = LockState(self._data["status"]["locking"]["mode"])
+        except (KeyError, TypeError, ValueError):
+            self._state = None
 
         icon_url = "https://surehub.io/assets/images/petdoor-left-menu.png"
 
-        if self.state == LockState.LOCKED_ALL:
+        if self._state == LockState.LOCKED_ALL:
             icon_url = "https://surehub.io/assets/images/both-ways-icon.svg"
-        elif self.state == LockState.LOCKED_IN:
+        elif self._state == LockState.LOCKED_IN:
             icon_url = "https://surehub.io/assets/images/inside-icon.svg"
-        elif self.state == LockState.LOCKED_OUT:
+        elif self._state == LockState.LOCKED_OUT:
             icon_url = "https://surehub.io/assets/images/outside-icon.svg"
 
-        return urlparse(icon_url).geturl()
\ No newline at end of file
+        self._icon: str = urlparse(icon_url).geturl()
+
+    @property
+    def state(self) -> LockState | None:
+        return self._state
+
+    @property
+    def unlocked(self) -> bool:
+        return self._state in [LockState.UNLOCKED, LockState.CURFEW_UNLOCKED]
+
+    @property
+    def icon(self) -> str | None:
+        """Icon of the Pet/Cap Flap."""
+        return self._icon
\ No newline at end of file
@@ -18,6 +18,14 @@ from ..entities.states import PetState
 from ..enums import EntityType, FoodType, Location
 
 
+def _location(where: int | None) -> Location:
+    """Location of an api payload, unknown for missing or unknown values."""
+    try:
+        return Location(where) if where is not None else Location.UNKNOWN
+    except ValueError:
+        return Location.UNKNOWN
+
+
 class Pet(SurepyEntity):
     """
     Represents pet. Contains attributes of the pet.
@@ -31,19 +39,87 @@ class Pet(SurepyEntity):
 
     """
 
-    def __init__(self, data: dict[str, Any]):
+    __slots__ = (
+        "pet_id",
+        "state",
+        "_tag_id",
+        "_food_type",
+        "_updated_at",
+        "_photo_url",
+        "_location",
+        "_activity",
+        "_feeding",
+        "_drinking",
+    )
 
-        super().__init__(data=data)
+    def __init__(self, data: dict[str, Any]):
 
         self.pet_id: int = int(data["id"])
 
+        super().__init__(data=data)
+
         self._type: EntityType = EntityType.PET
-        self._data: dict[str, Any] = data
 
-        self._name = str(name) if (name := self._data.get("name")) else "Unnamed"
+    def _parse(self) -> None:
+        super()._parse()
+
+        data = self._data
+
+        self._name = str(name) if (name := data.get("name")) else "Unnamed"
 
         self.state = PetState(data["status"]) if "status" in data else "Unknown"
 
+        self._tag_id: int | None = int(tag_id) if (tag_id := data.get("tag_id")) else None
+
+        # decoded eagerly, so unknown values must not break the ingest
+        try:
+            # pylint: disable=used-before-assignment
+            self._food_type: str | None = (
+                str(FoodType(type_id)) if (type_id := data.get("food_type_id")) else None
+            )
+        except ValueError:
+            self._food_type = None
+
+        self._updated_at: datetime | None = (
+            datetime.fromisoformat(updated_at) if (updated_at := data.get("updated_at")) else None
+        )
+
+        self._photo_url: str = urlparse(
+            photo_url
+            if (photo_url := data.get("photo", {}).get("location"))
+            else "https://surehub.io/assets/images/no-pet-pic-dark.svg"
+        ).geturl()
+
+        position = data.get("position", {})
+        # pylint: disable=no-member
+        self._location = PetLocation(
+            where=_location(position.get("where")),
+            since=position.get("since", None),
+        )
+
+        status = data.get("status", {})
+
+        activity = status.get("activity", {})
+        # pylint: disable=no-member
+        self._activity = PetActivity(
+            where=_location(activity.get("where")),
+            since=activity.get("since", None),
+        )
+
+        self._feeding: StateFeeding | None = None
+        if feeding := status.get("feeding", {}):
+            self._feeding = StateFeeding(
+                change=feeding.get("change", [0.0, 0.0]),
+                at=datetime.fromisoformat(at) if (at := feeding.get("at")) else None,
+            )
+
+        self._drinking: StateDrinking | None = None
+        if drinking := status.get("drinking", {}):
+            self._drinking = StateDrinking(
+                change=drinking.get("change", [0.0]),
+                at=datetime.fromisoformat(at) if (at := drinking.get("at")) else None,
+            )
+
     @property
     def id(self) -> int:
         """ID of the household the pet belongs to."""
@@ -52,85 +128,52 @@ class Pet(SurepyEntity):
     @property
     def tag_id(self) -> int | None:
         """ID of the household the pet belongs to."""
-        return int(tag_id) if (tag_id := self._data.get("tag_id")) else None
+        return self._tag_id
 
     @property
     def food_type(self) -> str | None:
         """Type of food."""
-        # pylint: disable=used-before-assignment
-        return str(FoodType(type_id)) if (type_id := self._data.get("food_type_id")) else None
+        return self._food_type
 
     @property
     def updated_at(self) -> datetime | None:
         """Type of food."""
-        return (
-            datetime.fromisoformat(updated_at)
-            if (updated_at := self._data.get("updated_at"))
-            else None
-        )
+        return self._updated_at
 
     @property
     def photo_url(self) -> str | None:
         """Picture of the Pet."""
-        picture_url = (
-            photo_url
-            if (photo_url := self._data.get("photo", {}).get("location"))
-            else "https://surehub.io/assets/images/no-pet-pic-dark.svg"
-        )
-
-        return urlparse(picture_url).geturl()
+        return self._photo_url
 
     @property
     def at_home(self) -> bool:
         """Location of the Pet."""
-        return bool(self.location.where == Location.INSIDE)
+        return bool(self._location.where == Location.INSIDE)
 
     @property
     def location(self) -> PetLocation:
         """Location of the Pet."""
-        position = self._data.get("position", {})
-        # pylint: disable=no-member
-        return PetLocation(
-            where=Location(position.get("where", Location.UNKNOWN.value)),
-            since=position.get("since", None),
-        )
+        return self._location
 
     @property
     def activity(self) -> PetActivity:
         """Last Activity of the Pet."""
-        activity = self._data.get("status", {}).get("activity", {})
-        # pylint: disable=no-member
-        return PetActivity(
-            where=Location(activity.get("where", Location.UNKNOWN.value)),
-            since=activity.get("since", None),
-        )
+        return self._activity
 
     @property
     def feeding(self) -> StateFeeding | None:
         """Last Activity of the Pet."""
-        if activity := self._data.get("status", {}).get("feeding", {}):
-            return StateFeeding(
-                change=activity.get("change", [0.0, 0.0]),
-                at=datetime.fromisoformat(activity.get("at", None)),
-            )
-
-        return None
+        return self._feeding
 
     @property
     def drinking(self) -> StateDrinking | None:
         """Last Activity of the Pet."""
-        if activity := self._data.get("status", {}).get("drinking", {}):
-            return StateDrinking(
-                change=activity.get("change", [0.0]),
-                at=datetime.fromisoformat(activity.get("at", None)),
-            )
-
-        return None
+        return self._drinking
 
     @property
     def last_lunch(self) -> datetime | None:
-        return self.feeding.at if self.feeding else None
+        return self._feeding.at if self._feeding else None
 
     @property
     def last_drink(self) -> datetime | None:
-        return self.drinking.at if self.drinking else None
+        return self._drinking.at if self._drinking else None
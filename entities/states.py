@@ -18,6 +18,8 @@ from ..enums import Location
 class PetState(ABC):
     """abstract surepy state."""
 
+    __slots__ = ("activity", "drinking", "feeding")
+
     def __init__(self, state: dict[str, dict[str, Any]]):
         self.activity: ActivityState | None = (
             ActivityState(state=state["activity"]) if "activity" in state else None
@@ -33,6 +35,8 @@ class PetState(ABC):
 class ActivityState:
     """surepy activity state."""
 
+    __slots__ = ("device_id", "tag_id", "since", "where")
+
     def __init__(self, state: dict[str, Any]):
         self.device_id = state.get("device_id")
         self.tag_id = state.get("tag_id")
@@ -45,6 +49,8 @@ class ActivityState:
 class DrinkingState:
     """surepy drinking state."""
 
+    __slots__ = ("device_id", "tag_id", "at", "change")
+
     def __init__(self, state: dict[str, Any]):
         self.device_id = state.get("device_id")
         self.tag_id = state.get("tag_id")
@@ -55,6 +61,8 @@ class DrinkingState:
 class FeedingState:
     """surepy feeding state."""
 
+    __slots__ = ("device_id", "tag_id", "at", "changes", "change_bowl_one", "change_bowl_two")
+
     def __init__(self, state: dict[str, Any]):
         self.device_id = state.get("device_id")
         self.tag_id = state.get("tag_id")
@@ -0,0 +1,137 @@
+"""Base entity for SureHA platforms."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import (
+    ATTR_FULL_RAW_ATTRIBUTES,
+    ATTR_LAST_REFRESH,
+    DEVICE_ATTRIBUTES,
+    PET_ATTRIBUTES,
+    TOPIC_UPDATE,
+)
+from .entities import SurepyEntity
+from .enums import EntityType
+
+if TYPE_CHECKING:
+    from . import SurePetcareAPI
+
+
+def signal_entity_update(tier: str, surepy_id: int) -> str:
+    """Dispatcher signal sent when a Sure entity changed in a polling tier."""
+    return f"{TOPIC_UPDATE}_{tier}_{surepy_id}"
+
+
+def signal_poll_interval(tier: str) -> str:
+    """Dispatcher signal sent when the effective poll interval of a tier changed."""
+    return f"{TOPIC_UPDATE}_{tier}_poll_interval"
+
+
+class SureCoordinatorEntity(CoordinatorEntity):
+    """Coordinator entity that is only woken up if its Sure entity changed.
+
+    Instead of listening to every refresh of the coordinator, the entity
+    subscribes to the dispatcher signal of the Sure entity (pet/device) it
+    renders, which is only sent for entities in the change set of a refresh.
+    """
+
+    _spc: SurePetcareAPI
+
+    def __init__(self, coordinator, surepy_id: int) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+
+        # id of the Sure entity this entity renders (the feeder for its bowls)
+        self._surepy_id: int = surepy_id
+
+        # fingerprint of the last written state & attributes
+        self._written_fingerprint: int | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the changes of the Sure entity."""
+
+        # skip CoordinatorEntity.async_added_to_hass, it listens to every refresh
+        await Entity.async_added_to_hass(self)
+
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                signal_entity_update(self.coordinator.tier, self._surepy_id),
+                self._handle_coordinator_update,
+            )
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return if the Sure entity is still known and the last refresh succeeded."""
+        return super().available and self._surepy_id in (self.coordinator.data or {})
+
+    @property
+    def state_attributes(self) -> dict[str, Any] | None:
+        """Mark the state as stale while the last good data is served."""
+
+        attrs = super().state_attributes
+
+        if self.coordinator.last_success_at and self.coordinator.stale_since:
+            attrs = {
+                **(attrs or {}),
+                ATTR_LAST_REFRESH: self.coordinator.last_success_at.isoformat(),
+            }
+
+        return attrs
+
+    @property
+    def _full_raw_attributes(self) -> bool:
+        """If the whole api payload is requested as attributes in the options."""
+        return bool(self._spc.config_entry.options.get(ATTR_FULL_RAW_ATTRIBUTES, False))
+
+    def _projected_attributes(self, surepy_entity: SurepyEntity) -> dict[str, Any]:
+        """Attributes taken over from the api payload of a Sure entity.
+
+        A compact set of fields per entity type, the whole (nested) payload only
+        if requested in the options as it is stored with every state change.
+        """
+
+        if self._full_raw_attributes:
+            return surepy_entity.memoized(
+                "full_raw_attributes", lambda: {**surepy_entity.raw_data()}
+            )
+
+        return surepy_entity.memoized(
+            "projected_attributes",
+            lambda: surepy_entity.projected_data(
+                PET_ATTRIBUTES if surepy_entity.type == EntityType.PET else DEVICE_ATTRIBUTES
+            ),
+        )
+
+    def _state_fingerprint(self) -> int:
+        """Hash of everything this entity renders into the state machine."""
+
+        if not self.available:
+            return hash(False)
+
+        rendered: tuple[Any, ...] = (
+            self.state,
+            self.entity_picture,
+            self.icon,
+            repr(self.extra_state_attributes),
+            self.coordinator.stale_since,
+        )
+
+        return hash(rendered)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if something rendered has changed."""
+
+        if (fingerprint := self._state_fingerprint()) == self._written_fingerprint:
+            self.coordinator.skipped_writes += 1
+            return
+
+        self._written_fingerprint = fingerprint
+        self.async_write_ha_state()
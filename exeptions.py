@@ -7,4 +7,16 @@ class SurePetcareConnectionError(SurePetcareError):
 
 
 class SurePetcareAuthenticationError(SurePetcareError):
-    """When a authentication error is encountered."""
\ No newline at end of file
+    """When a authentication error is encountered."""
+
+
+class SurePetcareServerError(SurePetcareConnectionError):
+    """When the API is throttling (429) or failing (5xx)."""
+
+    def __init__(self, status: int, *args: object) -> None:
+        super().__init__(status, *args)
+        self.status = status
+
+
+class SurePetcareCircuitOpenError(SurePetcareConnectionError):
+    """When requests to an endpoint fail fast because it keeps failing."""
@@ -0,0 +1,62 @@
+"""
+surepy.fanout
+====================================
+Bounded fan-out of the per-household fetches.
+
+|license-info|
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from typing import Any, Awaitable
+
+import async_timeout
+
+from .const import HOUSEHOLD_CONCURRENCY, HOUSEHOLD_TIMEOUT
+from .exeptions import SurePetcareAuthenticationError, SurePetcareError
+
+
+# get a logger
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class HouseholdFanOut:
+    """Runs per-household fetches concurrently, each within its own time budget."""
+
+    def __init__(
+        self, concurrency: int = HOUSEHOLD_CONCURRENCY, timeout: float = HOUSEHOLD_TIMEOUT
+    ) -> None:
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.timeout: float = timeout
+
+    async def fetch(self, household_id: int, fetch: Awaitable[Any]) -> Any:
+        """Run a per-household fetch within the fan-out limit and its own time budget.
+
+        The budget includes the wait for the fan-out limit, so a household queued
+        behind slow ones is skipped instead of running past the refresh timeout.
+        Failures are logged and isolated to the household (None is returned), only
+        authentication errors are passed on as they affect every household.
+        """
+
+        try:
+            async with async_timeout.timeout(self.timeout):
+                async with self._semaphore:
+                    return await fetch
+
+        except SurePetcareAuthenticationError:
+            raise
+        except (SurePetcareError, asyncio.TimeoutError) as error:
+            logger.warning(
+                "🐾 \x1b[38;2;255;26;102m·\x1b[0m skipping household %s: %s",
+                household_id,
+                repr(error),
+            )
+            return None
+
+        finally:
+            # never started if the budget ran out while waiting for the fan-out limit
+            if asyncio.iscoroutine(fetch):
+                fetch.close()
@@ -0,0 +1,170 @@
+"""
+surepy.ratelimit
+====================================
+Token bucket limiting the request rate to the Sure Petcare api.
+
+|license-info|
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+
+from itertools import count
+from time import monotonic
+from typing import Any
+
+from .const import RATE_LIMIT, RATE_LIMIT_BURST
+
+
+# get a logger
+logger: logging.Logger = logging.getLogger(__name__)
+
+# buckets shared by all clients of an account (or host without an account)
+_BUCKETS: dict[tuple[str, str | None], TokenBucket] = {}
+
+
+class TokenBucket:
+    """Lets ``burst`` requests through at once, then ``rate`` requests per second.
+
+    Requests that find the bucket empty queue up and are let through by
+    priority (lower first) as tokens come in, in arrival order (FIFO) within a
+    priority. A newcomer never takes a token while requests of its own or a
+    higher priority are waiting, so a control write is not held up by a queue
+    of background polls. A waiter cancelled after it got its token hands it on
+    to the head of the queue.
+    """
+
+    def __init__(self, rate: float = RATE_LIMIT, burst: int = RATE_LIMIT_BURST) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"invalid rate limit: {rate}/s, burst {burst}")
+
+        self.rate = rate
+        self.burst = burst
+
+        self._tokens: float = burst
+        self._updated: float = monotonic()
+
+        # requests waiting for a token, by priority & arrival, and the timer of the next token
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = count()
+        self._wakeup: asyncio.TimerHandle | None = None
+
+        # metrics
+        self.requests: int = 0
+        self.delayed: int = 0
+        self.total_wait: float = 0.0
+        self.max_wait: float = 0.0
+
+    @property
+    def waiting(self) -> int:
+        """Requests waiting for a token."""
+        return sum(not waiter.done() for _, _, waiter in self._waiters)
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, priority: int = 0) -> float:
+        """Wait for a token, lower ``priority`` first, returns the seconds waited."""
+
+        self.requests += 1
+
+        start = monotonic()
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+
+        self._dispatch()
+
+        if waiter.done():
+            # a token was available and nobody of the same or a higher priority waiting
+            return 0.0
+
+        self.delayed += 1
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the token was handed over just before the cancellation, pass it on
+                self._tokens += 1
+                self._dispatch()
+            raise
+
+        wait = monotonic() - start
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+        logger.debug("🐾 \x1b[38;2;0;255;0m·\x1b[0m rate limited for %.2fs", wait)
+
+        return wait
+
+    def _dispatch(self) -> None:
+        """Hand the available tokens to the waiters by priority, wake up for the next one."""
+
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+        self._refill()
+
+        while self._waiters:
+            _, _, waiter = self._waiters[0]
+
+            if waiter.done():
+                # cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+
+            if self._tokens < 1:
+                self._wakeup = asyncio.get_running_loop().call_later(
+                    (1 - self._tokens) / self.rate, self._dispatch
+                )
+                break
+
+            heapq.heappop(self._waiters)
+            self._tokens -= 1
+            waiter.set_result(None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Configuration & wait metrics for diagnostics."""
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "requests": self.requests,
+            "delayed": self.delayed,
+            "waiting": self.waiting,
+            "total_wait": round(self.total_wait, 3),
+            "max_wait": round(self.max_wait, 3),
+        }
+
+
+def shared_bucket(
+    host: str, account: str | None = None, rate: float = RATE_LIMIT, burst: int = RATE_LIMIT_BURST
+) -> TokenBucket:
+    """The bucket of an account on a host, created with ``rate`` & ``burst`` by its first user.
+
+    Later users asking for other limits share the existing bucket as it is, the
+    mismatch is logged: the account's limit holds for all of its clients.
+    """
+
+    key = (host, account.lower() if account else None)
+
+    if (bucket := _BUCKETS.get(key)) is None:
+        bucket = _BUCKETS[key] = TokenBucket(rate, burst)
+
+    elif (bucket.rate, bucket.burst) != (rate, burst):
+        logger.warning(
+            "🐾 \x1b[38;2;255;26;102m·\x1b[0m rate limit of %s already shared at %s/s, burst %d:"
+            " ignoring %s/s, burst %d",
+            host,
+            bucket.rate,
+            bucket.burst,
+            rate,
+            burst,
+        )
+
+    return bucket
@@ -0,0 +1,134 @@
+"""
+surepy.resilience
+====================================
+Retries with backoff and circuit breakers for the Sure Petcare api.
+
+|license-info|
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import re
+
+from time import monotonic
+from typing import Any
+from urllib.parse import urlparse
+
+from .const import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_TIMEOUT,
+    RETRY_ATTEMPTS,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_CAP,
+)
+
+
+# get a logger
+logger: logging.Logger = logging.getLogger(__name__)
+
+# http methods that can be sent again without changing the outcome
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE", "OPTIONS"})
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint(resource: str) -> str:
+    """Endpoint of a resource, its host and path with the ids masked.
+
+    >>> endpoint("https://app.api.surehub.io/api/report/household/1234?page=2")
+    'app.api.surehub.io/api/report/household/{id}'
+    """
+    url = urlparse(resource)
+    return f"{url.netloc}{_ID_SEGMENT.sub('/{id}', url.path)}"
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, the n-th retry waits up to ``base * 2**n``."""
+
+    def __init__(
+        self,
+        attempts: int = RETRY_ATTEMPTS,
+        base: float = RETRY_BACKOFF_BASE,
+        cap: float = RETRY_BACKOFF_CAP,
+    ) -> None:
+        self.attempts = attempts
+        self.base = base
+        self.cap = cap
+
+    def backoff(self, retry: int) -> float:
+        """Seconds to wait before the ``retry``-th retry (starting at 0)."""
+        return random.uniform(0, min(self.cap, self.base * 2**retry))  # nosec
+
+
+class CircuitBreaker:
+    """Fails fast while an endpoint keeps failing.
+
+    Opens after ``failure_threshold`` consecutive failures. Once ``reset_timeout``
+    has passed a single probe is let through (half open), its success closes
+    the breaker again, its failure keeps it open for another ``reset_timeout``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state: str = BREAKER_CLOSED
+        self.failures: int = 0
+        self.opened_at: float | None = None
+
+        # metrics
+        self.retries: int = 0
+        self.rejected: int = 0
+        self.trips: int = 0
+
+    def allow(self) -> bool:
+        """If a request may be sent now."""
+
+        if self.state == BREAKER_CLOSED:
+            return True
+
+        if self.opened_at is not None and monotonic() - self.opened_at >= self.reset_timeout:
+            # a single probe, another one only if it has not come back within the timeout
+            self.state = BREAKER_HALF_OPEN
+            self.opened_at = monotonic()
+            return True
+
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+
+        if self.state == BREAKER_HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state == BREAKER_CLOSED:
+                self.trips += 1
+            self.state = BREAKER_OPEN
+            self.opened_at = monotonic()
+
+    def as_dict(self) -> dict[str, Any]:
+        """State & counters for diagnostics."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "open_for": (
+                round(monotonic() - self.opened_at, 1) if self.opened_at is not None else None
+            ),
+            "trips": self.trips,
+            "retries": self.retries,
+            "rejected": self.rejected,
+        }
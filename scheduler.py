@@ -0,0 +1,151 @@
+"""
+surepy.scheduler
+====================================
+Priority scheduling of the requests to the Sure Petcare api.
+
+|license-info|
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+
+from contextlib import asynccontextmanager
+from itertools import count
+from time import monotonic
+from typing import Any, AsyncIterator
+
+from .const import REQUEST_CONCURRENCY, REQUEST_CONTROL_RESERVED
+
+
+# get a logger
+logger: logging.Logger = logging.getLogger(__name__)
+
+# priority classes, lower goes first
+PRIORITY_CONTROL = 0
+PRIORITY_STATE = 1
+PRIORITY_REPORTS = 2
+PRIORITY_TIMELINE = 3
+
+PRIORITY_NAMES = {
+    PRIORITY_CONTROL: "control",
+    PRIORITY_STATE: "state",
+    PRIORITY_REPORTS: "reports",
+    PRIORITY_TIMELINE: "timeline",
+}
+
+
+def default_priority(method: str) -> int:
+    """Writes are control commands, reads state polls unless told otherwise."""
+    return PRIORITY_STATE if method == "GET" else PRIORITY_CONTROL
+
+
+class RequestScheduler:
+    """Bounds the requests in flight and starts waiting requests by priority.
+
+    Up to ``concurrency`` requests are sent at once, ``control_reserved`` of
+    these slots are kept free for control writes so a lock command never
+    waits behind background polls. Waiting requests of the same priority
+    start in arrival order.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = REQUEST_CONCURRENCY,
+        control_reserved: int = REQUEST_CONTROL_RESERVED,
+    ) -> None:
+        if concurrency < 1 or not 0 <= control_reserved < concurrency:
+            raise ValueError(
+                f"invalid request concurrency: {concurrency}, reserved {control_reserved}"
+            )
+
+        self.concurrency = concurrency
+        self.control_reserved = control_reserved
+
+        self.active: int = 0
+        self._waiting: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = count()
+
+        # metrics per priority class
+        self.requests: dict[int, int] = dict.fromkeys(PRIORITY_NAMES, 0)
+        self.total_wait: dict[int, float] = dict.fromkeys(PRIORITY_NAMES, 0.0)
+        self.max_wait: dict[int, float] = dict.fromkeys(PRIORITY_NAMES, 0.0)
+
+    def _can_start(self, priority: int) -> bool:
+        limit = self.concurrency - (0 if priority == PRIORITY_CONTROL else self.control_reserved)
+        return self.active < limit
+
+    @asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_STATE) -> AsyncIterator[None]:
+        """Hold one of the request slots."""
+
+        start = monotonic()
+
+        await self._acquire(priority)
+
+        wait = monotonic() - start
+        self.requests[priority] = self.requests.get(priority, 0) + 1
+        self.total_wait[priority] = self.total_wait.get(priority, 0.0) + wait
+        self.max_wait[priority] = max(self.max_wait.get(priority, 0.0), wait)
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiting, (priority, next(self._sequence), waiter))
+
+        self._dispatch()
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was handed over just before the cancellation
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        self.active -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Hand the free slots to the waiting requests, highest priority first."""
+
+        while self._waiting:
+            priority, _, waiter = self._waiting[0]
+
+            if waiter.done():
+                # cancelled while waiting
+                heapq.heappop(self._waiting)
+                continue
+
+            if not self._can_start(priority):
+                # lower priorities can not start either
+                break
+
+            heapq.heappop(self._waiting)
+            self.active += 1
+            waiter.set_result(None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Slots in use, queue & waits per priority for diagnostics."""
+        return {
+            "concurrency": self.concurrency,
+            "control_reserved": self.control_reserved,
+            "active": self.active,
+            "waiting": sum(not waiter.done() for _, _, waiter in self._waiting),
+            "priorities": {
+                name: {
+                    "requests": self.requests.get(priority, 0),
+                    "total_wait": round(self.total_wait.get(priority, 0.0), 3),
+                    "max_wait": round(self.max_wait.get(priority, 0.0), 3),
+                }
+                for priority, name in PRIORITY_NAMES.items()
+            },
+        }
@@ -3,17 +3,22 @@ from __future__ import annotations
 
 from typing import Any, cast
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_VOLTAGE,
-    DEVICE_CLASS_BATTERY,
-    MASS_GRAMS,
     PERCENTAGE,
-    VOLUME_MILLILITERS,
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    UnitOfElectricPotential,
+    UnitOfMass,
+    UnitOfVolume,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.entity import EntityCategory
 from .entities import SurepyEntity
 from .entities.devices import (
     Feeder as SureFeeder,
@@ -34,7 +39,10 @@ from .const import (
     SURE_BATT_VOLTAGE_FULL,
     SURE_BATT_VOLTAGE_LOW,
     SURE_MANUFACTURER,
+    TIER_REPORTS,
+    TIER_TIMELINE,
 )
+from .entity import SureCoordinatorEntity
 
 PARALLEL_UPDATES = 2
 
@@ -54,7 +62,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up config entry Sure PetCare Flaps sensors."""
 
-    entities: list[Flap | Felaqua | Feeder | FeederBowl | Battery] = []
+    entities: list[SurePetcareSensor] = []
 
     spc: SurePetcareAPI = hass.data[DOMAIN][SPC]
 
@@ -67,16 +75,21 @@ async def async_setup_entry(
             entities.append(Flap(spc.coordinator, surepy_entity.id, spc))
 
         elif surepy_entity.type == EntityType.FELAQUA:
-            entities.append(Felaqua(spc.coordinator, surepy_entity.id, spc))
+            entities.append(
+                Felaqua(spc.coordinators[TIER_TIMELINE], surepy_entity.id, spc)
+            )
 
         elif surepy_entity.type == EntityType.FEEDER:
 
+            # bowl weights are reported with the latest feeding
+            reports_coordinator = spc.coordinators[TIER_REPORTS]
+
             for bowl in surepy_entity.bowls.values():
                 entities.append(
-                    FeederBowl(spc.coordinator, surepy_entity.id, spc, bowl.raw_data())
+                    FeederBowl(reports_coordinator, surepy_entity.id, spc, bowl.raw_data())
                 )
 
-            entities.append(Feeder(spc.coordinator, surepy_entity.id, spc))
+            entities.append(Feeder(reports_coordinator, surepy_entity.id, spc))
 
         if surepy_entity.type in [
             EntityType.CAT_FLAP,
@@ -103,17 +116,31 @@ async def async_setup_entry(
                 )
             )
 
+            # volatile values as numeric sensors instead of (recorded) attribute strings
+            entities.append(Voltage(spc.coordinator, surepy_entity.id, spc))
+            entities.append(
+                SignalStrength(spc.coordinator, surepy_entity.id, spc, "device_rssi")
+            )
+            entities.append(
+                SignalStrength(spc.coordinator, surepy_entity.id, spc, "hub_rssi")
+            )
+
     async_add_entities(entities)
 
 
-class SurePetcareSensor(CoordinatorEntity, SensorEntity):
+class SurePetcareSensor(SureCoordinatorEntity, SensorEntity):
     """A binary sensor implementation for Sure Petcare Entities."""
 
     _attr_should_poll = False
 
+    # raw api data changing with (almost) every poll, not worth recording
+    _unrecorded_attributes = frozenset(
+        {"status", "position", "updated_at", "move", "lunch", "drink", "latest_drink"}
+    )
+
     def __init__(self, coordinator, _id: int, spc: SurePetcareAPI):
         """Initialize a Sure Petcare sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, _id)
 
         self._id = _id
         self._spc: SurePetcareAPI = spc
@@ -127,7 +154,7 @@ class SurePetcareSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"{self._surepy_entity.household_id}-{self._id}"
 
         self._attr_extra_state_attributes = (
-            {**self._surepy_entity.raw_data()} if self._state else {}
+            self._projected_attributes(self._surepy_entity) if self._state else {}
         )
 
         self._attr_name: str = (
@@ -191,7 +218,7 @@ class Flap(SurePetcareSensor):
         if self._state:
             self._attr_extra_state_attributes = {
                 "learn_mode": bool(self._state["learn_mode"]),
-                **self._surepy_entity.raw_data(),
+                **self._projected_attributes(self._surepy_entity),
             }
 
             if locking := self._state.get("locking"):
@@ -200,12 +227,10 @@ class Flap(SurePetcareSensor):
     @property
     def state(self) -> str | None:
         """Return battery level in percent."""
-        if (
-            state := cast(SureFlap, self._coordinator.data[self._id])
-            .raw_data()
-            .get("status")
-        ):
-            return LockState(state["locking"]["mode"]).name.casefold()
+        if lock_state := cast(SureFlap, self._coordinator.data[self._id]).state:
+            return lock_state.name.casefold()
+
+        return None
 
 
 class Felaqua(SurePetcareSensor):
@@ -217,7 +242,7 @@ class Felaqua(SurePetcareSensor):
         self._surepy_entity: SureFelaqua
 
         self._attr_entity_picture = self._surepy_entity.icon
-        self._attr_unit_of_measurement = VOLUME_MILLILITERS
+        self._attr_unit_of_measurement = UnitOfVolume.MILLILITERS
 
     @property
     def state(self) -> float | None:
@@ -259,11 +284,13 @@ class FeederBowl(SurePetcareSensor):
         )
 
         self._attr_icon = "mdi:bowl"
-        self._attr_state = int(self._surepy_entity.weight)
+        self._attr_state = (
+            int(weight) if (weight := self._surepy_entity.weight) is not None else None
+        )
         self._attr_unique_id = (
             f"{self._surepy_feeder_entity.household_id}-{self.feeder_id}-{self.bowl_id}"
         )
-        self._attr_unit_of_measurement = MASS_GRAMS
+        self._attr_unit_of_measurement = UnitOfMass.GRAMS
 
     @property
     def state(self) -> float | None:
@@ -284,7 +311,7 @@ class Feeder(SurePetcareSensor):
         self._surepy_entity: SureFeeder
 
         self._attr_entity_picture = self._surepy_entity.icon
-        self._attr_unit_of_measurement = MASS_GRAMS
+        self._attr_unit_of_measurement = UnitOfMass.GRAMS
 
     @property
     def state(self) -> float | None:
@@ -296,6 +323,11 @@ class Feeder(SurePetcareSensor):
 class Battery(SurePetcareSensor):
     """Sure Petcare Flap."""
 
+    # voltages change with every poll and are available as their own sensor
+    _unrecorded_attributes = SurePetcareSensor._unrecorded_attributes | frozenset(
+        {"battery_level", ATTR_VOLTAGE, f"{ATTR_VOLTAGE}_per_battery"}
+    )
+
     def __init__(
         self,
         coordinator,
@@ -314,7 +346,8 @@ class Battery(SurePetcareSensor):
         self.voltage_full = voltage_full
 
         self._attr_unit_of_measurement = PERCENTAGE
-        self._attr_device_class = DEVICE_CLASS_BATTERY
+        self._attr_device_class = SensorDeviceClass.BATTERY
+        self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_unique_id = (
             f"{self._surepy_entity.household_id}-{self._surepy_entity.id}-battery"
         )
@@ -346,10 +379,74 @@ class Battery(SurePetcareSensor):
 
             voltage = float(state["battery"])
 
-            attrs = {
-                "battery_level": device.battery_level,
-                ATTR_VOLTAGE: f"{voltage:.2f}",
-                f"{ATTR_VOLTAGE}_per_battery": f"{voltage / 4:.2f}",
-            }
+            attrs = device.memoized(
+                "battery_attributes",
+                lambda: {
+                    "battery_level": device.battery_level,
+                    ATTR_VOLTAGE: f"{voltage:.2f}",
+                    f"{ATTR_VOLTAGE}_per_battery": f"{voltage / 4:.2f}",
+                },
+            )
 
         return attrs
+
+
+class Voltage(SurePetcareSensor):
+    """Sure Petcare battery voltage."""
+
+    def __init__(self, coordinator, _id: int, spc: SurePetcareAPI):
+        super().__init__(coordinator, _id, spc)
+
+        self._surepy_entity: SurepyDevice
+
+        self._attr_name = f"{self._attr_name} Voltage"
+        self._attr_extra_state_attributes = {}
+
+        self._attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
+        self._attr_device_class = SensorDeviceClass.VOLTAGE
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_unique_id = (
+            f"{self._surepy_entity.household_id}-{self._surepy_entity.id}-voltage"
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the voltage of all batteries."""
+
+        if (device := cast(SurepyDevice, self._coordinator.data[self._id])) and (
+            state := device.raw_data().get("status")
+        ):
+            return round(float(state["battery"]), 2) if "battery" in state else None
+
+
+class SignalStrength(SurePetcareSensor):
+    """Sure Petcare device or hub signal strength."""
+
+    def __init__(self, coordinator, _id: int, spc: SurePetcareAPI, rssi: str):
+        super().__init__(coordinator, _id, spc)
+
+        self._surepy_entity: SurepyDevice
+
+        # "device_rssi" or "hub_rssi"
+        self._rssi = rssi
+
+        self._attr_name = f"{self._attr_name} {rssi.replace('_rssi', '').title()} RSSI"
+        self._attr_extra_state_attributes = {}
+
+        self._attr_native_unit_of_measurement = SIGNAL_STRENGTH_DECIBELS_MILLIWATT
+        self._attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_unique_id = (
+            f"{self._surepy_entity.household_id}-{self._surepy_entity.id}-{rssi}"
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the signal strength in dBm."""
+
+        if (device := cast(SurepyDevice, self._coordinator.data[self._id])) and (
+            signal := device.raw_data().get("status", {}).get("signal", {})
+        ):
+            return round(float(signal[self._rssi]), 2) if self._rssi in signal else None
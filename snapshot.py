@@ -0,0 +1,84 @@
+"""Warm-start snapshot of the Sure Petcare data."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    SNAPSHOT_MAX_AGE,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_VERSION,
+)
+
+if TYPE_CHECKING:
+    from . import Surepy
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SureSnapshotStore:
+    """Persists the entities of a config entry.
+
+    At startup the platforms are set up from the restored snapshot while the
+    first refresh runs in the background. The snapshot is saved (debounced) when
+    a refresh changed something and on shutdown.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, surepy: Surepy) -> None:
+        """Initialize the snapshot store."""
+        self._store = Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot")
+        self._surepy = surepy
+        self._save_pending: bool = False
+
+        # time of the last successful refresh, saved with the snapshot
+        self.refreshed_at: datetime | None = None
+
+    async def async_restore(self) -> datetime | None:
+        """Restore the last snapshot, returns the time of its data (None if missing or too old)."""
+
+        if not (snapshot := await self._store.async_load()) or not snapshot.get("entities"):
+            return None
+
+        if not (refreshed_at := dt_util.parse_datetime(snapshot.get("refreshed_at") or "")):
+            return None
+
+        if (age := dt_util.utcnow() - refreshed_at) > timedelta(seconds=SNAPSHOT_MAX_AGE):
+            _LOGGER.debug(
+                "🐾 \x1b[38;2;0;255;0m·\x1b[0m snapshot is %s old, waiting for a refresh", age
+            )
+            return None
+
+        if not self._surepy.restore_snapshot(snapshot):
+            return None
+
+        self.refreshed_at = refreshed_at
+        return refreshed_at
+
+    @callback
+    def async_schedule_save(self, refreshed_at: datetime | None) -> None:
+        """Save the current state soon, a save already scheduled is not postponed."""
+
+        self.refreshed_at = refreshed_at or self.refreshed_at
+
+        if self._save_pending:
+            return
+
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Snapshot to save, serialized by the store in the executor."""
+
+        self._save_pending = False
+
+        return {
+            "refreshed_at": self.refreshed_at.isoformat() if self.refreshed_at else None,
+            **self._surepy.export_snapshot(),
+        }
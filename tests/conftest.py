@@ -0,0 +1,41 @@
+"""Fixtures of the tests, the integration is registered by ``loader``."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Awaitable, Callable
+
+import pytest
+
+from aiohttp import web
+
+from loader import load_integration
+
+
+load_integration()
+
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+@asynccontextmanager
+async def _stand_in_api(handler: Handler) -> AsyncIterator[str]:
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+
+    try:
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        await runner.cleanup()
+
+
+@pytest.fixture
+def stand_in_api() -> Callable[[Handler], AsyncContextManager[str]]:
+    """Local api answering every route with a handler, yields its base url."""
+    return _stand_in_api
@@ -0,0 +1,161 @@
+"""Single-flight logins of the token manager and the replay of rejected requests."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+
+from time import time
+from typing import Any, Callable
+
+import pytest
+
+from aiohttp import web
+
+from sureha import client as sure_client
+from sureha.auth import TokenManager, TokenStore, token_expiry
+from sureha.client import SureAPIClient
+from sureha.exeptions import SurePetcareAuthenticationError
+
+
+def jwt(expires_at: float, signature: str = "s") -> str:
+    """Unsigned JWT with an ``exp`` claim, long enough to pass ``token_seems_valid``."""
+    claims = base64.urlsafe_b64encode(json.dumps({"exp": expires_at}).encode()).decode()
+    return f"eyJhbGciOiJIUzI1NiJ9.{claims.rstrip('=')}.{signature * 400}"
+
+
+class FakeLogin:
+    """Login returning the given tokens in turn, counting the calls."""
+
+    def __init__(self, *tokens: str | None, delay: float = 0.01) -> None:
+        self.tokens = list(tokens)
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self) -> str | None:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.tokens[min(self.calls, len(self.tokens)) - 1]
+
+
+class MemoryTokenStore(TokenStore):
+    def __init__(self, token: str | None = None) -> None:
+        self.token = token
+        self.saved: list[str] = []
+
+    async def async_load(self) -> str | None:
+        return self.token
+
+    async def async_save(self, token: str) -> None:
+        self.saved.append(token)
+
+
+def test_token_expiry() -> None:
+    assert token_expiry(jwt(1234.0)) == 1234.0
+    assert token_expiry("not-a-jwt") is None
+    assert token_expiry(None) is None
+
+
+def test_concurrent_requests_share_one_login() -> None:
+    token = jwt(time() + 3600)
+    login = FakeLogin(token)
+
+    async def run() -> list[str | None]:
+        manager = TokenManager(login)
+        return await asyncio.gather(*[manager.async_get_token() for _ in range(10)])
+
+    assert asyncio.run(run()) == [token] * 10
+    assert login.calls == 1
+
+
+def test_rejected_token_is_replaced_once() -> None:
+    old, new = jwt(time() + 3600, "o"), jwt(time() + 3600, "n")
+    login = FakeLogin(new)
+
+    async def run() -> list[str | None]:
+        manager = TokenManager(login, token=old)
+        tokens = await asyncio.gather(*[manager.async_refresh(rejected=old) for _ in range(5)])
+        # a late rejection of the old token gets the replacement without another login
+        tokens.append(await manager.async_refresh(rejected=old))
+        return tokens
+
+    assert asyncio.run(run()) == [new] * 6
+    assert login.calls == 1
+
+
+def test_expiring_token_is_renewed_in_the_background() -> None:
+    expiring, renewed = jwt(time() + 10, "e"), jwt(time() + 3600, "r")
+    login = FakeLogin(renewed)
+
+    async def run() -> tuple[str | None, str | None]:
+        manager = TokenManager(login, token=expiring, renew_margin=60)
+        current = await manager.async_get_token()
+        await asyncio.sleep(0.05)
+        return current, manager.token
+
+    assert asyncio.run(run()) == (expiring, renewed)
+    assert login.calls == 1
+
+
+def test_stored_token_is_used_and_refreshed_token_saved() -> None:
+    stored, refreshed = jwt(time() + 3600, "a"), jwt(time() + 3600, "b")
+    store = MemoryTokenStore(stored)
+    login = FakeLogin(refreshed)
+
+    async def run() -> tuple[str | None, str | None]:
+        manager = TokenManager(login, store=store)
+        return await manager.async_get_token(), await manager.async_refresh(rejected=stored)
+
+    assert asyncio.run(run()) == (stored, refreshed)
+    assert login.calls == 1
+    assert store.saved == [refreshed]
+
+
+FRESH_TOKEN = jwt(time() + 3600, "f")
+
+
+async def call_stand_in(
+    stand_in_api: Any,
+    monkeypatch: pytest.MonkeyPatch,
+    accepted: Callable[[str], bool],
+    counts: dict[str, int],
+) -> object:
+    """GET from a stand-in accepting the tokens ``accepted`` allows, counting logins & requests."""
+
+    async def handler(request: web.Request) -> web.Response:
+        if request.path == "/auth/login":
+            counts["logins"] += 1
+            return web.json_response({"data": {"token": FRESH_TOKEN}})
+
+        counts["requests"] += 1
+        if not accepted(request.headers["Authorization"].removeprefix("Bearer ")):
+            return web.Response(status=401)
+        return web.json_response({"data": {"path": request.path}})
+
+    async with stand_in_api(handler) as base:
+        monkeypatch.setattr(sure_client, "AUTH_RESOURCE", f"{base}/auth/login")
+        async with SureAPIClient(auth_token=jwt(time() + 3600, "x")) as sac:
+            return await sac.call(method="GET", resource=f"{base}/api/me/start")
+
+
+def test_rejected_request_is_replayed_once_with_a_new_token(
+    stand_in_api: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    counts = {"logins": 0, "requests": 0}
+
+    response = asyncio.run(call_stand_in(stand_in_api, monkeypatch, FRESH_TOKEN.__eq__, counts))
+
+    assert response == {"data": {"path": "/api/me/start"}}
+    assert counts == {"logins": 1, "requests": 2}
+
+
+def test_request_rejected_twice_raises(
+    stand_in_api: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    counts = {"logins": 0, "requests": 0}
+
+    with pytest.raises(SurePetcareAuthenticationError):
+        asyncio.run(call_stand_in(stand_in_api, monkeypatch, lambda _: False, counts))
+
+    assert counts == {"logins": 1, "requests": 2}
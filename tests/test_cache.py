@@ -0,0 +1,78 @@
+"""Atomic writes and the size bound of the validator cache."""
+
+from __future__ import annotations
+
+import json
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from sureha import cache as sure_cache
+from sureha.cache import ValidatorCache
+
+
+def validators(*resources: str, etag: bool = True) -> dict[str, dict[str, Any]]:
+    return {
+        "resources": {resource: {"data": resource} for resource in resources},
+        "etags": {resource: f'"{resource}"' for resource in resources} if etag else {},
+        "last_modified": {},
+    }
+
+
+def test_save_and_load_round_trip(tmp_path: Path) -> None:
+    cache = ValidatorCache(tmp_path / "sureha" / "validators.json")
+    saved = validators("a", "b", "c")
+
+    cache.save(saved)
+
+    assert cache.load() == saved
+    # the recency order survives the round trip
+    assert list(cache.load()["resources"]) == ["a", "b", "c"]
+
+
+def test_responses_without_validators_are_not_saved(tmp_path: Path) -> None:
+    cache = ValidatorCache(tmp_path / "validators.json")
+
+    cache.save(validators("a", etag=False))
+
+    assert cache.load()["resources"] == {}
+
+
+def test_size_bound_keeps_the_most_recent_responses(tmp_path: Path) -> None:
+    entry_size = len(
+        json.dumps({"resource": "a", "body": {"data": "a"}, "etag": '"a"', "last_modified": None})
+    )
+    cache = ValidatorCache(tmp_path / "validators.json", max_bytes=2 + 2 * (entry_size + 1))
+
+    written = cache.save(validators("a", "b", "c"))
+
+    assert written <= cache.max_bytes
+    assert (tmp_path / "validators.json").stat().st_size == written
+    assert list(cache.load()["resources"]) == ["b", "c"]
+
+
+def test_failed_write_keeps_the_previous_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = ValidatorCache(tmp_path / "validators.json")
+    cache.save(validators("a"))
+
+    def crash(*_: Any) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(sure_cache.os, "replace", crash)
+
+    with pytest.raises(OSError):
+        cache.save(validators("b"))
+
+    assert list(cache.load()["resources"]) == ["a"]
+
+
+def test_missing_or_unreadable_cache_loads_empty(tmp_path: Path) -> None:
+    cache = ValidatorCache(tmp_path / "validators.json")
+    assert cache.load() == validators(etag=False)
+
+    cache.path.write_text("[{truncated", encoding="utf-8")
+    assert cache.load() == validators(etag=False)
@@ -0,0 +1,176 @@
+"""Conditional requests, OPTIONS preflights and request coalescing of the api client."""
+
+from __future__ import annotations
+
+import asyncio
+
+from typing import Any
+
+import pytest
+
+from aiohttp import web
+
+from sureha.client import SureAPIClient
+from sureha.const import PREFLIGHT_ALWAYS, PREFLIGHT_OFF, PREFLIGHT_ONCE
+from sureha.ratelimit import TokenBucket
+
+
+def client(**kwargs: Any) -> SureAPIClient:
+    return SureAPIClient(
+        auth_token=f"header.claims.{'s' * 400}",
+        rate_limiter=TokenBucket(rate=1_000, burst=1_000),
+        **kwargs,
+    )
+
+
+def test_unchanged_resource_is_served_from_the_cache(stand_in_api: Any) -> None:
+    received: list[dict[str, str | None]] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        received.append(
+            {
+                "If-None-Match": request.headers.get("If-None-Match"),
+                "If-Modified-Since": request.headers.get("If-Modified-Since"),
+            }
+        )
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response(
+            {"data": {"pets": 2}},
+            headers={"ETag": '"v1"', "Last-Modified": "Sat, 17 Oct 2026 10:00:00 GMT"},
+        )
+
+    async def run() -> list[Any]:
+        async with stand_in_api(handler) as base, client() as sac:
+            resource = f"{base}/api/me/start"
+            return [await sac.call(method="GET", resource=resource) for _ in range(2)]
+
+    first, second = asyncio.run(run())
+
+    assert first == second == {"data": {"pets": 2}}
+    assert not first.not_modified
+    assert second.not_modified
+    assert received == [
+        {"If-None-Match": None, "If-Modified-Since": None},
+        {"If-None-Match": '"v1"', "If-Modified-Since": "Sat, 17 Oct 2026 10:00:00 GMT"},
+    ]
+
+
+def test_changed_resource_replaces_the_cached_body(stand_in_api: Any) -> None:
+    versions = iter(['"v1"', '"v2"'])
+
+    async def handler(request: web.Request) -> web.Response:
+        etag = next(versions)
+        return web.json_response({"data": {"etag": etag}}, headers={"ETag": etag})
+
+    async def run() -> tuple[Any, SureAPIClient]:
+        async with stand_in_api(handler) as base, client() as sac:
+            resource = f"{base}/api/me/start"
+            await sac.call(method="GET", resource=resource)
+            return await sac.call(method="GET", resource=resource), sac
+
+    response, sac = asyncio.run(run())
+
+    assert response == {"data": {"etag": '"v2"'}}
+    assert not response.not_modified
+    assert list(sac._etags.values()) == ['"v2"']
+
+
+def count_preflights(stand_in_api: Any, requests: int, **kwargs: Any) -> dict[str, int]:
+    counts: dict[str, int] = {}
+
+    async def handler(request: web.Request) -> web.Response:
+        counts[request.method] = counts.get(request.method, 0) + 1
+        return web.json_response({"data": {}})
+
+    async def run() -> None:
+        async with stand_in_api(handler) as base, client(**kwargs) as sac:
+            for number in range(requests):
+                await sac.call(method="GET", resource=f"{base}/api/pet/{number}")
+
+    asyncio.run(run())
+    return counts
+
+
+def test_no_preflights_by_default(stand_in_api: Any) -> None:
+    assert count_preflights(stand_in_api, 3) == {"GET": 3}
+    assert count_preflights(stand_in_api, 3, preflight=PREFLIGHT_OFF) == {"GET": 3}
+
+
+def test_preflight_once_per_host_and_ttl(stand_in_api: Any) -> None:
+    assert count_preflights(stand_in_api, 3, preflight=PREFLIGHT_ONCE) == {"OPTIONS": 1, "GET": 3}
+    # an expired preflight is sent again
+    assert count_preflights(stand_in_api, 3, preflight=PREFLIGHT_ONCE, preflight_ttl=0) == {
+        "OPTIONS": 3,
+        "GET": 3,
+    }
+
+
+def test_preflight_before_every_request(stand_in_api: Any) -> None:
+    assert count_preflights(stand_in_api, 3, preflight=PREFLIGHT_ALWAYS) == {
+        "OPTIONS": 3,
+        "GET": 3,
+    }
+
+
+def test_unknown_preflight_policy() -> None:
+    with pytest.raises(ValueError):
+        client(preflight="sometimes")
+
+
+def counting_api(counts: dict[str, int], delay: float = 0.05) -> Any:
+    async def handler(request: web.Request) -> web.Response:
+        counts[request.method] = counts.get(request.method, 0) + 1
+        await asyncio.sleep(delay)
+        return web.json_response({"data": {"path": request.path}})
+
+    return handler
+
+
+def test_identical_gets_in_flight_share_one_request(stand_in_api: Any) -> None:
+    counts: dict[str, int] = {}
+
+    async def run() -> tuple[list[Any], int]:
+        async with stand_in_api(counting_api(counts)) as base, client() as sac:
+            responses = await asyncio.gather(
+                *[sac.call(method="GET", resource=f"{base}/api/me/start") for _ in range(5)],
+                sac.call(method="GET", resource=f"{base}/api/pet"),
+            )
+            return responses, sac.coalesced_requests
+
+    responses, coalesced = asyncio.run(run())
+
+    assert responses == [{"data": {"path": "/api/me/start"}}] * 5 + [{"data": {"path": "/api/pet"}}]
+    assert counts == {"GET": 2}
+    assert coalesced == 4
+
+
+def test_cancelled_waiter_does_not_cancel_the_shared_get(stand_in_api: Any) -> None:
+    counts: dict[str, int] = {}
+
+    async def run() -> Any:
+        async with stand_in_api(counting_api(counts, delay=0.1)) as base, client() as sac:
+            resource = f"{base}/api/me/start"
+            first = asyncio.create_task(sac.call(method="GET", resource=resource))
+            second = asyncio.create_task(sac.call(method="GET", resource=resource))
+            await asyncio.sleep(0.02)
+            first.cancel()
+            return await second
+
+    assert asyncio.run(run()) == {"data": {"path": "/api/me/start"}}
+    assert counts == {"GET": 1}
+
+
+def test_writes_are_not_coalesced(stand_in_api: Any) -> None:
+    counts: dict[str, int] = {}
+
+    async def run() -> int:
+        async with stand_in_api(counting_api(counts)) as base, client() as sac:
+            resource = f"{base}/api/device/1/control"
+            await asyncio.gather(
+                *[sac.call(method="PUT", resource=resource, data={"locking": 1}) for _ in range(3)]
+            )
+            return sac.coalesced_requests
+
+    assert asyncio.run(run()) == 0
+    assert counts == {"PUT": 3}
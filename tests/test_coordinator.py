@@ -0,0 +1,79 @@
+"""Entities woken up by the tier coordinators after a warm start."""
+
+from __future__ import annotations
+
+import asyncio
+
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from sureha import coordinator  # noqa: E402
+from sureha.const import TIER_STATE  # noqa: E402
+from sureha.coordinator import SureTierCoordinator  # noqa: E402
+from sureha.entities import ChangeSet  # noqa: E402
+from sureha.entity import signal_entity_update  # noqa: E402
+
+
+class FakeSurepy:
+    def __init__(self, entities: dict[int, Any]) -> None:
+        self.entities = entities
+        self.last_changes = ChangeSet()
+
+
+def bare_coordinator(surepy: FakeSurepy, data: Any) -> SureTierCoordinator:
+    """Coordinator with only the state its refresh & dispatch use, no Home Assistant."""
+
+    sure = SureTierCoordinator.__new__(SureTierCoordinator)
+    sure.hass = None
+    sure.name = f"sureha_{TIER_STATE}"
+    sure.tier = TIER_STATE
+    sure._surepy = surepy  # type: ignore[assignment]
+    sure.data = None
+    sure.last_update_success = True
+    sure.changes = ChangeSet()
+    sure._dispatched_success = True
+    sure.last_success_at = None
+    sure.stale_since = None
+    sure._dispatched_stale = False
+
+    async def fetch() -> Any:
+        sure.changes = surepy.last_changes
+        return data
+
+    sure._async_fetch_data = fetch  # type: ignore[method-assign]
+    return sure
+
+
+def test_first_refresh_after_a_warm_start_wakes_all_entities(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    signals: list[str] = []
+    monkeypatch.setattr(
+        coordinator, "async_dispatcher_send", lambda _, signal: signals.append(signal)
+    )
+
+    entities = {1: object(), 2: object(), 3: object()}
+    surepy = FakeSurepy(entities)
+    sure = bare_coordinator(surepy, entities)
+
+    sure.async_warm_start(entities, datetime(2026, 10, 17, 6, tzinfo=timezone.utc))
+
+    # the first refresh only changed pet 1, the others still show the restored data
+    surepy.last_changes = ChangeSet(updated={1})
+    sure.data = asyncio.run(sure._async_update_data())
+    sure.async_dispatch_changes()
+
+    assert sure.stale_since is None
+    assert sorted(signals) == sorted(signal_entity_update(TIER_STATE, id_) for id_ in entities)
+
+    # later refreshes only wake the changed entities
+    signals.clear()
+    surepy.last_changes = ChangeSet(updated={2})
+    sure.data = asyncio.run(sure._async_update_data())
+    sure.async_dispatch_changes()
+
+    assert signals == [signal_entity_update(TIER_STATE, 2)]
@@ -0,0 +1,205 @@
+"""Change detection, decoding, memoized values and copy-on-write of the entities."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sureha.entities import ChangeSet, content_hash
+from sureha.entities.devices import Feeder, Felaqua, Flap
+from sureha.entities.pet import Pet
+from sureha.enums import Location
+
+
+def pet_data(**changes: Any) -> dict[str, Any]:
+    return {
+        "id": 10,
+        "household_id": 1,
+        "name": "Luna",
+        "tag_id": 100,
+        "food_type_id": 2,
+        "position": {"where": 1, "since": "2026-10-17T08:00:00+00:00"},
+        **changes,
+    }
+
+
+def flap_data(mode: int = 0) -> dict[str, Any]:
+    return {
+        "id": 20,
+        "household_id": 1,
+        "product_id": 6,
+        "name": "Flap",
+        "status": {"battery": 5.6, "locking": {"mode": mode}},
+    }
+
+
+def feeder_data(name: str = "Feeder", tags: list[dict[str, Any]] | None = None) -> dict[str, Any]:
+    return {"id": 30, "household_id": 1, "product_id": 4, "name": name, "tags": tags or []}
+
+
+def lunch(*weights: dict[str, Any]) -> dict[str, Any]:
+    return {"weights": list(weights)}
+
+
+def test_change_set() -> None:
+    changes = ChangeSet()
+    assert not changes
+
+    changes.added.add(1)
+    changes.updated.add(2)
+    changes.removed.add(3)
+
+    assert changes
+    assert changes.changed == {1, 2, 3}
+
+
+def test_content_hash_ignores_the_key_order() -> None:
+    assert content_hash({"a": 1, "b": {"c": 2, "d": 3}}) == content_hash(
+        {"b": {"d": 3, "c": 2}, "a": 1}
+    )
+    assert content_hash({"a": 1}) != content_hash({"a": 2})
+
+
+def test_unchanged_payload_keeps_the_entity() -> None:
+    pet = Pet(pet_data())
+    flap = Flap(flap_data())
+
+    # a fresh copy of the same payload, as parsed from the next response
+    assert pet.evolve(pet_data()) is pet
+    assert flap.evolve(flap_data()) is flap
+
+
+def test_changed_payload_replaces_the_entity() -> None:
+    flap = Flap(flap_data(mode=0))
+
+    locked = flap.evolve(flap_data(mode=3))
+
+    assert locked is not flap
+    assert locked.id == flap.id
+    assert not locked.unlocked and flap.unlocked
+
+
+def test_payload_is_decoded_once() -> None:
+    feeding = {"change": [-5.0, 0.0], "at": "2026-10-17T07:00:00+00:00"}
+    pet = Pet(pet_data(status={"feeding": feeding}))
+
+    assert pet.name == "Luna"
+    assert pet.tag_id == 100
+    assert pet.food_type is not None
+    assert pet.location.where == Location.INSIDE
+    assert pet.at_home
+    assert pet.feeding is not None and pet.feeding.change == [-5.0, 0.0]
+    assert pet.last_lunch is not None and pet.last_lunch.hour == 7
+
+
+def test_unknown_values_do_not_break_the_ingest() -> None:
+    pet = Pet(pet_data(food_type_id=99, position={"where": 7}))
+    feeder = Feeder(feeder_data()).attach(
+        "lunch", lunch({"index": 5, "weight": 10, "change": 1, "food_type_id": 99})
+    )
+
+    assert pet.food_type is None
+    assert pet.location.where == Location.UNKNOWN
+    assert feeder.bowls[5].position is None and feeder.bowls[5].food_type is None
+
+
+def test_bowl_without_a_weight() -> None:
+    feeder = Feeder(feeder_data()).attach(
+        "lunch", lunch({"index": 0, "change": 1}, {"index": 1, "weight": 20.5, "change": -3})
+    )
+
+    assert feeder.bowls[0].weight is None
+    assert feeder.bowls[0].change == 1.0
+    assert feeder.bowls[1].weight == 20.5
+    assert feeder.total_weight == 20.5
+
+
+def test_attached_data_is_decoded() -> None:
+    felaqua = Felaqua(
+        {"id": 40, "household_id": 1, "product_id": 8, "name": "Felaqua", "status": {}}
+    )
+
+    with_drink = felaqua.attach("latest_drink", {"remaining": 250, "change": -12})
+
+    assert felaqua.water_remaining is None
+    assert with_drink.water_remaining == 250.0
+    assert with_drink.water_change == -12.0
+    # the same data attached again changes nothing
+    assert with_drink.attach("latest_drink", {"remaining": 250, "change": -12}) is with_drink
+
+
+def test_generation_counts_the_changes() -> None:
+    flap = Flap(flap_data(mode=0))
+
+    assert flap.generation == 0
+    assert flap.evolve(flap_data(mode=0)).generation == 0
+    assert flap.evolve(flap_data(mode=3)).generation == 1
+    assert flap.attach("move", {"tag_id": 100}).evolve(flap_data(mode=3)).generation == 2
+
+
+def test_memoized_values_are_computed_once_per_generation() -> None:
+    flap = Flap(flap_data(mode=0))
+    calls: list[int] = []
+
+    def derive(entity: Flap) -> int:
+        calls.append(entity.generation)
+        return len(calls)
+
+    assert flap.memoized("derived", lambda: derive(flap)) == 1
+    assert flap.memoized("derived", lambda: derive(flap)) == 1
+    # an unchanged payload keeps the entity and its memo
+    same = flap.evolve(flap_data(mode=0))
+    assert same.memoized("derived", lambda: derive(same)) == 1
+
+    locked = flap.evolve(flap_data(mode=3))
+    assert locked.memoized("derived", lambda: derive(locked)) == 2
+    assert calls == [0, 1]
+
+
+def test_memoized_methods_are_keyed_by_their_arguments() -> None:
+    flap = Flap(flap_data())
+
+    level = flap.calculate_battery_level()
+
+    assert flap.calculate_battery_level() == level == flap.battery_level
+    assert flap.calculate_battery_level(voltage_full=1.8) != level
+    assert len(flap._memo) == 2
+
+
+def test_successors_leave_the_predecessor_unchanged() -> None:
+    flap = Flap(flap_data(mode=0))
+    payload = flap.raw_data()
+
+    flap.evolve(flap_data(mode=3))
+    flap.attach("move", {"tag_id": 100})
+
+    assert flap.unlocked
+    assert flap.raw_data() is payload and "move" not in payload
+
+
+def test_attached_data_survives_an_unchanged_payload() -> None:
+    flap = Flap(flap_data()).attach("move", {"tag_id": 100})
+
+    # the next me/start has the same payload, without the attached report data
+    assert flap.evolve(flap_data()) is flap
+
+
+def test_feeder_successor_reuses_unchanged_bowls_and_tags() -> None:
+    tags = [{"id": 1, "index": 0}, {"id": 2, "index": 1}]
+    bowls = [{"index": 0, "weight": 10, "change": 1}, {"index": 1, "weight": 20, "change": 2}]
+    feeder = Feeder(feeder_data(tags=tags)).attach("lunch", lunch(*bowls))
+
+    refilled = feeder.attach("lunch", lunch(bowls[0], {**bowls[1], "weight": 80}))
+
+    assert refilled.bowls[0] is feeder.bowls[0]
+    assert refilled.bowls[1] is not feeder.bowls[1]
+    assert refilled.bowls[1].weight == 80 and feeder.bowls[1].weight == 20
+    assert refilled.tags[0] is feeder.tags[0] and refilled.tags[1] is feeder.tags[1]
+
+    retagged = refilled.evolve(feeder_data(tags=[tags[0], {"id": 3, "index": 1}]))
+    assert retagged.tags[0] is feeder.tags[0]
+    assert retagged.tags[1].id == 3 and feeder.tags[1].id == 2
+
+    # bowls are named after the feeder
+    renamed = feeder.evolve({**feeder.raw_data(), "name": "Kitchen"})
+    assert renamed.bowls[0] is not feeder.bowls[0]
+    assert renamed.bowls[0].name == "Kitchen Bowl 0"
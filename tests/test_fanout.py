@@ -0,0 +1,59 @@
+"""Time budget, concurrency limit and failure isolation of the household fan-out."""
+
+from __future__ import annotations
+
+import asyncio
+
+from typing import Any
+
+import pytest
+
+from sureha.exeptions import SurePetcareAuthenticationError, SurePetcareConnectionError
+from sureha.fanout import HouseholdFanOut
+
+
+async def household(household_id: int, delay: float = 0.0, error: Exception | None = None) -> Any:
+    await asyncio.sleep(delay)
+    if error:
+        raise error
+    return {"household": household_id}
+
+
+def test_slow_and_failing_households_are_skipped() -> None:
+    fan_out = HouseholdFanOut(concurrency=4, timeout=0.1)
+
+    async def run() -> list[Any]:
+        return await asyncio.gather(
+            fan_out.fetch(1, household(1)),
+            fan_out.fetch(2, household(2, delay=1)),
+            fan_out.fetch(3, household(3, error=SurePetcareConnectionError())),
+            fan_out.fetch(4, household(4)),
+        )
+
+    assert asyncio.run(run()) == [{"household": 1}, None, None, {"household": 4}]
+
+
+def test_budget_includes_the_wait_for_the_concurrency_limit() -> None:
+    fan_out = HouseholdFanOut(concurrency=1, timeout=0.1)
+    started: list[int] = []
+
+    async def tracked(household_id: int, delay: float) -> Any:
+        started.append(household_id)
+        return await household(household_id, delay)
+
+    async def run() -> list[Any]:
+        return await asyncio.gather(
+            fan_out.fetch(1, tracked(1, delay=0.08)),
+            fan_out.fetch(2, tracked(2, delay=0.05)),
+        )
+
+    # the second household would fit in the budget, but not after waiting for the first
+    assert asyncio.run(run()) == [{"household": 1}, None]
+    assert started == [1, 2]
+
+
+def test_authentication_errors_are_passed_on() -> None:
+    fan_out = HouseholdFanOut()
+
+    with pytest.raises(SurePetcareAuthenticationError):
+        asyncio.run(fan_out.fetch(1, household(1, error=SurePetcareAuthenticationError())))
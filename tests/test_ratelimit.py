@@ -0,0 +1,183 @@
+"""Refill, burst, fairness, priorities and cancellation of the token bucket."""
+
+from __future__ import annotations
+
+import asyncio
+
+from time import monotonic
+from typing import Any
+
+import pytest
+
+from sureha import ratelimit
+from sureha.ratelimit import TokenBucket, shared_bucket
+
+RATE = 50.0
+TICK = 1 / RATE
+
+
+async def acquire_all(bucket: TokenBucket, count: int) -> list[float]:
+    return [await bucket.acquire() for _ in range(count)]
+
+
+def test_burst_passes_then_rate() -> None:
+    bucket = TokenBucket(rate=RATE, burst=3)
+
+    async def run() -> tuple[list[float], float]:
+        burst = await acquire_all(bucket, 3)
+        start = monotonic()
+        await bucket.acquire()
+        return burst, monotonic() - start
+
+    burst, wait = asyncio.run(run())
+
+    assert burst == [0.0, 0.0, 0.0]
+    assert TICK * 0.8 <= wait < TICK * 5
+    assert bucket.as_dict()["delayed"] == 1
+
+
+def test_refill_is_bounded_by_the_burst() -> None:
+    bucket = TokenBucket(rate=RATE, burst=2)
+
+    async def run() -> list[float]:
+        await acquire_all(bucket, 2)
+        # idle for longer than it takes to refill more than the burst
+        await asyncio.sleep(TICK * 5)
+        return await acquire_all(bucket, 3)
+
+    waits = asyncio.run(run())
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] > 0
+
+
+def test_waiters_are_served_in_arrival_order() -> None:
+    bucket = TokenBucket(rate=RATE, burst=1)
+    order: list[int] = []
+
+    async def request(number: int) -> None:
+        await bucket.acquire()
+        order.append(number)
+
+    async def run() -> None:
+        await bucket.acquire()
+        tasks = [asyncio.create_task(request(number)) for number in range(4)]
+        await asyncio.sleep(TICK * 1.5)
+        # a newcomer queues behind the waiters even if a token is available by now
+        tasks.append(asyncio.create_task(request(4)))
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+    assert order == [0, 1, 2, 3, 4]
+
+
+def test_higher_priorities_pass_the_queue() -> None:
+    bucket = TokenBucket(rate=RATE, burst=1)
+    order: list[str] = []
+
+    async def request(name: str, priority: int) -> None:
+        await bucket.acquire(priority)
+        order.append(name)
+
+    async def run() -> None:
+        await bucket.acquire()
+        tasks = [
+            asyncio.create_task(request(name, priority))
+            for name, priority in [("timeline", 3), ("reports", 2), ("timeline 2", 3)]
+        ]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(request("control", 0)))
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+    assert order == ["control", "reports", "timeline", "timeline 2"]
+
+
+def test_cancelled_waiter_gives_up_its_place() -> None:
+    bucket = TokenBucket(rate=RATE, burst=1)
+    order: list[int] = []
+
+    async def request(number: int) -> None:
+        await bucket.acquire()
+        order.append(number)
+
+    async def run() -> float:
+        await bucket.acquire()
+        tasks = [asyncio.create_task(request(number)) for number in range(3)]
+        await asyncio.sleep(0)
+        tasks[1].cancel()
+
+        start = monotonic()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return monotonic() - start
+
+    elapsed = asyncio.run(run())
+
+    assert order == [0, 2]
+    # request 2 took the slot of the cancelled request 1
+    assert elapsed < TICK * 2.8
+    assert bucket.waiting == 0
+
+
+def test_token_of_a_cancelled_waiter_goes_to_the_head_of_the_queue() -> None:
+    bucket = TokenBucket(rate=RATE, burst=1)
+    order: list[str] = []
+
+    async def request(name: str) -> None:
+        await bucket.acquire()
+        order.append(name)
+
+    async def run() -> list[str]:
+        await bucket.acquire()
+        first = asyncio.create_task(request("first"))
+        second = asyncio.create_task(request("second"))
+        await asyncio.sleep(0)
+
+        # the first waiter is handed a token and cancelled before it resumes
+        bucket._tokens = 1
+        bucket._dispatch()
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+
+        # served right away with the refunded token, not a whole tick later with a new one
+        await asyncio.sleep(TICK / 4)
+        served = list(order)
+
+        # the bucket is empty again, a newcomer has to wait its turn
+        await asyncio.gather(second, request("newcomer"))
+        return served
+
+    assert asyncio.run(run()) == ["second"]
+    assert order == ["second", "newcomer"]
+
+
+def test_shared_bucket_per_account_and_host(monkeypatch: pytest.MonkeyPatch) -> None:
+    buckets: dict[Any, TokenBucket] = {}
+    monkeypatch.setattr(ratelimit, "_BUCKETS", buckets)
+
+    bucket = shared_bucket("app.api.surehub.io", "Pet@Example.com", 2.0, 10)
+
+    assert shared_bucket("app.api.surehub.io", "pet@example.com", 2.0, 10) is bucket
+    assert shared_bucket("app.api.surehub.io", "other@example.com", 2.0, 10) is not bucket
+    assert shared_bucket("other.host", "pet@example.com", 2.0, 10) is not bucket
+
+
+def test_shared_bucket_keeps_its_limits(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setattr(ratelimit, "_BUCKETS", {})
+
+    bucket = shared_bucket("app.api.surehub.io", "pet@example.com", 2.0, 10)
+
+    assert shared_bucket("app.api.surehub.io", "pet@example.com", 5.0, 20) is bucket
+    assert (bucket.rate, bucket.burst) == (2.0, 10)
+    assert "already shared at 2.0/s, burst 10" in caplog.text
+
+
+def test_invalid_limits() -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(burst=0)
@@ -0,0 +1,219 @@
+"""Retry policy, circuit breakers and their use by the api client."""
+
+from __future__ import annotations
+
+import asyncio
+
+from time import time
+from typing import Any
+
+import pytest
+
+from aiohttp import web
+
+from sureha import resilience
+from sureha.client import SureAPIClient
+from sureha.exeptions import SurePetcareCircuitOpenError, SurePetcareConnectionError
+from sureha.resilience import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    CircuitBreaker,
+    RetryPolicy,
+    endpoint,
+)
+
+
+class Clock:
+    """Stand-in for ``monotonic`` of the resilience module."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(resilience, "monotonic", clock)
+    return clock
+
+
+def test_endpoint_masks_ids() -> None:
+    assert endpoint("https://app.api.surehub.io/api/device/1234/control") == (
+        "app.api.surehub.io/api/device/{id}/control"
+    )
+
+
+def test_backoff_is_capped_full_jitter() -> None:
+    policy = RetryPolicy(attempts=6, base=1.0, cap=5.0)
+
+    for retry, ceiling in enumerate([1.0, 2.0, 4.0, 5.0, 5.0]):
+        assert all(0 <= policy.backoff(retry) <= ceiling for _ in range(50))
+
+
+def test_breaker_opens_at_the_threshold(clock: Clock) -> None:
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+
+    for _ in range(2):
+        breaker.record_failure()
+        assert breaker.state == BREAKER_CLOSED and breaker.allow()
+
+    breaker.record_failure()
+
+    assert breaker.state == BREAKER_OPEN
+    assert not breaker.allow()
+    assert breaker.trips == 1 and breaker.rejected == 1
+
+
+def test_success_resets_the_failure_count(clock: Clock) -> None:
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.state == BREAKER_CLOSED
+
+
+def test_breaker_lets_a_single_probe_through_after_the_reset_timeout(clock: Clock) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+
+    clock.now += 59
+    assert not breaker.allow()
+
+    clock.now += 1
+    assert breaker.allow()
+    assert breaker.state == BREAKER_HALF_OPEN
+    # only one probe until it comes back
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == BREAKER_CLOSED and breaker.allow()
+
+
+def test_failed_probe_reopens_the_breaker(clock: Clock) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+
+    clock.now += 60
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == BREAKER_OPEN
+    assert not breaker.allow()
+    clock.now += 60
+    assert breaker.allow()
+
+
+def unavailable_api(counts: dict[str, int], delay: float = 0.0) -> Any:
+    async def handler(request: web.Request) -> web.Response:
+        counts[request.method] = counts.get(request.method, 0) + 1
+        await asyncio.sleep(delay)
+        return web.Response(status=503)
+
+    return handler
+
+
+def client(**kwargs: Any) -> SureAPIClient:
+    return SureAPIClient(
+        auth_token=f"header.claims.{'s' * 400}",
+        retry_policy=RetryPolicy(attempts=3, base=0.0),
+        **kwargs,
+    )
+
+
+def test_only_idempotent_requests_are_retried(stand_in_api: Any) -> None:
+    counts: dict[str, int] = {}
+
+    async def run() -> None:
+        async with stand_in_api(unavailable_api(counts)) as base, client() as sac:
+            # a resource (and so breaker) per method
+            for method in ("GET", "POST", "PUT"):
+                with pytest.raises(SurePetcareConnectionError):
+                    await sac.call(method=method, resource=f"{base}/api/{method.lower()}")
+
+    asyncio.run(run())
+
+    assert counts == {"GET": 3, "POST": 1, "PUT": 3}
+
+
+def test_breaker_fails_fast_once_open(stand_in_api: Any) -> None:
+    counts: dict[str, int] = {}
+
+    async def run() -> None:
+        async with stand_in_api(unavailable_api(counts)) as base, client() as sac:
+            # 2 x 3 attempts trip the breaker (5 failures) on the second request
+            for _ in range(2):
+                with pytest.raises(SurePetcareConnectionError):
+                    await sac.call(method="GET", resource=f"{base}/api/me/start")
+            with pytest.raises(SurePetcareCircuitOpenError):
+                await sac.call(method="GET", resource=f"{base}/api/me/start")
+
+    asyncio.run(run())
+
+    assert counts == {"GET": 5}
+
+
+def test_attempts_share_the_callers_budget(stand_in_api: Any) -> None:
+    counts: dict[str, int] = {}
+
+    async def run() -> dict[str, Any]:
+        async with stand_in_api(unavailable_api(counts, delay=0.5)) as base, client() as sac:
+            resource = f"{base}/api/me/start"
+            # the first attempt times out with the budget, no time is left for a retry
+            with pytest.raises(SurePetcareConnectionError):
+                await sac.call(method="GET", resource=resource, budget=0.2)
+            return sac.breakers[endpoint(resource)].as_dict()
+
+    started = time()
+    breaker = asyncio.run(run())
+
+    assert time() - started < 2
+    assert breaker["failures"] == 1
+    assert counts == {"GET": 1}
+
+
+def test_without_a_budget_every_attempt_gets_the_api_timeout(stand_in_api: Any) -> None:
+    counts: dict[str, int] = {}
+
+    async def run() -> dict[str, Any]:
+        async with stand_in_api(unavailable_api(counts, delay=0.5)) as base, client(
+            api_timeout=0.1
+        ) as sac:
+            resource = f"{base}/api/me/start"
+            with pytest.raises(SurePetcareConnectionError):
+                await sac.call(method="GET", resource=resource)
+            return sac.breakers[endpoint(resource)].as_dict()
+
+    breaker = asyncio.run(run())
+
+    assert breaker["failures"] == 3
+    assert counts == {"GET": 3}
+
+
+def test_cancelled_request_is_not_a_failure(stand_in_api: Any) -> None:
+    counts: dict[str, int] = {}
+
+    async def run() -> dict[str, Any]:
+        async with stand_in_api(unavailable_api(counts, delay=1)) as base, client() as sac:
+            resource = f"{base}/api/device/1/control"
+            # the caller gives up while the (not coalesced) write is on the wire
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    sac.call(method="PUT", resource=resource, data={"locking": 1}), timeout=0.2
+                )
+            return sac.breakers[endpoint(resource)].as_dict()
+
+    started = time()
+    breaker = asyncio.run(run())
+
+    assert time() - started < 5
+    # only the timeouts of the attempts themselves count against the endpoint
+    assert breaker["failures"] == 0
+    assert counts == {"PUT": 1}
@@ -0,0 +1,138 @@
+"""Priority scheduling of the requests and control writes passing background requests."""
+
+from __future__ import annotations
+
+import asyncio
+
+from typing import Any
+
+import pytest
+
+from aiohttp import web
+
+from sureha.client import SureAPIClient
+from sureha.ratelimit import TokenBucket
+from sureha.scheduler import (
+    PRIORITY_CONTROL,
+    PRIORITY_REPORTS,
+    PRIORITY_STATE,
+    PRIORITY_TIMELINE,
+    RequestScheduler,
+    default_priority,
+)
+
+
+def test_default_priorities() -> None:
+    assert default_priority("GET") == PRIORITY_STATE
+    assert default_priority("PUT") == PRIORITY_CONTROL
+    assert default_priority("POST") == PRIORITY_CONTROL
+
+
+def test_invalid_concurrency() -> None:
+    with pytest.raises(ValueError):
+        RequestScheduler(concurrency=2, control_reserved=2)
+
+
+def test_control_write_is_admitted_while_background_requests_starve() -> None:
+    scheduler = RequestScheduler(concurrency=3, control_reserved=1)
+    release = asyncio.Event()
+    started: list[str] = []
+
+    async def request(name: str, priority: int) -> None:
+        async with scheduler.slot(priority):
+            started.append(name)
+            await release.wait()
+
+    async def run() -> list[str]:
+        background = [
+            asyncio.create_task(request(f"timeline {number}", PRIORITY_TIMELINE))
+            for number in range(5)
+        ]
+        await asyncio.sleep(0)
+        # all unreserved slots are held, the other background requests wait
+        assert started == ["timeline 0", "timeline 1"]
+        assert scheduler.as_dict()["waiting"] == 3
+
+        control = asyncio.create_task(request("lock", PRIORITY_CONTROL))
+        await asyncio.sleep(0)
+        admitted = list(started)
+
+        release.set()
+        await asyncio.gather(*background, control)
+        return admitted
+
+    assert asyncio.run(run())[-1] == "lock"
+    assert scheduler.active == 0
+
+
+def test_waiting_requests_start_by_priority() -> None:
+    scheduler = RequestScheduler(concurrency=2, control_reserved=1)
+    release = asyncio.Event()
+    started: list[str] = []
+
+    async def request(name: str, priority: int) -> None:
+        async with scheduler.slot(priority):
+            started.append(name)
+            await release.wait()
+            # one at a time, so the queue order shows
+            release.clear()
+
+    async def run() -> None:
+        tasks = [
+            asyncio.create_task(request(name, priority))
+            for name, priority in [
+                ("state", PRIORITY_STATE),
+                ("timeline", PRIORITY_TIMELINE),
+                ("reports", PRIORITY_REPORTS),
+                ("state 2", PRIORITY_STATE),
+            ]
+        ]
+        while not all(task.done() for task in tasks):
+            await asyncio.sleep(0.01)
+            release.set()
+
+    asyncio.run(run())
+
+    assert started == ["state", "state 2", "reports", "timeline"]
+
+
+def test_control_write_passes_background_requests_waiting_for_a_token(
+    stand_in_api: Any,
+) -> None:
+    received: list[str] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        received.append(f"{request.method} {request.path}")
+        return web.json_response({"data": {}})
+
+    async def run() -> None:
+        # 1 token per 50ms: the background requests holding the unreserved slots queue up
+        rate_limiter = TokenBucket(rate=20, burst=1)
+
+        async with stand_in_api(handler) as base, SureAPIClient(
+            auth_token=f"header.claims.{'s' * 400}",
+            rate_limiter=rate_limiter,
+            request_concurrency=4,
+        ) as sac:
+            background = [
+                asyncio.create_task(
+                    sac.call(
+                        method="GET",
+                        resource=f"{base}/api/timeline/{number}",
+                        priority=PRIORITY_TIMELINE,
+                    )
+                )
+                for number in range(6)
+            ]
+            await asyncio.sleep(0.01)
+
+            await sac.call(
+                method="PUT", resource=f"{base}/api/device/1/control", data={"locking": 1}
+            )
+            await asyncio.gather(*background)
+
+    asyncio.run(run())
+
+    # only the request that took the burst token went before the lock command
+    assert received.index("PUT /api/device/1/control") == 1
+    assert len(received) == 7
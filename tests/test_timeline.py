@@ -0,0 +1,160 @@
+"""Paging of the household timeline, the high-water mark and ring buffer of its follower."""
+
+from __future__ import annotations
+
+import asyncio
+
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from sureha.client import APIResponse
+from sureha.exeptions import SurePetcareConnectionError
+from sureha.timeline import TimelineFollower, fetch_timeline
+
+
+class FakeTimelineClient:
+    """Serves the pages of a timeline holding the events ``1..newest``, newest first."""
+
+    def __init__(
+        self, newest: int, failures: dict[int, int] | None = None, growth: int = 0
+    ) -> None:
+        self.newest = newest
+        self.pages: list[int] = []
+        # how often each page fails and how many events are added after each page
+        self.failures = failures or {}
+        self.growth = growth
+
+    async def call(self, method: str, resource: str, **_: Any) -> APIResponse:
+        query = parse_qs(urlparse(resource).query)
+        page, page_size = int(query["page"][0]), int(query["page_size"][0])
+        self.pages.append(page)
+
+        if self.failures.get(page, 0) > 0:
+            self.failures[page] -= 1
+            raise SurePetcareConnectionError()
+
+        ids = range(self.newest - (page - 1) * page_size, 0, -1)[:page_size]
+        self.newest += self.growth
+        return APIResponse({"data": [{"id": event_id, "type": 29} for event_id in ids]})
+
+
+def timeline_of(sac: FakeTimelineClient, entries: int, **kwargs: Any) -> list[dict[str, Any]]:
+    return asyncio.run(fetch_timeline(sac, 1, entries, **kwargs))  # type: ignore[arg-type]
+
+
+def follower_of(sac: FakeTimelineClient, **kwargs: Any) -> TimelineFollower:
+    return TimelineFollower(sac, 1, buffer_size=10, backfill=6, **kwargs)  # type: ignore[arg-type]
+
+
+def ids(events: Any) -> list[int]:
+    return [event["id"] for event in events]
+
+
+def test_fetch_timeline_pages_in_windows_until_a_short_page() -> None:
+    sac = FakeTimelineClient(newest=7)
+
+    timeline = timeline_of(sac, 20, page_size=3, window=2)
+
+    assert ids(timeline) == [7, 6, 5, 4, 3, 2, 1]
+    assert sac.pages == [1, 2, 3, 4]
+
+
+def test_fetch_timeline_skips_events_repeated_by_shifted_pages() -> None:
+    # an event is added after every page, the next page repeats the last event
+    sac = FakeTimelineClient(newest=30, growth=1)
+
+    timeline = timeline_of(sac, 9, page_size=3, window=1)
+
+    assert ids(timeline) == [30, 29, 28, 27, 26, 25, 24]
+    assert sac.pages == [1, 2, 3]
+
+
+def test_fetch_timeline_retries_a_failed_page_once() -> None:
+    sac = FakeTimelineClient(newest=30, failures={2: 1})
+
+    timeline = timeline_of(sac, 9, page_size=3)
+
+    assert ids(timeline) == list(range(30, 21, -1))
+    assert sorted(sac.pages) == [1, 2, 2, 3]
+
+
+def test_fetch_timeline_returns_a_partial_result() -> None:
+    sac = FakeTimelineClient(newest=30, failures={2: 2})
+
+    timeline = timeline_of(sac, 9, page_size=3)
+
+    # the pages after the missing one are kept
+    assert ids(timeline) == [30, 29, 28, 24, 23, 22]
+
+
+def test_fetch_timeline_without_any_page_raises() -> None:
+    sac = FakeTimelineClient(newest=30, failures={1: 2, 2: 2, 3: 2})
+
+    with pytest.raises(SurePetcareConnectionError):
+        timeline_of(sac, 9, page_size=3)
+
+
+def test_first_sync_backfills_in_windows() -> None:
+    sac = FakeTimelineClient(newest=30)
+    follower = follower_of(sac, page_size=2, window=2)
+
+    new_events = asyncio.run(follower.sync())
+
+    assert ids(new_events) == [30, 29, 28, 27, 26, 25]
+    assert sorted(sac.pages) == [1, 2, 3]
+    assert follower.last_id == 30
+
+
+def test_sync_pages_until_the_high_water_mark() -> None:
+    sac = FakeTimelineClient(newest=30)
+    follower = follower_of(sac, page_size=3)
+
+    async def run() -> list[dict[str, Any]]:
+        await follower.sync()
+        sac.pages.clear()
+        sac.newest = 34
+        return await follower.sync()
+
+    assert ids(asyncio.run(run())) == [34, 33, 32, 31]
+    # the second page holds the known event 30, paging stops there
+    assert sac.pages == [1, 2]
+    assert follower.last_id == 34
+    assert ids(follower.events) == list(range(34, 24, -1))
+
+
+def test_nothing_new_stops_at_the_first_page() -> None:
+    sac = FakeTimelineClient(newest=30)
+    follower = follower_of(sac, page_size=3)
+
+    async def run() -> list[dict[str, Any]]:
+        await follower.sync()
+        sac.pages.clear()
+        return await follower.sync()
+
+    assert asyncio.run(run()) == []
+    assert sac.pages == [1]
+    assert follower.last_id == 30
+
+
+def test_ring_buffer_overflow_keeps_the_newest_events() -> None:
+    sac = FakeTimelineClient(newest=30)
+    follower = follower_of(sac, page_size=3)
+
+    async def run() -> list[dict[str, Any]]:
+        await follower.sync()
+        sac.pages.clear()
+        # far behind: more new events than the buffer holds
+        sac.newest = 60
+        return await follower.sync()
+
+    new_events = asyncio.run(run())
+
+    # paging is bounded by the buffer size (4 pages of 3 for 10 events)
+    assert sac.pages == [1, 2, 3, 4]
+    assert ids(new_events) == list(range(60, 48, -1))
+    assert ids(follower.events) == list(range(60, 50, -1))
+    assert follower.last_id == 60
+    assert follower.latest() == {"id": 60, "type": 29}
+    assert follower.latest(types={1}) is None
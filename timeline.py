@@ -0,0 +1,249 @@
+"""
+surepy.timeline
+====================================
+Incremental follower of a household timeline.
+
+|license-info|
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from collections import deque
+from math import ceil
+from typing import TYPE_CHECKING, Any, Collection, Iterator
+
+from .const import (
+    BASE_RESOURCE,
+    HOUSEHOLD_TIMELINE_RESOURCE,
+    TIMELINE_BACKFILL_ENTRIES,
+    TIMELINE_BUFFER_SIZE,
+    TIMELINE_PAGE_SIZE,
+    TIMELINE_PAGE_WINDOW,
+)
+from .exeptions import SurePetcareAuthenticationError, SurePetcareError
+from .scheduler import PRIORITY_TIMELINE
+
+
+if TYPE_CHECKING:
+    from .client import SureAPIClient
+
+
+# get a logger
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def _timeline_resource(household_id: int, page: int, page_size: int) -> str:
+    return HOUSEHOLD_TIMELINE_RESOURCE.format(
+        BASE_RESOURCE=BASE_RESOURCE, household_id=household_id, page=page, page_size=page_size
+    )
+
+
+async def fetch_timeline(
+    sac: SureAPIClient,
+    household_id: int,
+    entries: int,
+    page_size: int = TIMELINE_PAGE_SIZE,
+    window: int = TIMELINE_PAGE_WINDOW,
+    budget: float | None = None,
+) -> list[dict[str, Any]]:
+    """Fetch the newest ``entries`` events of a household timeline, newest first.
+
+    Pages are requested ``window`` at a time and reassembled in order, paging
+    stops at the first page that comes back short. A page that fails is retried
+    once on its own; if it fails again the other pages are still returned
+    (partial result, logged) unless none came back at all. ``budget`` is the
+    time budget of each page request.
+    """
+
+    async def fetch_page(page: int) -> list[dict[str, Any]] | None:
+        response = await sac.call(
+            method="GET",
+            resource=_timeline_resource(household_id, page, page_size),
+            priority=PRIORITY_TIMELINE,
+            budget=budget,
+        )
+        return response.get("data", []) if response else None
+
+    pages_to_fetch = ceil(entries / page_size)
+
+    timeline: list[dict[str, Any]] = []
+    seen: set[int] = set()
+    missing: list[int] = []
+    error: BaseException | None = None
+
+    current_page = 1
+
+    while current_page <= pages_to_fetch:
+
+        pages = range(current_page, min(current_page + window, pages_to_fetch + 1))
+        results = await asyncio.gather(
+            *[fetch_page(page) for page in pages], return_exceptions=True
+        )
+
+        last_page_reached = False
+
+        for page, result in zip(pages, results):
+
+            if isinstance(result, SurePetcareAuthenticationError):
+                raise result
+
+            if result is None or isinstance(result, BaseException):
+                # retry a failed page once instead of dropping the pages after it
+                try:
+                    result = await fetch_page(page)
+                except SurePetcareAuthenticationError:
+                    raise
+                except SurePetcareError as page_error:
+                    error, result = page_error, None
+
+            if result is None:
+                missing.append(page)
+                continue
+
+            # events added while paging shift the pages, skip the repeated ones
+            for entry in result:
+                if (entry_id := entry.get("id")) not in seen:
+                    seen.add(entry_id)
+                    timeline.append(entry)
+
+            if len(result) < page_size:
+                last_page_reached = True
+                break
+
+        if last_page_reached:
+            break
+
+        current_page += window
+
+    if missing:
+        if not timeline and error is not None:
+            raise error
+
+        logger.warning(
+            "🐾 \x1b[38;2;255;26;102m·\x1b[0m timeline of household %s: partial, pages %s missing",
+            household_id,
+            missing,
+        )
+
+    return timeline[:entries]
+
+
+class TimelineFollower:
+    """Follows the timeline of a household using the newest seen event as high-water mark.
+
+    The first sync backfills ``backfill`` entries (``window`` pages at a time),
+    every later sync only pages until it reaches an already known event. Events
+    are kept newest first in a bounded ring buffer which all consumers (drinking,
+    feeding, movement) read from.
+    """
+
+    def __init__(
+        self,
+        sac: SureAPIClient,
+        household_id: int,
+        buffer_size: int = TIMELINE_BUFFER_SIZE,
+        backfill: int = TIMELINE_BACKFILL_ENTRIES,
+        page_size: int = TIMELINE_PAGE_SIZE,
+        window: int = TIMELINE_PAGE_WINDOW,
+        budget: float | None = None,
+    ) -> None:
+        self._sac = sac
+        self.household_id = household_id
+
+        self._backfill = backfill
+        self._page_size = page_size
+        self._window = window
+        # time budget of each page request
+        self._budget = budget
+
+        # ring buffer of the latest events, newest first
+        self.events: deque[dict[str, Any]] = deque(maxlen=buffer_size)
+
+        # high-water mark
+        self.last_id: int | None = None
+        self.last_created_at: str | None = None
+
+    def _resource(self, page: int) -> str:
+        return _timeline_resource(self.household_id, page, self._page_size)
+
+    async def sync(self) -> list[dict[str, Any]]:
+        """Fetch the events added since the last sync, newest first."""
+
+        if self.last_id is None:
+            # without a high-water mark we backfill, concurrently
+            new_events = await fetch_timeline(
+                self._sac,
+                self.household_id,
+                self._backfill,
+                self._page_size,
+                self._window,
+                self._budget,
+            )
+        else:
+            new_events = await self._fetch_new_events()
+
+        if new_events:
+            self.last_id = int(new_events[0]["id"])
+            self.last_created_at = new_events[0].get("created_at", self.last_created_at)
+
+            # keep the buffer newest first
+            self.events.extendleft(reversed(new_events))
+
+        logger.debug(
+            "🐾 \x1b[38;2;0;255;0m·\x1b[0m timeline of household %s: %d new events (last id: %s)",
+            self.household_id,
+            len(new_events),
+            self.last_id,
+        )
+
+        return new_events
+
+    async def _fetch_new_events(self) -> list[dict[str, Any]]:
+        """Page until reaching known events, bounded by the buffer size if we fell far behind."""
+
+        new_events: list[dict[str, Any]] = []
+
+        max_pages = max(1, ceil((self.events.maxlen or 0) / self._page_size))
+
+        for page in range(1, max_pages + 1):
+
+            response = await self._sac.call(
+                method="GET",
+                resource=self._resource(page),
+                priority=PRIORITY_TIMELINE,
+                budget=self._budget,
+            )
+
+            if not response or (
+                page == 1 and getattr(response, "not_modified", False) and self.events
+            ):
+                # nothing new since the last sync
+                break
+
+            entries: list[dict[str, Any]] = response.get("data", [])
+            reached_known_events = False
+
+            for entry in entries:
+                if self.last_id is not None and int(entry["id"]) <= self.last_id:
+                    reached_known_events = True
+                    break
+
+                new_events.append(entry)
+
+            if reached_known_events or len(entries) < self._page_size:
+                break
+
+        return new_events
+
+    def iter_events(self, types: Collection[int] | None = None) -> Iterator[dict[str, Any]]:
+        """Iterate the buffered events newest first, optionally filtered by event type."""
+        for event in self.events:
+            if types is None or event.get("type") in types:
+                yield event
+
+    def latest(self, types: Collection[int] | None = None) -> dict[str, Any] | None:
+        """Newest buffered event of the given types."""
+        return next(self.iter_events(types), None)
@@ -0,0 +1,38 @@
+"""Api token of a Sure Petcare config entry, kept across restarts."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_TOKEN
+from homeassistant.core import HomeAssistant
+
+from .auth import TokenStore
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SureTokenStore(TokenStore):
+    """Keeps the api token in the config entry.
+
+    Refreshed tokens are written back to the entry data (saved by Home Assistant
+    off the event loop), so a restart uses the latest token instead of logging
+    in again.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the token store."""
+        self._hass = hass
+        self._entry = entry
+
+    async def async_load(self) -> str | None:
+        return self._entry.data.get(CONF_TOKEN)
+
+    async def async_save(self, token: str) -> None:
+        if self._entry.data.get(CONF_TOKEN) == token:
+            return
+
+        self._hass.config_entries.async_update_entry(
+            self._entry, data={**self._entry.data, CONF_TOKEN: token}
+        )
+        _LOGGER.debug("🐾 \x1b[38;2;0;255;0m·\x1b[0m refreshed token written to the config entry")